@@ -1,8 +1,6 @@
 from typing import Generic, TypeVar, Optional, Protocol, Callable, Union
 
-from traversal import traversal
-
-from data_structures.linked_list import LinkedList
+from python_course.algorithms.linked_list.traversal import traversal
 
 T = TypeVar("T")
 
@@ -68,9 +66,12 @@ def reverse_traversal(traversable: Traversable[T], callback: Callback[T]) -> Non
     return traversal(reversed_traversable, callback)
 
 
-ll = LinkedList[int]()
+if __name__ == "__main__":
+    from python_course.data_structures.linked_list import LinkedList
+
+    ll = LinkedList[int]()
 
-ll.append(1)
-ll.append(2)
+    ll.append(1)
+    ll.append(2)
 
-reverse_traversal(ll, lambda node: print("node", node, "value", node.value))
+    reverse_traversal(ll, lambda node: print("node", node, "value", node.value))
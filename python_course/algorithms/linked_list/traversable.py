@@ -1,6 +1,6 @@
 from typing import Generic, TypeVar, Protocol
 
-from utils.node import OptionalNode
+from python_course.utils.node import OptionalNode
 
 
 T = TypeVar("T")
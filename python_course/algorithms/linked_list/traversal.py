@@ -4,11 +4,9 @@ from typing import (
 )
 
 
-from utils.node import OptionalNode
+from python_course.utils.node import OptionalNode
 
-from data_structures.linked_list import LinkedList
-
-from .traversable import Traversable
+from python_course.algorithms.linked_list.traversable import Traversable
 
 T = TypeVar("T")
 
@@ -24,12 +22,14 @@ def traversal(traversable: Traversable[T], callback: Callback[T]) -> None:
         current_node = current_node.next
 
 
-ll = LinkedList[int]()
-ll.append(1)
-ll.append(2)
-ll.append(3)
-ll.append(4)
-ll.append(5)
+if __name__ == "__main__":
+    from python_course.data_structures.linked_list import LinkedList
 
+    ll = LinkedList[int]()
+    ll.append(1)
+    ll.append(2)
+    ll.append(3)
+    ll.append(4)
+    ll.append(5)
 
-traversal(ll, lambda node: print("node", node, "value", node.value))
+    traversal(ll, lambda node: print("node", node, "value", node.value))
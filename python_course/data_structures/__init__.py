@@ -0,0 +1,89 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from python_course.data_structures.array import Array
+    from python_course.data_structures.avl_tree import AvlTree
+    from python_course.data_structures.binary_search_tree import BinarySearchTree
+    from python_course.data_structures.binary_search_tree_node import (
+        BinarySearchTreeNode,
+    )
+    from python_course.data_structures.binary_tree_node import BinaryTreeNode
+    from python_course.data_structures.cache_hash_table import CacheHashTable
+    from python_course.data_structures.concurrent_hash_table import (
+        ConcurrentHashTable,
+    )
+    from python_course.data_structures.doubly_linked_list import DoublyLinkedList
+    from python_course.data_structures.fenwick_tree import FenwickTree
+    from python_course.data_structures.gap_buffer import GapBuffer
+    from python_course.data_structures.hash_table import HashTable
+    from python_course.data_structures.hash_table_snapshot import HashTableSnapshot
+    from python_course.data_structures.indexed_linked_list import (
+        IndexedLinkedList,
+    )
+    from python_course.data_structures.linked_list import LinkedList
+    from python_course.data_structures.lru_cache import LRUCache, memoize
+    from python_course.data_structures.max_heap import MaxHeap
+    from python_course.data_structures.min_heap import MinHeap
+    from python_course.data_structures.numeric_array import NumericArray
+    from python_course.data_structures.open_addressing_hash_table import (
+        OpenAddressingHashTable,
+    )
+    from python_course.data_structures.ordered_hash_table import OrderedHashTable
+    from python_course.data_structures.priority_queue import PriorityQueue
+    from python_course.data_structures.queue import Queue
+    from python_course.data_structures.red_black_tree import RedBlackTree
+    from python_course.data_structures.stack import Stack
+    from python_course.data_structures.trie import Trie
+    from python_course.data_structures.unrolled_linked_list import (
+        UnrolledLinkedList,
+    )
+
+
+#   public name -> submodule, resolved on first attribute access
+LAZY_EXPORTS: Dict[str, str] = {
+    "Array": "array",
+    "AvlTree": "avl_tree",
+    "BinarySearchTree": "binary_search_tree",
+    "BinarySearchTreeNode": "binary_search_tree_node",
+    "BinaryTreeNode": "binary_tree_node",
+    "CacheHashTable": "cache_hash_table",
+    "ConcurrentHashTable": "concurrent_hash_table",
+    "DoublyLinkedList": "doubly_linked_list",
+    "FenwickTree": "fenwick_tree",
+    "GapBuffer": "gap_buffer",
+    "HashTable": "hash_table",
+    "HashTableSnapshot": "hash_table_snapshot",
+    "IndexedLinkedList": "indexed_linked_list",
+    "LinkedList": "linked_list",
+    "LRUCache": "lru_cache",
+    "MaxHeap": "max_heap",
+    "MinHeap": "min_heap",
+    "NumericArray": "numeric_array",
+    "OpenAddressingHashTable": "open_addressing_hash_table",
+    "OrderedHashTable": "ordered_hash_table",
+    "PriorityQueue": "priority_queue",
+    "Queue": "queue",
+    "RedBlackTree": "red_black_tree",
+    "Stack": "stack",
+    "Trie": "trie",
+    "UnrolledLinkedList": "unrolled_linked_list",
+    "memoize": "lru_cache",
+}
+
+__all__ = list(LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    # cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,50 @@
-from typing import Generic, TypeVar, Optional, Dict, List
+from typing import Generic, TypeVar, Optional, List, Union, Iterable, Tuple, Literal
+
+from array import array as PackedArray
+from bisect import bisect_right, insort
+
+from python_course.data_structures.gap_buffer import GapBuffer
 
 
 T = TypeVar("T")
 
+Storage = Union[List[T], PackedArray, GapBuffer[T]]
+StorageMode = Literal["contiguous", "gap"]
+
+
+def nth_free_slot(taken: List[int], position: int) -> int:
+    # -> the position-th slot missing from the sorted `taken` list; taken[i] - i
+    # counts the free slots before taken[i] and never decreases, so one
+    # bisect over the k taken slots finds how many precede the answer
+    return position + bisect_right(
+        range(len(taken)), position, key=lambda i: taken[i] - i
+    )
+
 
 class Array(Generic[T]):
-    def __init__(self, items: Optional[List[T]] = None):
-        self.items: Dict[int, T] = (
-            {index: value for index, value in enumerate(items)} if items else {}
-        )
+    def __init__(
+        self,
+        items: Optional[List[T]] = None,
+        typecode: Optional[str] = None,
+        storage: StorageMode = "contiguous",
+    ):
+        # contiguous buffer - list for boxed values or array.array for typecoded numerics
+        # gap buffer - cheap inserts/deletes clustered around the last edited index
+        self.typecode = typecode
+        self.storage = storage
+        self.items: Storage = self.__make_storage(items or [])
         self.length = len(self.items)
 
     def __str__(self):
-        print(list(self.items.values()))
         return str(self.__dict__.values())
 
+    def __make_storage(self, items: List[T]) -> Storage:
+        if self.storage == "gap":
+            return GapBuffer(items, self.typecode)
+        elif self.typecode is not None:
+            return PackedArray(self.typecode, items)
+        return list(items)
+
     def __increment(self, count: int = 1) -> None:
         self.length = self.length + count
 
@@ -28,7 +58,8 @@ class Array(Generic[T]):
         return int(abs(index))
 
     def push(self, item: T):
-        self.items[self.length] = item
+        # amortized O(1) - the buffer over-allocates on growth
+        self.items.append(item)
         self.__increment()
         return self
 
@@ -38,48 +69,23 @@ class Array(Generic[T]):
         if new_index >= self.length:
             self.push(item)
         else:
-            updated_items = {}
-            updated_items[new_index] = item
-
-            for index, value in self.items.items():
-                if index < new_index:
-                    updated_items[index] = value
-                elif index >= new_index:
-                    updated_items[index + 1] = value
-
-            self.items = updated_items
+            # shifts only the items[new_index:] tail
+            self.items.insert(new_index, item)
             self.__increment()
         return self
 
-    #   TODO
-    #   Refactor
-    #   Filter insert
     def __remove_item(self, index: int) -> None:
-        filtered_entries = list(
-            filter(lambda pair: pair[0] != index, list(self.items.items()))
-        )
-
-        entries = list(
-            map(
-                lambda pair: (
-                    (pair[0] - 1, pair[1])
-                    if pair[0] != index and pair[0] != 0
-                    else pair
-                ),
-                filtered_entries,
-            )
-        )
-        copy_items = dict(entries)
-        self.items = copy_items
+        if index > self.length - 1:
+            return None
 
+        del self.items[index]
         self.__decrement(1)
 
     def pop(self):
         if self.length == 0:
             return None
-        index = self.length - 1
-        item = self.get(index)
-        self.__remove_item(index)
+        item = self.items.pop()
+        self.__decrement(1)
         return item
 
     def delete(self, index: int):
@@ -87,12 +93,70 @@ class Array(Generic[T]):
         self.__remove_item(norm_index)
         return self
 
+    def insert_many(self, edits: Iterable[Tuple[int, T]]):
+        # same result as calling insert(index, item) for each edit in order
+        pending = list(edits)
+        edits_count = len(pending)
+        if edits_count == 0:
+            return self
+
+        # walking the edits backwards, an item inserted at position p ends up
+        # on the p-th slot not yet claimed by a later insert
+        claimed: List[int] = []
+        slots = [0] * edits_count
+
+        for order in range(edits_count - 1, -1, -1):
+            index, _ = pending[order]
+            position = min(self.__normalize_index(index), self.length + order)
+            slot = nth_free_slot(claimed, position)
+            insort(claimed, slot)
+            slots[order] = slot
+
+        merged = self.__make_storage([])
+        source = 0
+        for order in sorted(range(edits_count), key=slots.__getitem__):
+            count = slots[order] - len(merged)
+            merged.extend(self.items[source : source + count])
+            merged.append(pending[order][1])
+            source = source + count
+        merged.extend(self.items[source:])
+
+        self.items = merged
+        self.__increment(edits_count)
+        return self
+
+    def delete_many(self, indices: Iterable[int]):
+        # same result as calling delete(index) for each index in order - an index
+        # names the position-th original slot that is not deleted yet
+        deleted: List[int] = []
+
+        for index in indices:
+            position = self.__normalize_index(index)
+            if position > self.length - len(deleted) - 1:
+                continue
+
+            insort(deleted, nth_free_slot(deleted, position))
+
+        if len(deleted) == 0:
+            return self
+
+        kept = self.__make_storage([])
+        source = 0
+        for slot in deleted:
+            kept.extend(self.items[source:slot])
+            source = slot + 1
+        kept.extend(self.items[source:])
+
+        self.items = kept
+        self.__decrement(len(deleted))
+        return self
+
     def get(self, index: int):
         norm_index = self.__normalize_index(index)
         if norm_index > self.length - 1:
             return None
         return self.items[norm_index]
 
+    def to_list(self) -> List[T]:
+        return list(self.items)
 
-array = Array([1, 2, 3, 4]).pop()
-print("array", array)
@@ -0,0 +1,367 @@
+import random
+import time
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Dict,
+    Iterator,
+    Tuple,
+    Callable,
+    Literal,
+)
+
+from python_course.data_structures.doubly_linked_list import (
+    DoublyLinkedList,
+    DoublyLinkedNode,
+)
+from python_course.data_structures.hash_table import (
+    HashTable,
+    HashFunction,
+    DEFAULT_SIZE,
+)
+from python_course.data_structures.min_heap import MinHeap
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+EvictionPolicyName = Literal["lru", "lfu", "random"]
+Clock = Callable[[], float]
+
+DEFAULT_SWEEP_LIMIT = 16
+#   the expiry heap is rebuilt once stale timers outnumber live entries this much
+HEAP_COMPACT_FACTOR = 2
+
+
+class CacheEntry(Generic[K, V]):
+    __slots__ = ("key", "value", "expires_at", "frequency", "node", "slot")
+
+    def __init__(self, key: K, value: V, expires_at: Optional[float]):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        self.frequency = 1
+        #   bookkeeping owned by the eviction policy
+        self.node: Optional[DoublyLinkedNode["CacheEntry[K, V]"]] = None
+        self.slot = -1
+
+    def __repr__(self):
+        return f"CacheEntry({self.key!r}, {self.value!r}, {self.expires_at!r})"
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+class LruPolicy(Generic[K, V]):
+    #   head is the least recently used entry, tail the most recent one
+    def __init__(self):
+        self.recency: DoublyLinkedList[CacheEntry[K, V]] = DoublyLinkedList()
+
+    def add(self, entry: CacheEntry[K, V]) -> None:
+        entry.node = self.recency.append(entry)
+
+    def touch(self, entry: CacheEntry[K, V]) -> None:
+        self.recency.move_to_tail(entry.node)
+
+    def remove(self, entry: CacheEntry[K, V]) -> None:
+        self.recency.delete_node(entry.node)
+        entry.node = None
+
+    def victim(self) -> CacheEntry[K, V]:
+        return self.recency.head.value
+
+
+class LfuPolicy(Generic[K, V]):
+    #   one recency list per frequency, ties are broken by least recent use
+    def __init__(self):
+        self.frequencies: Dict[int, DoublyLinkedList[CacheEntry[K, V]]] = {}
+        self.min_frequency = 0
+
+    def __link(self, entry: CacheEntry[K, V]) -> None:
+        frequency_list = self.frequencies.get(entry.frequency)
+        if frequency_list is None:
+            frequency_list = self.frequencies[entry.frequency] = DoublyLinkedList()
+        entry.node = frequency_list.append(entry)
+
+    def __unlink(self, entry: CacheEntry[K, V]) -> None:
+        frequency_list = self.frequencies[entry.frequency]
+        frequency_list.delete_node(entry.node)
+        entry.node = None
+
+        if frequency_list.is_empty():
+            del self.frequencies[entry.frequency]
+
+    def add(self, entry: CacheEntry[K, V]) -> None:
+        entry.frequency = 1
+        self.min_frequency = 1
+        self.__link(entry)
+
+    def touch(self, entry: CacheEntry[K, V]) -> None:
+        self.__unlink(entry)
+        if self.min_frequency == entry.frequency and (
+            entry.frequency not in self.frequencies
+        ):
+            self.min_frequency = entry.frequency + 1
+
+        entry.frequency = entry.frequency + 1
+        self.__link(entry)
+
+    def remove(self, entry: CacheEntry[K, V]) -> None:
+        self.__unlink(entry)
+
+    def victim(self) -> CacheEntry[K, V]:
+        #   explicit deletes can empty the minimum list without a touch
+        if self.min_frequency not in self.frequencies:
+            self.min_frequency = min(self.frequencies)
+        return self.frequencies[self.min_frequency].head.value
+
+
+class RandomPolicy(Generic[K, V]):
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.entries: List[CacheEntry[K, V]] = []
+        self.rng = rng if rng is not None else random.Random()
+
+    def add(self, entry: CacheEntry[K, V]) -> None:
+        entry.slot = len(self.entries)
+        self.entries.append(entry)
+
+    def touch(self, entry: CacheEntry[K, V]) -> None:
+        return None
+
+    def remove(self, entry: CacheEntry[K, V]) -> None:
+        #   swap with the last entry so removal stays O(1)
+        last_entry = self.entries.pop()
+        if last_entry is not entry:
+            last_entry.slot = entry.slot
+            self.entries[entry.slot] = last_entry
+        entry.slot = -1
+
+    def victim(self) -> CacheEntry[K, V]:
+        return self.entries[self.rng.randrange(len(self.entries))]
+
+
+EVICTION_POLICIES = {
+    "lru": LruPolicy,
+    "lfu": LfuPolicy,
+    "random": RandomPolicy,
+}
+
+
+class CacheHashTable(Generic[K, V]):
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        hash_function: HashFunction[K] = hash,
+        max_entries: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        eviction_policy: EvictionPolicyName = "lru",
+        clock: Clock = time.monotonic,
+        sweep_limit: int = DEFAULT_SWEEP_LIMIT,
+    ):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"unknown eviction policy {eviction_policy!r}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.table: HashTable[K, CacheEntry[K, V]] = HashTable(
+            size, hash_function=hash_function
+        )
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.eviction_policy = eviction_policy
+        self.policy = EVICTION_POLICIES[eviction_policy]()
+        self.clock = clock
+        self.sweep_limit = sweep_limit
+        #   (expires_at, sequence, entry) - timers of overwritten keys go stale
+        self.expiry: MinHeap[Tuple[float, int, CacheEntry[K, V]]] = MinHeap()
+        self.expiry_sequence = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __len__(self) -> int:
+        #   expired entries count until they are touched or swept
+        return len(self.table)
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __contains__(self, key: K) -> bool:
+        return self.has(key)
+
+    def __getitem__(self, key: K) -> V:
+        entry = self.__live_entry(key)
+        if entry is None:
+            self.misses = self.misses + 1
+            raise KeyError(key)
+
+        self.__hit(entry)
+        return entry.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        if self.__live_entry(key) is None:
+            raise KeyError(key)
+        self.delete(key)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __remove(self, entry: CacheEntry[K, V]) -> None:
+        self.policy.remove(entry)
+        self.table.delete(entry.key)
+
+    def __live_entry(self, key: K) -> Optional[CacheEntry[K, V]]:
+        # lazy expiry - a stale entry is dropped by the lookup that finds it
+        entry = self.table.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired(self.clock()):
+            self.__remove(entry)
+            self.expirations = self.expirations + 1
+            return None
+
+        return entry
+
+    def __hit(self, entry: CacheEntry[K, V]) -> None:
+        self.hits = self.hits + 1
+        self.policy.touch(entry)
+
+    def __schedule(self, entry: CacheEntry[K, V]) -> None:
+        if entry.expires_at is None:
+            return None
+
+        self.expiry_sequence = self.expiry_sequence + 1
+        self.expiry.add((entry.expires_at, self.expiry_sequence, entry))
+
+        live_timers = HEAP_COMPACT_FACTOR * len(self.table) + self.sweep_limit
+        if self.expiry.length > live_timers:
+            self.__compact_expiry()
+
+    def __compact_expiry(self) -> None:
+        timers = self.expiry.container
+        self.expiry = MinHeap()
+        for timer in timers:
+            if self.__is_current_timer(timer):
+                self.expiry.add(timer)
+
+    def __is_current_timer(
+        self, timer: Tuple[float, int, CacheEntry[K, V]]
+    ) -> bool:
+        expires_at, _, entry = timer
+        return entry.expires_at == expires_at and self.table.get(entry.key) is entry
+
+    def __evict(self) -> None:
+        entry = self.policy.victim()
+        self.__remove(entry)
+        self.evictions = self.evictions + 1
+
+    def sweep(self, limit: Optional[int] = None) -> int:
+        # -> number of expired entries removed, at most limit timers are inspected
+        now = self.clock()
+        limit = limit if limit is not None else self.sweep_limit
+        removed = 0
+
+        while limit > 0:
+            timer = self.expiry.peek()
+            if timer is None or timer[0] > now:
+                break
+
+            self.expiry.poll()
+            limit = limit - 1
+
+            if self.__is_current_timer(timer):
+                self.__remove(timer[2])
+                self.expirations = self.expirations + 1
+                removed = removed + 1
+
+        return removed
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+
+        # every write pays for a bounded slice of the expiry work
+        self.sweep()
+
+        entry = self.table.get(key)
+        if entry is not None:
+            entry.value = value
+            if entry.expires_at != expires_at:
+                entry.expires_at = expires_at
+                self.__schedule(entry)
+            self.policy.touch(entry)
+            return None
+
+        if self.max_entries is not None:
+            while len(self.table) >= self.max_entries:
+                self.__evict()
+
+        entry = CacheEntry(key, value, expires_at)
+        self.table.set(key, entry)
+        self.policy.add(entry)
+        self.__schedule(entry)
+
+    def delete(self, key: K) -> None:
+        entry = self.table.get(key)
+        if entry is not None:
+            self.__remove(entry)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self.__live_entry(key)
+        if entry is None:
+            self.misses = self.misses + 1
+            return None
+
+        self.__hit(entry)
+        return entry.value
+
+    def has(self, key: K) -> bool:
+        #   no hit/miss accounting and no recency update
+        return self.__live_entry(key) is not None
+
+    def ttl(self, key: K) -> Optional[float]:
+        # -> seconds left, None for a missing key or one that never expires
+        entry = self.__live_entry(key)
+        if entry is None or entry.expires_at is None:
+            return None
+        return entry.expires_at - self.clock()
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        now = self.clock()
+        for key, entry in self.table.items():
+            if not entry.is_expired(now):
+                yield key, entry.value
+
+    def keys(self) -> Iterator[K]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[V]:
+        for _, value in self.items():
+            yield value
+
+    def get_keys(self) -> List[K]:
+        return list(self.keys())
+
+    def get_values(self) -> List[V]:
+        return list(self.values())
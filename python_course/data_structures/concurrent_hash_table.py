@@ -0,0 +1,166 @@
+from threading import Lock
+from typing import Generic, TypeVar, Optional, List, Iterator, Tuple
+
+from python_course.data_structures.hash_table import (
+    HashTable,
+    HashFunction,
+    DEFAULT_SIZE,
+    DEFAULT_MAX_LOAD_FACTOR,
+    DEFAULT_MIN_LOAD_FACTOR,
+)
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_STRIPES = 16
+
+
+class Stripe(Generic[K, V]):
+    def __init__(self, table: HashTable[K, V]):
+        self.table = table
+        self.lock = Lock()
+
+
+class ConcurrentHashTable(Generic[K, V]):
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        hash_function: HashFunction[K] = hash,
+        max_load_factor: Optional[float] = DEFAULT_MAX_LOAD_FACTOR,
+        min_load_factor: Optional[float] = DEFAULT_MIN_LOAD_FACTOR,
+        stripes: int = DEFAULT_STRIPES,
+    ):
+        self.hash_function = hash_function
+        self.stripes_count = stripes
+        # every stripe is an independent table - resizing one never blocks the others
+        self.stripes: List[Stripe[K, V]] = [
+            Stripe(
+                HashTable(
+                    max(size // stripes, 1),
+                    # the stripe is picked by hash % stripes, buckets by the rest
+                    hash_function=lambda key: hash_function(key) // stripes,
+                    max_load_factor=max_load_factor,
+                    min_load_factor=min_load_factor,
+                )
+            )
+            for _ in range(stripes)
+        ]
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __len__(self) -> int:
+        return sum(len(stripe.table) for stripe in self.stripes)
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __contains__(self, key: K) -> bool:
+        return self.has(key)
+
+    def __getitem__(self, key: K) -> V:
+        stripe = self.__stripe_for(key)
+        value = self.__read_get(stripe, key)
+        if value is not None:
+            return value
+
+        with stripe.lock:
+            return stripe.table[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        stripe = self.__stripe_for(key)
+        with stripe.lock:
+            del stripe.table[key]
+
+    def __stripe_for(self, key: K) -> Stripe[K, V]:
+        return self.stripes[self.hash_function(key) % self.stripes_count]
+
+    # lock-free reads are safe under the GIL - a concurrent resize or unlink
+    # can only make the walk miss, and a miss is retried under the stripe lock.
+    # peek_entry writes nothing, so the stripe stats only count locked lookups
+    def __read_get(self, stripe: Stripe[K, V], key: K) -> Optional[V]:
+        entry = stripe.table.peek_entry(key)
+        return entry.value if entry is not None else None
+
+    def __read_has(self, stripe: Stripe[K, V], key: K) -> bool:
+        return stripe.table.peek_entry(key) is not None
+
+    def set(self, key: K, value: V) -> None:
+        stripe = self.__stripe_for(key)
+        with stripe.lock:
+            stripe.table.set(key, value)
+
+    def delete(self, key: K) -> None:
+        stripe = self.__stripe_for(key)
+        with stripe.lock:
+            stripe.table.delete(key)
+
+    def get(self, key: K) -> Optional[V]:
+        stripe = self.__stripe_for(key)
+        value = self.__read_get(stripe, key)
+        if value is not None:
+            return value
+
+        with stripe.lock:
+            return stripe.table.get(key)
+
+    def has(self, key: K) -> bool:
+        stripe = self.__stripe_for(key)
+        if self.__read_has(stripe, key):
+            return True
+
+        with stripe.lock:
+            return stripe.table.has(key)
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        # each stripe is copied under its lock, never yielded while locked
+        for stripe in self.stripes:
+            with stripe.lock:
+                stripe_items = list(stripe.table.items())
+            yield from stripe_items
+
+    def keys(self) -> Iterator[K]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[V]:
+        for _, value in self.items():
+            yield value
+
+    def get_keys(self) -> List[K]:
+        return list(self.keys())
+
+    def get_values(self) -> List[V]:
+        return list(self.values())
+
+
+class LockedHashTable(Generic[K, V]):
+    # single global lock around a plain HashTable - baseline for ConcurrentHashTable
+
+    def __init__(self, *args, **kwargs):
+        self.table: HashTable[K, V] = HashTable(*args, **kwargs)
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def set(self, key: K, value: V) -> None:
+        with self.lock:
+            self.table.set(key, value)
+
+    def delete(self, key: K) -> None:
+        with self.lock:
+            self.table.delete(key)
+
+    def get(self, key: K) -> Optional[V]:
+        with self.lock:
+            return self.table.get(key)
+
+    def has(self, key: K) -> bool:
+        with self.lock:
+            return self.table.has(key)
@@ -5,8 +5,12 @@ from typing import (
     Protocol,
     Callable,
     Literal,
+    Iterator,
+    Union,
 )
 
+from python_course.data_structures.linked_list import LinkedListView
+
 
 T = TypeVar("T")
 Predicate = Callable[[T], bool]
@@ -66,14 +70,59 @@ class DoublyLinkedList(Generic[T]):
 
         return output
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next
+
+    def __reversed__(self) -> Iterator[T]:
+        current_node = self.tail
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.previous
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, LinkedListView[T]]:
+        # slices are views, not copies - an int index walks from the nearer end
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+
+        index = index + self.length if index < 0 else index
+        if index < 0 or index >= self.length:
+            raise IndexError("doubly linked list index out of range")
+
+        if index < self.length // 2:
+            current_node = self.head
+            for _ in range(index):
+                current_node = current_node.next
+        else:
+            current_node = self.tail
+            for _ in range(self.length - 1 - index):
+                current_node = current_node.previous
+
+        return current_node.value
+
+    def view(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> LinkedListView[T]:
+        return LinkedListView(self, slice(start, stop, step))
+
     def is_empty(self) -> bool:
         return self.length == 0
 
-    #   TODO
-    #   optimalize
-    def append(self, value: T) -> None:
-        new_node = DoublyLinkedNode(value)
+    def append(self, value: T) -> DoublyLinkedNodeInterface:
+        return self.append_node(DoublyLinkedNode(value))
 
+    def append_node(
+        self, new_node: DoublyLinkedNodeInterface
+    ) -> DoublyLinkedNodeInterface:
+        #   links a detached node - callers holding the node get O(1) moves
         if self.is_empty():
             self.head = new_node
             self.tail = self.head
@@ -85,6 +134,8 @@ class DoublyLinkedList(Generic[T]):
 
         self.length = self.length + 1
 
+        return new_node
+
     def prepend(self, value: T) -> None:
         if self.is_empty():
             return self.append(value)
@@ -164,6 +215,33 @@ class DoublyLinkedList(Generic[T]):
 
         return deleted_node
 
+    def delete_node(
+        self, node: DoublyLinkedNodeInterface
+    ) -> DoublyLinkedNodeInterface:
+        #   O(1) unlink of a node known to belong to this list
+        if node is self.head:
+            return self.delete_head()
+        elif node is self.tail:
+            return self.delete_tail()
+
+        previous_node = node.previous
+        next_node = node.next
+        previous_node.next = next_node
+        next_node.previous = previous_node
+
+        node.next = None
+        node.previous = None
+
+        self.length = self.length - 1
+
+        return node
+
+    def move_to_tail(self, node: DoublyLinkedNodeInterface) -> None:
+        if node is self.tail:
+            return None
+
+        self.append_node(self.delete_node(node))
+
     def delete(self, value: T) -> OptionalDoublyLinkedNode:
         deleted_node = None
         if self.is_empty():
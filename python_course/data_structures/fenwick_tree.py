@@ -0,0 +1,54 @@
+from typing import List, Optional
+
+
+class FenwickTree:
+    def __init__(self, values: Optional[List[int]] = None):
+        self.length = len(values) if values else 0
+        # 1-based - tree[i] holds the sum of values in (i - lowbit(i), i]
+        self.tree: List[int] = [0] + list(values or [])
+
+        for index in range(1, self.length + 1):
+            parent = index + self.__lowbit(index)
+            if parent <= self.length:
+                self.tree[parent] = self.tree[parent] + self.tree[index]
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __lowbit(self, index: int) -> int:
+        return index & -index
+
+    def add(self, index: int, delta: int) -> None:
+        position = index + 1
+        while position <= self.length:
+            self.tree[position] = self.tree[position] + delta
+            position = position + self.__lowbit(position)
+
+    def prefix_sum(self, index: int) -> int:
+        # sum of values[0..index] inclusive
+        total = 0
+        position = min(index + 1, self.length)
+        while position > 0:
+            total = total + self.tree[position]
+            position = position - self.__lowbit(position)
+        return total
+
+    def range_sum(self, start: int, end: int) -> int:
+        if start > end:
+            return 0
+        return self.prefix_sum(end) - (self.prefix_sum(start - 1) if start > 0 else 0)
+
+    def find_kth(self, k: int) -> int:
+        # smallest index whose prefix sum exceeds k, values must be non-negative
+        position = 0
+        remaining = k
+        step = 1 << self.length.bit_length()
+
+        while step > 0:
+            next_position = position + step
+            if next_position <= self.length and self.tree[next_position] <= remaining:
+                position = next_position
+                remaining = remaining - self.tree[next_position]
+            step = step >> 1
+
+        return position
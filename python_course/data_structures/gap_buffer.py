@@ -0,0 +1,143 @@
+from typing import Generic, TypeVar, Optional, List, Iterable, Iterator, Union
+
+from array import array as PackedArray
+
+
+T = TypeVar("T")
+
+MIN_GAP_SIZE = 8
+
+
+class GapBuffer(Generic[T]):
+    def __init__(self, items: Optional[Iterable[T]] = None, typecode: Optional[str] = None):
+        self.typecode = typecode
+        values = list(items) if items is not None else []
+
+        # buffer = items before cursor | gap | items after cursor
+        self.buffer = self.__make_buffer(values) + self.__make_gap(MIN_GAP_SIZE)
+        self.gap_start = len(values)
+        self.gap_end = len(self.buffer)
+
+    def __str__(self):
+        return str(list(self))
+
+    def __len__(self) -> int:
+        return len(self.buffer) - self.gap_size
+
+    def __iter__(self) -> Iterator[T]:
+        yield from self.buffer[: self.gap_start]
+        yield from self.buffer[self.gap_end :]
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.__get_slice(index)
+        return self.buffer[self.__to_buffer_index(index)]
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    @property
+    def gap_size(self) -> int:
+        return self.gap_end - self.gap_start
+
+    def __make_buffer(self, values: List[T]):
+        if self.typecode is not None:
+            return PackedArray(self.typecode, values)
+        return values
+
+    def __make_gap(self, size: int):
+        if self.typecode is not None:
+            return PackedArray(self.typecode, [0]) * size
+        return [None] * size
+
+    def __to_buffer_index(self, index: int) -> int:
+        length = len(self)
+        position = index + length if index < 0 else index
+        if not 0 <= position < length:
+            raise IndexError("gap buffer index out of range")
+        return position if position < self.gap_start else position + self.gap_size
+
+    def __get_slice(self, index: slice):
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            return self.__make_buffer(list(self))[index]
+
+        stop = max(start, stop)
+        if stop <= self.gap_start:
+            return self.buffer[start:stop]
+        elif start >= self.gap_start:
+            return self.buffer[start + self.gap_size : stop + self.gap_size]
+        return (
+            self.buffer[start : self.gap_start]
+            + self.buffer[self.gap_end : stop + self.gap_size]
+        )
+
+    def move_gap(self, position: int) -> None:
+        # O(distance) - edits around the same cursor do not move anything
+        if position < self.gap_start:
+            count = self.gap_start - position
+            self.buffer[self.gap_end - count : self.gap_end] = self.buffer[
+                position : self.gap_start
+            ]
+            self.gap_start = position
+            self.gap_end = self.gap_end - count
+            self.__clear(self.gap_start, min(count, self.gap_size))
+        elif position > self.gap_start:
+            count = position - self.gap_start
+            self.buffer[self.gap_start : position] = self.buffer[
+                self.gap_end : self.gap_end + count
+            ]
+            self.gap_start = position
+            self.gap_end = self.gap_end + count
+            cleared = min(count, self.gap_size)
+            self.__clear(self.gap_end - cleared, cleared)
+
+    def __clear(self, start: int, count: int) -> None:
+        # release references to moved items that are now inside the gap
+        if self.typecode is None:
+            self.buffer[start : start + count] = [None] * count
+
+    def __grow(self) -> None:
+        size = max(len(self), MIN_GAP_SIZE)
+        self.buffer[self.gap_end : self.gap_end] = self.__make_gap(size)
+        self.gap_end = self.gap_end + size
+
+    def insert(self, index: int, item: T) -> None:
+        length = len(self)
+        position = max(0, min(index + length if index < 0 else index, length))
+
+        self.move_gap(position)
+        if self.gap_size == 0:
+            self.__grow()
+
+        self.buffer[self.gap_start] = item
+        self.gap_start = self.gap_start + 1
+
+    def append(self, item: T) -> None:
+        self.insert(len(self), item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        self.move_gap(len(self))
+        del self.buffer[self.gap_start :]
+        self.buffer.extend(items)
+
+        self.gap_start = len(self.buffer)
+        self.buffer.extend(self.__make_gap(MIN_GAP_SIZE))
+        self.gap_end = len(self.buffer)
+
+    def pop(self, index: int = -1) -> T:
+        if len(self) == 0:
+            raise IndexError("pop from empty gap buffer")
+
+        length = len(self)
+        position = index + length if index < 0 else index
+        if not 0 <= position < length:
+            raise IndexError("gap buffer index out of range")
+
+        # the removed item is the first one after the gap
+        self.move_gap(position)
+        item = self.buffer[self.gap_end]
+        if self.typecode is None:
+            self.buffer[self.gap_end] = None
+        self.gap_end = self.gap_end + 1
+        return item
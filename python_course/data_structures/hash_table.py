@@ -1,6 +1,21 @@
-from typing import Generic, TypeVar, Tuple, Optional, List, Dict
-
-from itertools import chain
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Dict,
+    Callable,
+    Iterator,
+    Iterable,
+    Tuple,
+    Union,
+    Mapping,
+    MutableMapping,
+)
+
+import math
 
 from python_course.data_structures.linked_list import LinkedList
 
@@ -8,57 +23,428 @@ from python_course.data_structures.linked_list import LinkedList
 K = TypeVar("K")
 V = TypeVar("V")
 
-
-class HashTable(Generic[K, V]):
-
-    def __init__(self, size: int = 32):
+HashFunction = Callable[[K], int]
+#   (operation name, seconds) - called for every sampled operation
+LatencyHook = Callable[[str, float], None]
+
+DEFAULT_SIZE = 32
+DEFAULT_MAX_LOAD_FACTOR = 0.75
+DEFAULT_MIN_LOAD_FACTOR = 0.125
+GROWTH_FACTOR = 2
+DEFAULT_REHASH_STEPS = 4
+DEFAULT_SAMPLE_EVERY = 100
+
+
+def ord_sum_hash(key: str) -> int:
+    # anagrams always collide - kept for deterministic examples
+    hashes = 0
+    for i in range(len(key)):
+        hashes = hashes + ord(key[i])
+
+    return hashes
+
+
+class Entry(Generic[K, V]):
+    __slots__ = ("key", "value", "hash")
+
+    def __init__(self, key: K, value: V, hash: int):
+        self.key = key
+        self.value = value
+        self.hash = hash
+
+    def __iter__(self) -> Iterator:
+        # unpacks as a (key, value) pair
+        yield self.key
+        yield self.value
+
+    def __repr__(self):
+        return f"Entry({self.key!r}, {self.value!r})"
+
+
+@dataclass
+class HashTableStats:
+    size: int
+    count: int
+    load_factor: float
+    # chain length -> number of buckets with that length
+    chain_length_histogram: Dict[int, int] = field(default_factory=dict)
+    max_probe_length: int = 0
+    average_probe_length: float = 0.0
+    # entries whose full hash equals another entry's - no table size helps
+    hash_collisions: int = 0
+    rehash_count: int = 0
+    sets: int = 0
+    deletes: int = 0
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class HashTable(MutableMapping[K, V]):
+    # a MutableMapping - update, pop, setdefault, == and friends come from the
+    # collections.abc mixins on top of the methods below
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        hash_function: HashFunction[K] = hash,
+        max_load_factor: Optional[float] = DEFAULT_MAX_LOAD_FACTOR,
+        min_load_factor: Optional[float] = DEFAULT_MIN_LOAD_FACTOR,
+        incremental_rehash: bool = False,
+        rehash_steps: int = DEFAULT_REHASH_STEPS,
+    ):
         self.size = size
-        self.buckets = [LinkedList[Tuple[K, V]]() for _ in range(0, size)]
-        self.__keys = {}
+        self.initial_size = size
+        self.hash_function = hash_function
+        # None disables growing/shrinking - the bucket count stays fixed
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.count = 0
+        self.buckets = self.__make_buckets(size)
+        # incremental mode - old buckets below rehash_index are already migrated
+        self.incremental_rehash = incremental_rehash
+        self.rehash_steps = rehash_steps
+        self.old_buckets: Optional[List[LinkedList[Entry[K, V]]]] = None
+        self.old_size = 0
+        self.rehash_index = 0
+        self.latency_hook: Optional[LatencyHook] = None
+        self.sample_every = DEFAULT_SAMPLE_EVERY
+        self.reset_stats()
 
     def __str__(self):
-        for i in range(self.size):
-            print("-----")
-            print(f"node - {i}", self.buckets[i])
-            print("-----")
-
         return str(self.__dict__)
 
-    def hash(self, key: str) -> int:
-        hashes = 0
-        for i in range(len(key)):
-            hashes = hashes + ord(key[i])
-
-        return hashes % self.size
-
-    def set(self, key: K, value: V) -> None:
-        self.__keys[key] = key
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __contains__(self, key: K) -> bool:
+        return self.has(key)
+
+    def __getitem__(self, key: K) -> V:
+        node = self.__lookup(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.delete(key)
+
+    def __make_buckets(self, size: int) -> List[LinkedList[Entry[K, V]]]:
+        # plain LinkedList() - subscripting the generic costs a typing call per bucket
+        return [LinkedList() for _ in range(0, size)]
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    @property
+    def is_rehashing(self) -> bool:
+        return self.old_buckets is not None
+
+    @property
+    def rehash_progress(self) -> float:
+        if self.old_buckets is None:
+            return 1.0
+        return self.rehash_index / self.old_size
+
+    def hash(self, key: K) -> int:
+        return self.hash_function(key) % self.size
+
+    def __grown_size(self, size: int) -> int:
+        # grown and presized tables get an odd bucket count - hash % size then
+        # depends on every hash bit, so keys strided by a power of two such as
+        # hash(i * 1024) == i * 1024 still spread over all buckets
+        return size * GROWTH_FACTOR + 1
+
+    def reset_stats(self) -> None:
+        self.rehash_count = 0
+        self.set_count = 0
+        self.delete_count = 0
+        self.lookup_count = 0
+        self.hit_count = 0
+
+    def sample_latency(
+        self, hook: Optional[LatencyHook], every: int = DEFAULT_SAMPLE_EVERY
+    ) -> None:
+        # times every `every`-th set/delete/lookup and reports it to hook,
+        # None switches sampling off again
+        if every < 1:
+            raise ValueError("every must be at least 1")
+
+        self.latency_hook = hook
+        self.sample_every = every
+
+    def __should_sample(self, operation_count: int) -> bool:
+        return (
+            self.latency_hook is not None
+            and operation_count % self.sample_every == 0
+        )
+
+    def stats(self) -> HashTableStats:
+        # walks every bucket - meant for diagnostics, not hot paths
+        histogram: Dict[int, int] = {}
+        max_probe_length = 0
+        probes = 0
+        hashes = set()
+
+        # mid-rehash only live buckets count - unfilled new slots and
+        # already migrated old buckets are not chains
+        for bucket in self.__iter_buckets():
+            length = bucket.length
+            histogram[length] = histogram.get(length, 0) + 1
+            max_probe_length = max(max_probe_length, length)
+            # finding the i-th entry of a chain takes i comparisons
+            probes = probes + length * (length + 1) // 2
+
+            node = bucket.head
+            while node is not None:
+                hashes.add(node.value.hash)
+                node = node.next
 
-        index = self.hash(key)
+        return HashTableStats(
+            size=self.size,
+            count=self.count,
+            load_factor=self.load_factor,
+            chain_length_histogram=dict(sorted(histogram.items())),
+            max_probe_length=max_probe_length,
+            average_probe_length=probes / self.count if self.count > 0 else 0.0,
+            hash_collisions=self.count - len(hashes),
+            rehash_count=self.rehash_count,
+            sets=self.set_count,
+            deletes=self.delete_count,
+            lookups=self.lookup_count,
+            hits=self.hit_count,
+            misses=self.lookup_count - self.hit_count,
+        )
+
+    def __bucket_for(self, key_hash: int) -> LinkedList[Entry[K, V]]:
+        if self.old_buckets is None:
+            return self.buckets[key_hash % self.size]
+
+        old_index = key_hash % self.old_size
+        if old_index >= self.rehash_index:
+            return self.old_buckets[old_index]
+
+        return self.__materialize_bucket(key_hash % self.size)
+
+    def __materialize_bucket(self, index: int) -> LinkedList[Entry[K, V]]:
+        # while rehashing incrementally new buckets are created on first use
         bucket = self.buckets[index]
-        key_value = (key, value)
+        if bucket is None:
+            bucket = LinkedList()
+            self.buckets[index] = bucket
+        return bucket
+
+    def __iter_buckets(self) -> Iterable[LinkedList[Entry[K, V]]]:
+        for bucket in self.buckets:
+            if bucket is not None:
+                yield bucket
+
+        if self.old_buckets is not None:
+            yield from self.old_buckets[self.rehash_index :]
+
+    def __move_entries(
+        self,
+        bucket: LinkedList[Entry[K, V]],
+        buckets: List[LinkedList[Entry[K, V]]],
+        size: int,
+    ) -> None:
+        current_node = bucket.head
 
-        was_find = False
+        while current_node is not None:
+            entry: Entry[K, V] = current_node.value
+            buckets[entry.hash % size].append(entry)
+            current_node = current_node.next
+
+    def __migrate_bucket(self, bucket: LinkedList[Entry[K, V]]) -> None:
         current_node = bucket.head
 
-        while current_node is not None and not was_find:
-            key_value_to_find: Tuple[K, V] = current_node.value
-            key_to_find = key_value_to_find[0]
+        while current_node is not None:
+            entry: Entry[K, V] = current_node.value
+            self.__materialize_bucket(entry.hash % self.size).append(entry)
+            current_node = current_node.next
+
+        bucket.reset()
+
+    def __find_node(self, bucket: LinkedList[Entry[K, V]], key: K, key_hash: int):
+        current_node = bucket.head
 
-            if key == key_to_find:
-                del key_value_to_find
-                current_node.value = key_value
-                was_find = True
+        while current_node is not None:
+            entry: Entry[K, V] = current_node.value
+            # cheap int comparison first, __eq__ only on a hash match
+            if entry.hash == key_hash and entry.key == key:
+                return current_node
 
             current_node = current_node.next
 
-        if not was_find:
-            bucket.append(key_value)
+        return None
+
+    def resize(self, size: int) -> None:
+        # entries keep their cached hash, keys are never re-hashed
+        if self.old_buckets is not None:
+            self.rehash_step(self.old_size)
+
+        self.rehash_count = self.rehash_count + 1
+
+        if self.incremental_rehash:
+            # old buckets are migrated a few at a time by later operations
+            buckets = [None] * size
+            self.old_buckets = self.buckets
+            self.old_size = self.size
+            self.rehash_index = 0
+        else:
+            buckets = self.__make_buckets(size)
+            for bucket in self.buckets:
+                self.__move_entries(bucket, buckets, size)
+
+        self.size = size
+        self.buckets = buckets
+
+    def rehash_step(self, steps: int = 1) -> int:
+        # migrates up to `steps` old buckets, returns how many were moved
+        if self.old_buckets is None:
+            return 0
+
+        migrated = 0
+        # each step also creates its share of new buckets, so none are
+        # missing once the last old bucket is migrated
+        per_bucket = -(-self.size // self.old_size)
+
+        while migrated < steps and self.rehash_index < self.old_size:
+            self.__migrate_bucket(self.old_buckets[self.rehash_index])
+            # free migrated buckets one by one instead of all at the end
+            self.old_buckets[self.rehash_index] = None
+
+            start = self.rehash_index * per_bucket
+            for index in range(start, min(start + per_bucket, self.size)):
+                self.__materialize_bucket(index)
+
+            self.rehash_index = self.rehash_index + 1
+            migrated = migrated + 1
+
+        if self.rehash_index >= self.old_size:
+            self.old_buckets = None
+            self.old_size = 0
+            self.rehash_index = 0
+
+        return migrated
+
+    def __grow_if_needed(self) -> None:
+        if self.max_load_factor is not None and self.load_factor > self.max_load_factor:
+            self.resize(self.__grown_size(self.size))
+
+    def __shrink_if_needed(self) -> None:
+        if (
+            self.min_load_factor is not None
+            and self.max_load_factor is not None
+            and self.size > self.initial_size
+            and self.load_factor < self.min_load_factor
+        ):
+            self.resize(max(self.initial_size, self.size // GROWTH_FACTOR | 1))
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Union[Mapping[K, V], Iterable[Tuple[K, V]]],
+        expected_size: Optional[int] = None,
+        unique_keys: bool = False,
+        **options,
+    ) -> "HashTable[K, V]":
+        # presized so bulk loading never resizes when expected_size is right
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)
+
+        size = options.pop("size", DEFAULT_SIZE)
+        max_load_factor = options.get("max_load_factor", DEFAULT_MAX_LOAD_FACTOR)
+        if expected_size and max_load_factor:
+            size = max(size, math.ceil(expected_size / max_load_factor) | 1)
+
+        hash_table = cls(size, **options)
+        hash_table.set_many(items, unique_keys=unique_keys)
+        return hash_table
+
+    def reserve(self, count: int) -> None:
+        # grows once up front instead of doubling repeatedly while inserting
+        if self.max_load_factor is None:
+            return None
+
+        size = self.size
+        while count > size * self.max_load_factor:
+            size = self.__grown_size(size)
+
+        if size != self.size:
+            self.resize(size)
+
+    def __insert(self, key: K, value: V, unique_key: bool) -> None:
+        self.set_count = self.set_count + 1
+        if self.__should_sample(self.set_count):
+            start = perf_counter()
+            self.__insert_entry(key, value, unique_key)
+            self.latency_hook("set", perf_counter() - start)
+        else:
+            self.__insert_entry(key, value, unique_key)
+
+    def __insert_entry(self, key: K, value: V, unique_key: bool) -> None:
+        if self.old_buckets is not None:
+            self.rehash_step(self.rehash_steps)
+
+        key_hash = self.hash_function(key)
+        bucket = self.__bucket_for(key_hash)
+
+        if not unique_key:
+            node = self.__find_node(bucket, key, key_hash)
+
+            if node is not None:
+                node.value.value = value
+                return None
+
+        bucket.append(Entry(key, value, key_hash))
+        self.count = self.count + 1
+        self.__grow_if_needed()
+
+    def set(self, key: K, value: V) -> None:
+        self.__insert(key, value, False)
+
+    def set_many(
+        self,
+        items: Union[Mapping[K, V], Iterable[Tuple[K, V]]],
+        unique_keys: bool = False,
+    ) -> None:
+        # unique_keys skips the duplicate scan - only for keys known to be new
+        if hasattr(items, "__len__"):
+            self.reserve(self.count + len(items))
+
+        # a Mapping iterates keys only - HashTable included
+        if isinstance(items, Mapping):
+            items = items.items()
+
+        insert = self.__insert
+        for key, value in items:
+            insert(key, value, unique_keys)
 
     def delete(self, key: K) -> None:
+        self.delete_count = self.delete_count + 1
+        if self.__should_sample(self.delete_count):
+            start = perf_counter()
+            self.__delete_entry(key)
+            self.latency_hook("delete", perf_counter() - start)
+        else:
+            self.__delete_entry(key)
 
-        index = self.hash(key)
-        bucket = self.buckets[index]
+    def __delete_entry(self, key: K) -> None:
+        if self.old_buckets is not None:
+            self.rehash_step(self.rehash_steps)
+
+        key_hash = self.hash_function(key)
+        bucket = self.__bucket_for(key_hash)
 
         if bucket.is_empty():
             return None
@@ -68,68 +454,113 @@ class HashTable(Generic[K, V]):
 
         while current_node is not None:
             next_node = current_node.next
+            entry: Entry[K, V] = current_node.value
 
-            key_value_to_find: Tuple[K, V] = current_node.value
-            key_to_find = key_value_to_find[0]
-
-            if key == key_to_find:
+            if entry.hash == key_hash and entry.key == key:
                 current_node.next = None
-                del current_node
 
                 if prev_node is not None:
-                    prev_node.next = None
-
-                    if next_node is not None:
-                        prev_node.next = next_node
+                    prev_node.next = next_node
                 else:
-                    # head = tail
-                    if next_node is not None:
-                        bucket.head = next_node
+                    bucket.head = next_node
 
-                        if next_node.next is None:
-                            bucket.tail = bucket.head
-                    else:
-                        bucket.head = None
-                        bucket.tail = bucket.head
+                if next_node is None:
+                    bucket.tail = prev_node
 
                 if bucket.length > 0:
                     bucket.length = bucket.length - 1
 
+                self.count = self.count - 1
+                self.__shrink_if_needed()
                 return None
 
             prev_node = current_node
             current_node = next_node
 
-    def get(self, key: K) -> Optional[V]:
-        index = self.hash(key)
-        bucket = self.buckets[index]
+    def __lookup(self, key: K):
+        self.lookup_count = self.lookup_count + 1
+        if self.__should_sample(self.lookup_count):
+            start = perf_counter()
+            node = self.__lookup_node(key)
+            self.latency_hook("lookup", perf_counter() - start)
+        else:
+            node = self.__lookup_node(key)
+
+        if node is not None:
+            self.hit_count = self.hit_count + 1
+        return node
+
+    def __lookup_node(self, key: K):
+        if self.old_buckets is not None:
+            self.rehash_step(self.rehash_steps)
+
+        key_hash = self.hash_function(key)
+        bucket = self.__bucket_for(key_hash)
 
         if bucket.is_empty():
             return None
 
-        current_node = bucket.head
-        value: Optional[V] = None
+        return self.__find_node(bucket, key, key_hash)
 
-        while current_node is not None:
-            key_value_to_find: Tuple[K, V] = current_node.value
-            key_to_find = key_value_to_find[0]
+    def peek_entry(self, key: K) -> Optional[Entry[K, V]]:
+        # read-only lookup - no counters, no latency sampling and no rehash step,
+        # so readers that do not hold the writers' lock never write to the table
+        key_hash = self.hash_function(key)
+        old_buckets = self.old_buckets
+        bucket = None
 
-            if key == key_to_find:
-                value = key_value_to_find[1]
-                return value
+        if old_buckets is not None:
+            old_index = key_hash % len(old_buckets)
+            if old_index >= self.rehash_index:
+                bucket = old_buckets[old_index]
 
-            current_node = current_node.next
+        # a migrated (None) old bucket means the entry already moved
+        if bucket is None:
+            buckets = self.buckets
+            bucket = buckets[key_hash % len(buckets)]
+
+        if bucket is None:
+            return None
 
-        return value
+        node = self.__find_node(bucket, key, key_hash)
+        return node.value if node is not None else None
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        node = self.__lookup(key)
+        return node.value.value if node is not None else default
+
+    def get_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        if self.old_buckets is not None:
+            return [self.get(key) for key in keys]
+
+        # no migration can happen - hashing and bucket indexing are inlined
+        hash_function, buckets, size = self.hash_function, self.buckets, self.size
+        find_node = self.__find_node
+        values = []
+        hits = 0
+
+        for key in keys:
+            key_hash = hash_function(key)
+            node = find_node(buckets[key_hash % size], key, key_hash)
+            if node is not None:
+                values.append(node.value.value)
+                hits = hits + 1
+            else:
+                values.append(None)
+
+        # counted in bulk, batch lookups are not latency sampled
+        self.lookup_count = self.lookup_count + len(values)
+        self.hit_count = self.hit_count + hits
+        return values
 
     def has(self, key: K) -> bool:
-        return self.get(key) is not None
+        # membership by key, a stored None value still counts as present
+        return self.__lookup(key) is not None
 
     def get_keys_values(self) -> Dict[K, List[V]]:
         keys_values = {}
 
-        for index in range(0, self.size):
-            ll = self.buckets[index]
+        for ll in self.__iter_buckets():
             node = ll.head
 
             while node is not None:
@@ -143,8 +574,33 @@ class HashTable(Generic[K, V]):
 
         return keys_values
 
+    def __iter_entries(self) -> Iterator[Entry[K, V]]:
+        # a pending incremental rehash is finished first - lookups made while
+        # iterating must not migrate buckets under the running walk
+        if self.old_buckets is not None:
+            self.rehash_step(self.old_size)
+
+        for bucket in self.__iter_buckets():
+            node = bucket.head
+
+            while node is not None:
+                yield node.value
+                node = node.next
+
+    def keys(self) -> Iterator[K]:
+        for entry in self.__iter_entries():
+            yield entry.key
+
+    def values(self) -> Iterator[V]:
+        for entry in self.__iter_entries():
+            yield entry.value
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        for entry in self.__iter_entries():
+            yield entry.key, entry.value
+
     def get_keys(self) -> List[K]:
-        return list(chain.from_iterable(self.get_keys_values().keys()))
+        return list(self.keys())
 
-    def get_values(self) -> List[K]:
-        return list(chain.from_iterable(self.get_keys_values().values()))
+    def get_values(self) -> List[V]:
+        return list(self.values())
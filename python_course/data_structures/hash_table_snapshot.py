@@ -0,0 +1,213 @@
+"""Compact on-disk snapshot of a HashTable that is served through ``mmap``.
+
+Layout (little endian)::
+
+    header      magic, version, bucket count, entry count
+    bucket idx  bucket count + 1 entry offsets, bucket i owns [idx[i], idx[i + 1])
+    directory   (key hash, record offset) per entry, grouped by bucket
+    records     key length, value length, pickled key, pickled value
+
+Keys are hashed with a stable blake2b digest of a canonical encoding, so a
+snapshot written by one process can be read by any other. Supported keys are
+int, float, bool, str, bytes and tuples/frozensets of those; equal keys such
+as ``1``, ``1.0`` and ``True`` encode the same, like they hash the same in
+HashTable. ``write_snapshot`` raises TypeError for any other key, lookups of
+such keys are misses. Values stay pickled in the mapped file until ``get``
+asks for them.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+from hashlib import blake2b
+from typing import Generic, TypeVar, Optional, Iterator, Tuple, Iterable, Any
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+MAGIC = b"PCHTSNAP"
+VERSION = 2
+
+HEADER = struct.Struct("<8sIIQQ")
+OFFSET = struct.Struct("<Q")
+DIRECTORY_ENTRY = struct.Struct("<QQ")
+RECORD_HEADER = struct.Struct("<II")
+LENGTH = struct.Struct("<I")
+FLOAT = struct.Struct("<d")
+
+
+def encode_key(key: Any) -> bytes:
+    # tagged and length-prefixed, unlike pickle it never depends on object
+    # identity or set iteration order
+    if isinstance(key, float) and key.is_integer():
+        key = int(key)
+
+    if isinstance(key, int):
+        length = (key.bit_length() + 8) // 8
+        return b"i" + LENGTH.pack(length) + key.to_bytes(length, "little", signed=True)
+    elif isinstance(key, float):
+        return b"f" + FLOAT.pack(key)
+    elif isinstance(key, str):
+        data = key.encode("utf-8", "surrogatepass")
+        return b"s" + LENGTH.pack(len(data)) + data
+    elif isinstance(key, bytes):
+        return b"b" + LENGTH.pack(len(key)) + key
+    elif isinstance(key, tuple):
+        return b"t" + LENGTH.pack(len(key)) + b"".join(map(encode_key, key))
+    elif isinstance(key, frozenset):
+        return b"z" + LENGTH.pack(len(key)) + b"".join(sorted(map(encode_key, key)))
+
+    raise TypeError(f"unsupported snapshot key type: {type(key).__name__}")
+
+
+def stable_hash(key_bytes: bytes) -> int:
+    # the built-in hash() of str/bytes is randomized per process
+    return int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+def write_snapshot(items: Iterable[Tuple[K, V]], path: str) -> int:
+    # written next to path and moved into place, readers never map a partial file
+    entries = []
+    for key, value in items:
+        key_hash = stable_hash(encode_key(key))
+        key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        entries.append((key_hash, key_bytes, value_bytes))
+
+    bucket_count = max(len(entries), 1)
+    entries.sort(key=lambda entry: entry[0] % bucket_count)
+
+    index_offset = HEADER.size
+    directory_offset = index_offset + OFFSET.size * (bucket_count + 1)
+    records_offset = directory_offset + DIRECTORY_ENTRY.size * len(entries)
+
+    bucket_starts = [0] * (bucket_count + 1)
+    for key_hash, _, _ in entries:
+        bucket_starts[key_hash % bucket_count + 1] += 1
+    for bucket in range(bucket_count):
+        bucket_starts[bucket + 1] += bucket_starts[bucket]
+
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, bucket_count, len(entries)))
+            file.write(struct.pack(f"<{bucket_count + 1}Q", *bucket_starts))
+
+            record_offset = records_offset
+            for key_hash, key_bytes, value_bytes in entries:
+                file.write(DIRECTORY_ENTRY.pack(key_hash, record_offset))
+                record_offset += RECORD_HEADER.size + len(key_bytes) + len(value_bytes)
+
+            for _, key_bytes, value_bytes in entries:
+                file.write(RECORD_HEADER.pack(len(key_bytes), len(value_bytes)))
+                file.write(key_bytes)
+                file.write(value_bytes)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return len(entries)
+
+
+class HashTableSnapshot(Generic[K, V]):
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.bucket_count, self.count = HEADER.unpack_from(
+            self.buffer, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            self.buffer.close()
+            raise ValueError(f"{path} is not a hash table snapshot")
+
+        self.index_offset = HEADER.size
+        self.directory_offset = self.index_offset + OFFSET.size * (self.bucket_count + 1)
+
+    def __str__(self):
+        return f"HashTableSnapshot({self.path!r}, entries={self.count})"
+
+    def __enter__(self) -> "HashTableSnapshot[K, V]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: K) -> bool:
+        return self.has(key)
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def close(self) -> None:
+        self.buffer.close()
+
+    def __read_record(self, record_offset: int) -> Tuple[bytes, bytes]:
+        # plain slices copy out of the mmap, no exported buffer blocks close()
+        key_length, value_length = RECORD_HEADER.unpack_from(self.buffer, record_offset)
+        key_start = record_offset + RECORD_HEADER.size
+        value_start = key_start + key_length
+
+        return (
+            self.buffer[key_start:value_start],
+            self.buffer[value_start : value_start + value_length],
+        )
+
+    def __find_record(self, key: K) -> Optional[bytes]:
+        try:
+            key_bytes = encode_key(key)
+        except TypeError:
+            # write_snapshot rejects such keys, so a hashable one is simply
+            # absent - unhashable keys still raise, like they do for a dict
+            hash(key)
+            return None
+
+        key_hash = stable_hash(key_bytes)
+        bucket = key_hash % self.bucket_count
+
+        start, end = struct.unpack_from(
+            "<QQ", self.buffer, self.index_offset + OFFSET.size * bucket
+        )
+        for position in range(start, end):
+            entry_hash, record_offset = DIRECTORY_ENTRY.unpack_from(
+                self.buffer, self.directory_offset + DIRECTORY_ENTRY.size * position
+            )
+            if entry_hash != key_hash:
+                continue
+
+            record_key, record_value = self.__read_record(record_offset)
+            if pickle.loads(record_key) == key:
+                return record_value
+
+        return None
+
+    def get(self, key: K) -> Optional[V]:
+        record_value = self.__find_record(key)
+        return pickle.loads(record_value) if record_value is not None else None
+
+    def has(self, key: K) -> bool:
+        return self.__find_record(key) is not None
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        for position in range(self.count):
+            _, record_offset = DIRECTORY_ENTRY.unpack_from(
+                self.buffer, self.directory_offset + DIRECTORY_ENTRY.size * position
+            )
+            record_key, record_value = self.__read_record(record_offset)
+            yield pickle.loads(record_key), pickle.loads(record_value)
+
+    def keys(self) -> Iterator[K]:
+        for position in range(self.count):
+            _, record_offset = DIRECTORY_ENTRY.unpack_from(
+                self.buffer, self.directory_offset + DIRECTORY_ENTRY.size * position
+            )
+            record_key, _ = self.__read_record(record_offset)
+            yield pickle.loads(record_key)
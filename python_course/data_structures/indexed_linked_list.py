@@ -0,0 +1,273 @@
+import random
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Union,
+    Iterator,
+    Iterable,
+)
+
+from python_course.utils.predicate import Predicate
+from python_course.utils.ord import CompareFunction
+
+T = TypeVar("T")
+
+#   P ** MAX_LEVEL elements before the top level stops thinning out
+MAX_LEVEL = 16
+P = 0.25
+
+
+class IndexedNode(Generic[T]):
+    # forward[level] skips widths[level] nodes of the bottom level
+    __slots__ = ("value", "forward", "widths")
+
+    def __init__(self, value: T, level: int):
+        self.value: T = value
+        self.forward: List[Optional["IndexedNode[T]"]] = [None] * level
+        self.widths: List[int] = [1] * level
+
+    def __str__(self):
+        return str({"value": self.value, "level": len(self.forward)})
+
+    @property
+    def next(self) -> Optional["IndexedNode[T]"]:
+        return self.forward[0]
+
+
+OptionalIndexedNode = Optional[IndexedNode]
+
+
+class IndexedLinkedList(Generic[T]):
+    # a skip list ordered by position - get, insert and delete_by_position are
+    # O(log n); widths of links past the tail count to a virtual end node
+
+    def __init__(
+        self,
+        comparator: Optional[CompareFunction[T]] = None,
+        seed: Optional[int] = None,
+    ):
+        self.length = 0
+        self.comparator = comparator
+        self.level = 1
+        self.random = random.Random(seed)
+        self.sentinel: IndexedNode[Optional[T]] = IndexedNode(None, MAX_LEVEL)
+        self.tail: OptionalIndexedNode = None
+
+    def __str__(self):
+        return ",".join(f"{value}" for value in self)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        current_node = self.sentinel.forward[0]
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.forward[0]
+
+    def __getitem__(self, index: int) -> T:
+        return self.get(index)
+
+    @property
+    def head(self) -> OptionalIndexedNode:
+        return self.sentinel.forward[0]
+
+    def is_empty(self) -> bool:
+        return self.length == 0
+
+    def __random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self.random.random() < P:
+            level = level + 1
+        return level
+
+    def __normalize_index(self, index: int) -> int:
+        index = int(index)
+        if index < 0:
+            index = index + self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("linked list index out of range")
+        return index
+
+    def __find_node(self, position: int) -> IndexedNode[T]:
+        # position 0 is the sentinel, elements sit at 1..length
+        current_node = self.sentinel
+        current_position = 0
+
+        for level in reversed(range(self.level)):
+            while (
+                current_node.forward[level] is not None
+                and current_position + current_node.widths[level] <= position
+            ):
+                current_position = current_position + current_node.widths[level]
+                current_node = current_node.forward[level]
+
+        return current_node
+
+    def get(self, index: int) -> T:
+        return self.get_node(index).value
+
+    def get_node(self, index: int) -> IndexedNode[T]:
+        return self.__find_node(self.__normalize_index(index) + 1)
+
+    def set(self, index: int, value: T) -> None:
+        self.get_node(index).value = value
+
+    def insert(self, value: T, position: int):
+        # LinkedList semantics - positions are clamped to [0, length]
+        index = min(max(int(position), 0), self.length)
+
+        update: List[IndexedNode[T]] = [self.sentinel] * MAX_LEVEL
+        steps = [0] * MAX_LEVEL
+        current_node = self.sentinel
+        current_position = 0
+
+        for level in reversed(range(self.level)):
+            while (
+                current_node.forward[level] is not None
+                and current_position + current_node.widths[level] <= index
+            ):
+                current_position = current_position + current_node.widths[level]
+                current_node = current_node.forward[level]
+            update[level] = current_node
+            steps[level] = current_position
+
+        new_level = self.__random_level()
+        for level in range(self.level, new_level):
+            # fresh levels start as one link from the sentinel to the end
+            self.sentinel.widths[level] = self.length + 1
+        self.level = max(self.level, new_level)
+
+        new_node = IndexedNode(value, new_level)
+        for level in range(new_level):
+            prev_node = update[level]
+            skipped = index - steps[level]
+
+            new_node.forward[level] = prev_node.forward[level]
+            new_node.widths[level] = prev_node.widths[level] - skipped
+            prev_node.forward[level] = new_node
+            prev_node.widths[level] = skipped + 1
+
+        for level in range(new_level, self.level):
+            update[level].widths[level] = update[level].widths[level] + 1
+
+        if new_node.forward[0] is None:
+            self.tail = new_node
+
+        self.length = self.length + 1
+        return self
+
+    def append(self, value: T):
+        return self.insert(value, self.length)
+
+    def prepend(self, value: T):
+        return self.insert(value, 0)
+
+    def extend(self, values: Iterable[T]):
+        for value in values:
+            self.insert(value, self.length)
+        return self
+
+    def delete_by_position(self, position: int) -> OptionalIndexedNode:
+        # LinkedList semantics - positions past the end remove the tail
+        if self.is_empty():
+            return None
+
+        index = min(max(int(position), 0), self.length - 1)
+        update: List[IndexedNode[T]] = [self.sentinel] * MAX_LEVEL
+        current_node = self.sentinel
+        current_position = 0
+
+        for level in reversed(range(self.level)):
+            while (
+                current_node.forward[level] is not None
+                and current_position + current_node.widths[level] <= index
+            ):
+                current_position = current_position + current_node.widths[level]
+                current_node = current_node.forward[level]
+            update[level] = current_node
+
+        deleted_node = update[0].forward[0]
+        for level in range(self.level):
+            prev_node = update[level]
+            if prev_node.forward[level] is deleted_node:
+                prev_node.forward[level] = deleted_node.forward[level]
+                prev_node.widths[level] = (
+                    prev_node.widths[level] + deleted_node.widths[level] - 1
+                )
+            else:
+                prev_node.widths[level] = prev_node.widths[level] - 1
+
+        while self.level > 1 and self.sentinel.forward[self.level - 1] is None:
+            self.level = self.level - 1
+
+        if deleted_node is self.tail:
+            self.tail = update[0] if update[0] is not self.sentinel else None
+
+        self.length = self.length - 1
+        deleted_node.forward = [None] * len(deleted_node.forward)
+        return deleted_node
+
+    def delete_head(self) -> OptionalIndexedNode:
+        return self.delete_by_position(0)
+
+    def delete_tail(self) -> OptionalIndexedNode:
+        return self.delete_by_position(self.length - 1)
+
+    def delete(self, value: T, all_occurrences=True) -> OptionalIndexedNode:
+        return self.delete_by_value(value, all_occurrences)
+
+    def delete_by_value(self, value: T, all_occurrences=True) -> OptionalIndexedNode:
+        deleted_node = None
+        index = 0
+        current_node = self.sentinel.forward[0]
+
+        while current_node is not None:
+            next_node = current_node.forward[0]
+
+            if current_node.value == value:
+                deleted_node = self.delete_by_position(index)
+                if not all_occurrences:
+                    break
+            else:
+                index = index + 1
+
+            current_node = next_node
+
+        return deleted_node
+
+    def find(self, matcher: Union[T, Predicate[T]]) -> OptionalIndexedNode:
+        custom_matcher = self.comparator
+        current_node = self.sentinel.forward[0]
+
+        while current_node is not None:
+            current_value = current_node.value
+
+            #   prefer callback over custom comparator
+            if callable(matcher) and matcher(current_value):
+                return current_node
+            elif custom_matcher and custom_matcher(current_value, matcher) == 0:
+                return current_node
+            elif custom_matcher is None and matcher == current_value:
+                return current_node
+
+            current_node = current_node.forward[0]
+
+        return None
+
+    def to_array(self) -> List[T]:
+        return list(self)
+
+    def reverse(self):
+        values = self.to_array()
+        self.reset()
+        return self.extend(reversed(values))
+
+    def reset(self):
+        self.length = 0
+        self.level = 1
+        self.sentinel = IndexedNode(None, MAX_LEVEL)
+        self.tail = None
+        return self
@@ -1,12 +1,17 @@
+from collections import Counter
 from dataclasses import dataclass
 from typing import (
     Generic,
+    Iterator,
+    TextIO,
     TypeVar,
     Optional,
     Protocol,
     Union,
     Callable,
     Generator,
+    Iterable,
+    List,
     Any,
 )
 
@@ -15,8 +20,14 @@ from python_course.utils.ord import CompareFunction
 
 T = TypeVar("T")
 
+DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_PREVIEW_SIZE = 10
+
 
 class NodeInterface(Protocol[T]):
+    # no __dict__ is inherited by slotted implementations
+    __slots__ = ()
+
     value: T
     next: Optional["NodeInterface[T]"]
 
@@ -25,6 +36,8 @@ OptionalNode = Optional[NodeInterface[T]]
 
 
 class ExtendedNodeInterface(Protocol[T]):
+    __slots__ = ()
+
     value: T
     next: Optional["ExtendedNodeInterface[T]"]
     prev: Optional["ExtendedNodeInterface[T]"]
@@ -33,7 +46,7 @@ class ExtendedNodeInterface(Protocol[T]):
 OptionalExtNode = Optional[ExtendedNodeInterface[T]]
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo(Generic[T]):
     value: T
     index: int
@@ -42,34 +55,95 @@ class NodeInfo(Generic[T]):
 
 
 class Node(Generic[T], NodeInterface[T]):
+    # millions of nodes per list - a per-instance __dict__ would dominate memory
+    __slots__ = ("value", "next")
+
     def __init__(self, value: T, next: OptionalNode = None):
         self.value: T = value
         self.next: OptionalNode = next
 
     def __str__(self):
-        print(self.value)
-        return str(self.__dict__)
+        return str({"value": self.value, "next": self.next})
+
+
+class ExtendedNode(Node[T], ExtendedNodeInterface[T]):
+    # a node with a back-link to its predecessor
+    __slots__ = ("prev",)
+
+    def __init__(
+        self, value: T, next: OptionalExtNode = None, prev: OptionalExtNode = None
+    ):
+        super().__init__(value, next)
+        self.prev: OptionalExtNode = prev
 
 
 class LinkedList(Generic[T]):
-    def __init__(self, comparator: Optional[CompareFunction[T]] = None):
+    def __init__(
+        self,
+        comparator: Optional[CompareFunction[T]] = None,
+        back_links: bool = False,
+    ):
         self.length = 0
         self.comparator = comparator
+        # back-links cost one slot per node and make delete_tail O(1)
+        self.back_links = back_links
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = self.head
 
     def __str__(self):
-        output = ""
-        if self.is_empty():
-            return output
+        return ",".join(self.__iter_strings(self.head))
+
+    def __len__(self) -> int:
+        return self.length
 
+    def __iter__(self) -> Iterator[T]:
         current_node = self.head
         while current_node is not None:
-            comma = "," if current_node.next is not None else ""
-            output = output + f"{current_node.value}" + comma
+            yield current_node.value
             current_node = current_node.next
 
-        return output
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "LinkedListView[T]"]:
+        # slices are views, not copies - an int index is an O(index) walk
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+
+        index = index + self.length if index < 0 else index
+        if index < 0 or index >= self.length:
+            raise IndexError("linked list index out of range")
+        return self.cursor(index).value
+
+    def view(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> "LinkedListView[T]":
+        return LinkedListView(self, slice(start, stop, step))
+
+    def __iter_strings(
+        self, node: OptionalNode, count: Optional[int] = None
+    ) -> Iterator[str]:
+        while node is not None and (count is None or count > 0):
+            yield f"{node.value}"
+            node = node.next
+            if count is not None:
+                count = count - 1
+
+    def preview(
+        self, first: int = DEFAULT_PREVIEW_SIZE, last: int = DEFAULT_PREVIEW_SIZE
+    ) -> str:
+        # "1,2,...,99,100" - bounded output for logging huge lists
+        if self.length <= first + last:
+            return str(self)
+
+        tail_node = self.cursor(self.length - last).node
+        return ",".join(
+            [
+                *self.__iter_strings(self.head, first),
+                "...",
+                *self.__iter_strings(tail_node, last),
+            ]
+        )
 
     def __normalize_index(self, index: int) -> int:
         return int(index)
@@ -83,8 +157,15 @@ class LinkedList(Generic[T]):
     def __decrement(self, value):
         self.length = self.length - value
 
+    def __make_node(self, value: T) -> Node:
+        return ExtendedNode(value) if self.back_links else Node(value)
+
+    def __set_prev(self, node: OptionalNode, prev_node: OptionalNode) -> None:
+        if self.back_links and node is not None:
+            node.prev = prev_node
+
     def prepend(self, value: T):
-        new_node = Node(value)
+        new_node = self.__make_node(value)
 
         if self.head is None:
             self.head = new_node
@@ -92,6 +173,7 @@ class LinkedList(Generic[T]):
         else:
             first_node = self.head
             new_node.next = first_node
+            self.__set_prev(first_node, new_node)
             self.head = new_node
 
         self.__increment(1)
@@ -101,13 +183,14 @@ class LinkedList(Generic[T]):
         return self.delete_by_value(value, all_occurrences)
 
     def append(self, value: T):
-        new_node = Node(value)
+        new_node = self.__make_node(value)
 
         if self.is_empty():
             self.head = new_node
             self.tail = self.head
         else:
             self.tail.next = new_node
+            self.__set_prev(new_node, self.tail)
             self.tail = new_node
 
         self.__increment(1)
@@ -157,6 +240,7 @@ class LinkedList(Generic[T]):
             current_node.next = None
 
             if not are_equals:
+                self.__set_prev(current_node, self.tail)
 
                 if self.tail is None:
                     self.tail = current_node
@@ -178,6 +262,87 @@ class LinkedList(Generic[T]):
 
         return deleted_node
 
+    def __unlink_where(self, matches: Predicate[T]) -> int:
+        # one pass, every match is unlinked in O(1) next to its predecessor
+        deleted_count = 0
+        prev_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+
+            if matches(current_node.value):
+                self.delete_after_node(prev_node)
+                deleted_count = deleted_count + 1
+            else:
+                prev_node = current_node
+
+            current_node = next_node
+
+        return deleted_count
+
+    def __hashed_matcher(
+        self, targets: List[T], all_occurrences: bool
+    ) -> Optional[Predicate[T]]:
+        try:
+            remaining = Counter(targets)
+        except TypeError:
+            return None
+
+        def matches(value: T) -> bool:
+            try:
+                count = remaining.get(value, 0)
+            except TypeError:
+                # an unhashable value never equals a hashable target
+                return False
+
+            if count == 0:
+                return False
+            if not all_occurrences:
+                remaining[value] = count - 1
+            return True
+
+        return matches
+
+    def __scanning_matcher(
+        self, targets: List[T], all_occurrences: bool
+    ) -> Predicate[T]:
+        comparator = self.comparator
+
+        def are_equal(value: T, target: T) -> bool:
+            if comparator:
+                return comparator(value, target) == 0
+            return value == target
+
+        def matches(value: T) -> bool:
+            for index, target in enumerate(targets):
+                if are_equal(value, target):
+                    if not all_occurrences:
+                        del targets[index]
+                    return True
+            return False
+
+        return matches
+
+    def delete_values(self, values: Iterable[T], all_occurrences=True) -> int:
+        # without all_occurrences every listed value removes one match,
+        # like the same sequence of delete_by_value calls
+        targets = list(values)
+        if not targets:
+            return 0
+
+        matches = None
+        if self.comparator is None:
+            matches = self.__hashed_matcher(targets, all_occurrences)
+        if matches is None:
+            # custom comparators and unhashable targets are matched by scanning
+            matches = self.__scanning_matcher(targets, all_occurrences)
+
+        return self.__unlink_where(matches)
+
+    def delete_where(self, predicate: Predicate[T]) -> int:
+        return self.__unlink_where(predicate)
+
     def delete_by_position(self, position: int) -> OptionalNode:
         if self.is_empty():
             return None
@@ -199,6 +364,7 @@ class LinkedList(Generic[T]):
                     deleted_node = current_node
                 else:
                     current_node.next = None
+                    self.__set_prev(current_node, self.tail)
 
                     if self.tail is None:
                         self.tail = current_node
@@ -221,12 +387,19 @@ class LinkedList(Generic[T]):
         deleted_tail = self.tail
         current_node = self.head
         prev_node = current_node
+        self.__decrement(1)
 
         if self.head.next is None:
             self.head = None
             self.tail = self.head
             return deleted_tail
 
+        if self.back_links:
+            self.tail = deleted_tail.prev
+            self.tail.next = None
+            deleted_tail.prev = None
+            return deleted_tail
+
         while current_node is not None:
             next_node = current_node.next
 
@@ -273,28 +446,23 @@ class LinkedList(Generic[T]):
         return output
 
     def reverse(self):
-        if self.length < 1:
+        if self.length < 2:
             return self
 
-        first_node = self.head
-        second_node = first_node.next
-
-        first_node.next = None
-        current_node = second_node.next if second_node.next else None
-
-        second_node.next = first_node
-
-        self.head = second_node
-        self.tail = first_node
+        current_node = self.head
+        self.tail = current_node
+        prev_node = None
 
         while current_node is not None:
             next_node = current_node.next
 
-            current_node.next = self.head
-            self.head = current_node
+            current_node.next = prev_node
+            self.__set_prev(current_node, next_node)
+            prev_node = current_node
 
             current_node = next_node
 
+        self.head = prev_node
         return self
 
     def reset(self):
@@ -309,12 +477,14 @@ class LinkedList(Generic[T]):
 
         deleted_head = self.head
         new_head = deleted_head.next
+        self.__decrement(1)
 
         if new_head is None:
             self.head = None
             self.tail = self.head
             return deleted_head
 
+        self.__set_prev(new_head, None)
         self.head = new_head
         return deleted_head
 
@@ -326,20 +496,53 @@ class LinkedList(Generic[T]):
         elif norm_pos <= 0:
             return self.prepend(value)
         else:
-            new_node = Node(value)
+            self.cursor(norm_pos).insert_before(value)
+            return self
 
-            for node_info in self.traverse():
+    def cursor(self, position: int = 0) -> "LinkedListCursor[T]":
+        return LinkedListCursor(self, position)
 
-                if node_info.index == norm_pos:
-                    prev_node = node_info.prev
-                    next_node = (
-                        prev_node.next if node_info.next is None else node_info.next
-                    )
+    def insert_after_node(self, prev_node: OptionalNode, value: T) -> Node:
+        # O(1) link of a new node after prev_node, None inserts at the head
+        new_node = self.__make_node(value)
+        next_node = self.head if prev_node is None else prev_node.next
 
-                    prev_node.next = new_node
-                    new_node.next = next_node
-                    self.__increment(1)
-                    return
+        new_node.next = next_node
+        self.__set_prev(new_node, prev_node)
+        self.__set_prev(next_node, new_node)
+
+        if prev_node is None:
+            self.head = new_node
+        else:
+            prev_node.next = new_node
+
+        if next_node is None:
+            self.tail = new_node
+
+        self.__increment(1)
+        return new_node
+
+    def delete_after_node(self, prev_node: OptionalNode) -> OptionalNode:
+        # O(1) unlink of the node following prev_node, None removes the head
+        deleted_node = self.head if prev_node is None else prev_node.next
+        if deleted_node is None:
+            return None
+
+        next_node = deleted_node.next
+        deleted_node.next = None
+        self.__set_prev(deleted_node, None)
+        self.__set_prev(next_node, prev_node)
+
+        if prev_node is None:
+            self.head = next_node
+        else:
+            prev_node.next = next_node
+
+        if next_node is None:
+            self.tail = prev_node
+
+        self.__decrement(1)
+        return deleted_node
 
     def is_reference_type(self, obj: T) -> bool:
         return not isinstance(obj, (int, float, str, bool, bytes, tuple, frozenset))
@@ -347,7 +550,7 @@ class LinkedList(Generic[T]):
     def get_object_properties(self, obj: T) -> dict[str, Any]:
         if isinstance(obj, dict):
             return {key: value for key, value in obj.items()}
-        elif hasattr("__dict__"):
+        elif hasattr(obj, "__dict__"):
             return {
                 key: value
                 for key, value in vars(obj).items()
@@ -355,7 +558,8 @@ class LinkedList(Generic[T]):
             }
         else:
             raise TypeError(
-                f"Unsupported object type: {type(obj)}. Must be a dictionary or object with attributes."
+                f"Unsupported object type: {type(obj)}. "
+                "Must be a dictionary or object with attributes."
             )
 
     def get_stringifier_by_type(self) -> Callable[[T], str]:
@@ -366,18 +570,154 @@ class LinkedList(Generic[T]):
                     lambda t: f"[{', '.join(map(str, t))}]"
                 )  # Generic array formatter
 
+            get_object_properties = self.get_object_properties
+            # dicts are read in place instead of being copied per element
             return lambda t: ",".join(
-                f"{key}:{value}" for key, value in self.get_object_properties(t).items()
+                f"{key}:{value}"
+                for key, value in (
+                    t if isinstance(t, dict) else get_object_properties(t)
+                ).items()
             )
         return lambda t: f"{t}"
 
-    def to_string(self, stringifier: Optional[Callable[[T], str]] = None) -> str:
+    def iter_chunks(
+        self,
+        stringifier: Optional[Callable[[T], str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        # the to_string() output in pieces of up to chunk_size elements
         if self.is_empty():
-            return ""
+            return
 
         string_fun = stringifier if stringifier else self.get_stringifier_by_type()
-        output = ""
-        for node_info in self.traverse():
-            comma = "" if node_info.next is None else ","
-            output = output + f"{{{string_fun(node_info.value)}}}" + comma
-        return output
+        current_node = self.head
+        separator = ""
+
+        while current_node is not None:
+            parts = []
+            while current_node is not None and len(parts) < chunk_size:
+                parts.append(f"{{{string_fun(current_node.value)}}}")
+                current_node = current_node.next
+
+            yield separator + ",".join(parts)
+            separator = ","
+
+    def write_to(
+        self,
+        sink: TextIO,
+        stringifier: Optional[Callable[[T], str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        # streams to_string() into a file-like sink, returns characters written
+        written = 0
+        for chunk in self.iter_chunks(stringifier, chunk_size):
+            sink.write(chunk)
+            written = written + len(chunk)
+        return written
+
+    def to_string(self, stringifier: Optional[Callable[[T], str]] = None) -> str:
+        return "".join(self.iter_chunks(stringifier))
+
+
+class LinkedListCursor(Generic[T]):
+    # sits between prev_node and node - edits next to it are O(1), so a batch
+    # of positional edits walks the list once; edits made to the list through
+    # anything but this cursor invalidate it
+    def __init__(self, linked_list: LinkedList[T], position: int = 0):
+        self.linked_list = linked_list
+        self.prev_node: OptionalNode = None
+        self.node: OptionalNode = linked_list.head
+        self.index = 0
+        self.advance(position)
+
+    def __str__(self):
+        return f"LinkedListCursor(index={self.index}, node={self.node})"
+
+    @property
+    def value(self) -> T:
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        return self.node.value
+
+    def is_at_end(self) -> bool:
+        return self.node is None
+
+    def advance(self, steps: int = 1) -> "LinkedListCursor[T]":
+        # stops at the end of the list instead of raising
+        prev_node, node = self.prev_node, self.node
+        moved = 0
+
+        while moved < steps and node is not None:
+            prev_node = node
+            node = node.next
+            moved = moved + 1
+
+        self.prev_node, self.node = prev_node, node
+        self.index = self.index + moved
+        return self
+
+    def insert_before(self, value: T) -> "LinkedListCursor[T]":
+        # the cursor keeps pointing at the same node, now one index further
+        self.prev_node = self.linked_list.insert_after_node(self.prev_node, value)
+        self.index = self.index + 1
+        return self
+
+    def insert_after(self, value: T) -> "LinkedListCursor[T]":
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        self.linked_list.insert_after_node(self.node, value)
+        return self
+
+    def remove(self) -> NodeInterface[T]:
+        # the cursor moves on to the node that followed the removed one
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+
+        deleted_node = self.linked_list.delete_after_node(self.prev_node)
+        self.node = (
+            self.linked_list.head if self.prev_node is None else self.prev_node.next
+        )
+        return deleted_node
+
+
+class LinkedListView(Generic[T]):
+    # islice over a live list - nothing is copied and the bounds are resolved
+    # against the list's current length whenever the view is used; works for
+    # any list exposing head, length and node.next
+    def __init__(self, linked_list: Any, window: slice):
+        if window.step is not None and window.step < 1:
+            raise ValueError("linked list views walk forward, step must be positive")
+
+        self.linked_list = linked_list
+        self.window = window
+
+    def __str__(self):
+        return ",".join(f"{value}" for value in self)
+
+    def __positions(self) -> range:
+        return range(*self.window.indices(self.linked_list.length))
+
+    def __len__(self) -> int:
+        return len(self.__positions())
+
+    def __iter__(self) -> Iterator[T]:
+        positions = self.__positions()
+        remaining = len(positions)
+        if remaining == 0:
+            return
+
+        current_node = self.linked_list.head
+        for _ in range(positions.start):
+            current_node = current_node.next
+
+        while True:
+            yield current_node.value
+            remaining = remaining - 1
+            if remaining == 0:
+                return
+
+            for _ in range(positions.step):
+                current_node = current_node.next
+
+    def to_array(self) -> List[T]:
+        return list(self)
@@ -0,0 +1,212 @@
+import sys
+from functools import wraps
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    Iterator,
+    Tuple,
+    Callable,
+    Hashable,
+    Any,
+)
+
+from python_course.data_structures.doubly_linked_list import (
+    DoublyLinkedList,
+    DoublyLinkedNodeInterface,
+)
+from python_course.data_structures.hash_table import HashTable, DEFAULT_SIZE
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+R = TypeVar("R")
+
+SizeFunction = Callable[[Any], int]
+
+DEFAULT_MAX_ENTRIES = 128
+MISSING: Any = object()
+
+
+class LruEntry(Generic[K, V]):
+    __slots__ = ("key", "value", "size")
+
+    def __init__(self, key: K, value: V, size: int):
+        self.key = key
+        self.value = value
+        self.size = size
+
+    def __repr__(self):
+        return f"LruEntry({self.key!r}, {self.value!r})"
+
+
+class LRUCache(Generic[K, V]):
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+        sizeof: SizeFunction = sys.getsizeof,
+        size: int = DEFAULT_SIZE,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        #   head is the least recently used entry, tail the most recent one
+        self.recency: DoublyLinkedList[LruEntry[K, V]] = DoublyLinkedList()
+        self.nodes: HashTable[K, DoublyLinkedNodeInterface] = HashTable(size)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __len__(self) -> int:
+        return self.recency.length
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __contains__(self, key: K) -> bool:
+        return self.nodes.has(key)
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        if not self.nodes.has(key):
+            raise KeyError(key)
+        self.delete(key)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __is_full(self) -> bool:
+        return (
+            self.max_entries is not None and self.recency.length > self.max_entries
+        ) or (self.max_bytes is not None and self.bytes > self.max_bytes)
+
+    def __unlink(self, node: DoublyLinkedNodeInterface) -> LruEntry[K, V]:
+        entry = self.recency.delete_node(node).value
+        self.nodes.delete(entry.key)
+        self.bytes = self.bytes - entry.size
+        return entry
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses = self.misses + 1
+            return default
+
+        self.hits = self.hits + 1
+        self.recency.move_to_tail(node)
+        return node.value.value
+
+    def peek(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        #   no statistics and no recency update
+        node = self.nodes.get(key)
+        return node.value.value if node is not None else default
+
+    def put(self, key: K, value: V) -> None:
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+
+        node = self.nodes.get(key)
+        if node is not None:
+            entry = node.value
+            self.bytes = self.bytes + size - entry.size
+            entry.value = value
+            entry.size = size
+            self.recency.move_to_tail(node)
+        else:
+            self.nodes.set(key, self.recency.append(LruEntry(key, value, size)))
+            self.bytes = self.bytes + size
+
+        # an entry larger than max_bytes evicts everything, itself included
+        while self.__is_full():
+            self.evict()
+
+    def evict(self) -> Optional[Tuple[K, V]]:
+        # -> the least recently used (key, value), None when empty
+        if self.recency.is_empty():
+            return None
+
+        entry = self.__unlink(self.recency.head)
+        self.evictions = self.evictions + 1
+        return entry.key, entry.value
+
+    def delete(self, key: K) -> None:
+        node = self.nodes.get(key)
+        if node is not None:
+            self.__unlink(node)
+
+    def clear(self) -> None:
+        self.recency = DoublyLinkedList()
+        self.nodes = HashTable(self.nodes.initial_size)
+        self.bytes = 0
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        # least recently used first
+        node = self.recency.head
+        while node is not None:
+            yield node.value.key, node.value.value
+            node = node.next
+
+    def keys(self) -> Iterator[K]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[V]:
+        for _, value in self.items():
+            yield value
+
+
+def make_key(args: Tuple, kwargs: dict) -> Hashable:
+    #   a lone int/str argument is its own key - it cannot collide with a tuple
+    if not kwargs and len(args) == 1 and type(args[0]) in (int, str):
+        return args[0]
+    return args, tuple(sorted(kwargs.items()))
+
+
+def memoize(
+    max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    max_bytes: Optional[int] = None,
+    sizeof: SizeFunction = sys.getsizeof,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    # the wrapper exposes its LRUCache as .cache for statistics and clearing
+    def decorator(function: Callable[..., R]) -> Callable[..., R]:
+        cache: LRUCache[Hashable, R] = LRUCache(max_entries, max_bytes, sizeof)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> R:
+            key = make_key(args, kwargs)
+            result = cache.get(key, MISSING)
+            if result is MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+from bisect import insort
+from typing import Generic, TypeVar, Optional, Iterable, Union, List
+
+import numpy as np
+
+from python_course.data_structures.array import nth_free_slot
+
+
+T = TypeVar("T", int, float)
+
+DEFAULT_CAPACITY = 8
+GROWTH_FACTOR = 2
+
+
+class NumericArray(Generic[T]):
+    def __init__(
+        self,
+        items: Optional[Iterable[T]] = None,
+        dtype: np.dtype = np.float64,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        values = np.asarray(list(items) if items is not None else [], dtype=dtype)
+
+        self.dtype = np.dtype(dtype)
+        self.length = len(values)
+        self.buffer = np.empty(max(capacity, self.length, 1), dtype=self.dtype)
+        self.buffer[: self.length] = values
+
+    def __str__(self):
+        return str(self.to_numpy())
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]):
+        # slices are views into the buffer - no copy is made
+        if isinstance(index, slice):
+            return self.to_numpy()[index]
+        return self.get(index)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.buffer)
+
+    def __normalize_index(self, index: int) -> int:
+        return int(abs(index))
+
+    def __reserve(self, length: int) -> None:
+        if length <= self.capacity:
+            return None
+
+        capacity = self.capacity
+        while capacity < length:
+            capacity = capacity * GROWTH_FACTOR
+
+        buffer = np.empty(capacity, dtype=self.dtype)
+        buffer[: self.length] = self.buffer[: self.length]
+        self.buffer = buffer
+
+    def to_numpy(self) -> np.ndarray:
+        return self.buffer[: self.length]
+
+    def push(self, item: T):
+        self.__reserve(self.length + 1)
+        self.buffer[self.length] = item
+        self.length = self.length + 1
+        return self
+
+    def extend(self, items: Iterable[T]):
+        values = np.asarray(
+            items if isinstance(items, np.ndarray) else list(items), dtype=self.dtype
+        )
+        self.__reserve(self.length + len(values))
+        self.buffer[self.length : self.length + len(values)] = values
+        self.length = self.length + len(values)
+        return self
+
+    def insert(self, index: int, item: T):
+        new_index = self.__normalize_index(index)
+
+        if new_index >= self.length:
+            return self.push(item)
+
+        self.__reserve(self.length + 1)
+        self.buffer[new_index + 1 : self.length + 1] = self.buffer[
+            new_index : self.length
+        ]
+        self.buffer[new_index] = item
+        self.length = self.length + 1
+        return self
+
+    def pop(self) -> Optional[T]:
+        if self.length == 0:
+            return None
+
+        self.length = self.length - 1
+        return self.buffer[self.length].item()
+
+    def delete(self, index: int):
+        norm_index = self.__normalize_index(index)
+        if norm_index > self.length - 1:
+            return self
+
+        self.buffer[norm_index : self.length - 1] = self.buffer[
+            norm_index + 1 : self.length
+        ]
+        self.length = self.length - 1
+        return self
+
+    def delete_many(self, indices: Iterable[int]):
+        # same result as calling delete(index) for each index in order - only the
+        # k deleted slots are tracked, the buffer is compacted once
+        deleted: List[int] = []
+
+        for index in indices:
+            position = self.__normalize_index(index)
+            if position > self.length - len(deleted) - 1:
+                continue
+
+            insort(deleted, nth_free_slot(deleted, position))
+
+        if len(deleted) == 0:
+            return self
+
+        kept = np.delete(self.to_numpy(), deleted)
+
+        self.buffer[: len(kept)] = kept
+        self.length = len(kept)
+        return self
+
+    def get(self, index: int) -> Optional[T]:
+        norm_index = self.__normalize_index(index)
+        if norm_index > self.length - 1:
+            return None
+        return self.buffer[norm_index].item()
+
+    def take(self, indices: Iterable[int]) -> np.ndarray:
+        norm_indices = np.abs(np.asarray(list(indices), dtype=np.intp))
+        if np.any(norm_indices >= self.length):
+            raise IndexError("take index out of range")
+        return self.to_numpy()[norm_indices]
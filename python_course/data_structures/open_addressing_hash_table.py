@@ -0,0 +1,194 @@
+from typing import Generic, TypeVar, Optional, List, Tuple, Any
+
+from array import array as PackedArray
+
+from python_course.data_structures.hash_table import (
+    HashFunction,
+    DEFAULT_SIZE,
+    DEFAULT_MIN_LOAD_FACTOR,
+    GROWTH_FACTOR,
+)
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_MAX_LOAD_FACTOR = 0.66
+HASH_MASK = (1 << 64) - 1
+#   CPython dict probing - the unused high hash bits are shifted into the
+#   sequence, so keys that share their low bits still spread out
+PERTURB_SHIFT = 5
+#   2**64 / golden ratio, odd - multiplying by it moves every hash bit upwards
+FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def home_slot(key_hash: int, shift: int) -> int:
+    # the high bits of the product depend on all bits of key_hash, unlike
+    # key_hash & mask, which ignores everything above the mask
+    return ((key_hash * FIBONACCI_MULTIPLIER) & HASH_MASK) >> shift
+
+
+def slot_shift(size: int) -> int:
+    # size is a power of two, home_slot keeps its log2(size) high bits
+    return 65 - size.bit_length()
+
+
+class Sentinel:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+EMPTY: Any = Sentinel("EMPTY")
+TOMBSTONE: Any = Sentinel("TOMBSTONE")
+
+
+class OpenAddressingHashTable(Generic[K, V]):
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        hash_function: HashFunction[K] = hash,
+        max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR,
+        min_load_factor: Optional[float] = DEFAULT_MIN_LOAD_FACTOR,
+    ):
+        # a full table has no EMPTY slot left to end a probe for a missing key
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.size = self.__round_up(size)
+        self.initial_size = self.size
+        self.hash_function = hash_function
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.count = 0
+        self.tombstones = 0
+        self.__allocate(self.size)
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __round_up(self, size: int) -> int:
+        # power of two capacity so a slot index fits in log2(size) bits
+        return 1 << max(size - 1, 1).bit_length()
+
+    def __allocate(self, size: int) -> None:
+        # parallel arrays - one machine word per slot in each
+        self.hashes = PackedArray("Q", bytes(8 * size))
+        self.keys: List[K] = [EMPTY] * size
+        self.values: List[Optional[V]] = [None] * size
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def __hash_key(self, key: K) -> int:
+        return self.hash_function(key) & HASH_MASK
+
+    def hash(self, key: K) -> int:
+        return home_slot(self.__hash_key(key), slot_shift(self.size))
+
+    def __probe(self, key: K, key_hash: int) -> Tuple[int, int]:
+        # -> (slot holding the key or -1, first free slot along the probe sequence)
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.size - 1
+        index = home_slot(key_hash, slot_shift(self.size))
+        perturb = key_hash
+        free_slot = -1
+
+        while True:
+            slot_key = keys[index]
+
+            if slot_key is EMPTY:
+                return -1, index if free_slot < 0 else free_slot
+            elif slot_key is TOMBSTONE:
+                if free_slot < 0:
+                    free_slot = index
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index, -1
+
+            perturb = perturb >> PERTURB_SHIFT
+            index = (index * 5 + perturb + 1) & mask
+
+    def resize(self, size: int) -> None:
+        hashes, keys, values = self.hashes, self.keys, self.values
+
+        self.size = self.__round_up(size)
+        self.tombstones = 0
+        self.__allocate(self.size)
+
+        mask = self.size - 1
+        shift = slot_shift(self.size)
+        for slot, key in enumerate(keys):
+            if key is EMPTY or key is TOMBSTONE:
+                continue
+
+            key_hash = hashes[slot]
+            index = home_slot(key_hash, shift)
+            perturb = key_hash
+            while self.keys[index] is not EMPTY:
+                perturb = perturb >> PERTURB_SHIFT
+                index = (index * 5 + perturb + 1) & mask
+
+            self.hashes[index] = key_hash
+            self.keys[index] = key
+            self.values[index] = values[slot]
+
+    def set(self, key: K, value: V) -> None:
+        key_hash = self.__hash_key(key)
+        index, free_slot = self.__probe(key, key_hash)
+
+        if index >= 0:
+            self.values[index] = value
+            return None
+
+        if self.keys[free_slot] is TOMBSTONE:
+            self.tombstones = self.tombstones - 1
+
+        self.hashes[free_slot] = key_hash
+        self.keys[free_slot] = key
+        self.values[free_slot] = value
+        self.count = self.count + 1
+
+        # tombstones lengthen probe sequences just like live entries
+        if self.count + self.tombstones > self.size * self.max_load_factor:
+            grow = self.count > self.size * self.max_load_factor / GROWTH_FACTOR
+            self.resize(self.size * GROWTH_FACTOR if grow else self.size)
+
+    def delete(self, key: K) -> None:
+        index, _ = self.__probe(key, self.__hash_key(key))
+        if index < 0:
+            return None
+
+        self.keys[index] = TOMBSTONE
+        self.values[index] = None
+        self.count = self.count - 1
+        self.tombstones = self.tombstones + 1
+
+        if (
+            self.min_load_factor is not None
+            and self.size > self.initial_size
+            and self.load_factor < self.min_load_factor
+        ):
+            self.resize(max(self.initial_size, self.size // GROWTH_FACTOR))
+
+    def get(self, key: K) -> Optional[V]:
+        index, _ = self.__probe(key, self.__hash_key(key))
+        return self.values[index] if index >= 0 else None
+
+    def has(self, key: K) -> bool:
+        index, _ = self.__probe(key, self.__hash_key(key))
+        return index >= 0
+
+    def get_keys(self) -> List[K]:
+        return [key for key in self.keys if key is not EMPTY and key is not TOMBSTONE]
+
+    def get_values(self) -> List[V]:
+        return [
+            self.values[slot]
+            for slot, key in enumerate(self.keys)
+            if key is not EMPTY and key is not TOMBSTONE
+        ]
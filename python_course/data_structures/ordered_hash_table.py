@@ -0,0 +1,222 @@
+from typing import Generic, TypeVar, Optional, List, Tuple, Iterator
+
+from array import array as PackedArray
+
+from python_course.data_structures.hash_table import (
+    HashFunction,
+    DEFAULT_SIZE,
+    DEFAULT_MIN_LOAD_FACTOR,
+    GROWTH_FACTOR,
+)
+from python_course.data_structures.open_addressing_hash_table import (
+    DEFAULT_MAX_LOAD_FACTOR,
+    HASH_MASK,
+    PERTURB_SHIFT,
+    TOMBSTONE,
+    home_slot,
+    slot_shift,
+)
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+#   sparse index slot markers, real slots hold a position in the dense arrays
+FREE = -1
+DUMMY = -2
+
+
+def index_typecode(size: int) -> str:
+    # dense positions stay below size, so small tables get byte-wide index slots
+    for typecode in ("b", "h", "i"):
+        if size <= 1 << (PackedArray(typecode).itemsize * 8 - 1):
+            return typecode
+    return "q"
+
+
+class OrderedHashTable(Generic[K, V]):
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        hash_function: HashFunction[K] = hash,
+        max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR,
+        min_load_factor: Optional[float] = DEFAULT_MIN_LOAD_FACTOR,
+    ):
+        # below 1 the sparse index always keeps a FREE slot to end a probe,
+        # and dense positions stay small enough for index_typecode(size)
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.size = self.__round_up(size)
+        self.initial_size = self.size
+        self.hash_function = hash_function
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.count = 0
+        #   dense arrays in insertion order, deleted keys become TOMBSTONE
+        self.dense_hashes = PackedArray("Q")
+        self.dense_keys: List[K] = []
+        self.dense_values: List[Optional[V]] = []
+        self.indices = self.__make_index(self.size)
+
+    def __str__(self):
+        return str(self.__dict__)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __contains__(self, key: K) -> bool:
+        return self.has(key)
+
+    def __getitem__(self, key: K) -> V:
+        _, position = self.__probe(key, self.__hash_key(key))
+        if position < 0:
+            raise KeyError(key)
+        return self.dense_values[position]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        if not self.has(key):
+            raise KeyError(key)
+        self.delete(key)
+
+    def __round_up(self, size: int) -> int:
+        return 1 << max(size - 1, 1).bit_length()
+
+    def __make_index(self, size: int) -> PackedArray:
+        return PackedArray(index_typecode(size), [FREE]) * size
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def __hash_key(self, key: K) -> int:
+        return self.hash_function(key) & HASH_MASK
+
+    def hash(self, key: K) -> int:
+        return home_slot(self.__hash_key(key), slot_shift(self.size))
+
+    def __probe(self, key: K, key_hash: int) -> Tuple[int, int]:
+        # -> (index slot, dense position) when found, else (first free slot, -1)
+        indices = self.indices
+        hashes = self.dense_hashes
+        keys = self.dense_keys
+        mask = self.size - 1
+        slot = home_slot(key_hash, slot_shift(self.size))
+        perturb = key_hash
+        free_slot = -1
+
+        while True:
+            position = indices[slot]
+
+            if position == FREE:
+                return (slot if free_slot < 0 else free_slot), -1
+            elif position == DUMMY:
+                if free_slot < 0:
+                    free_slot = slot
+            elif hashes[position] == key_hash:
+                slot_key = keys[position]
+                if slot_key is key or slot_key == key:
+                    return slot, position
+
+            perturb = perturb >> PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def resize(self, size: int) -> None:
+        # compacts the dense arrays and rebuilds the sparse index around them
+        if self.count < len(self.dense_keys):
+            live = [
+                position
+                for position, key in enumerate(self.dense_keys)
+                if key is not TOMBSTONE
+            ]
+            self.dense_hashes = PackedArray("Q", [self.dense_hashes[p] for p in live])
+            self.dense_keys = [self.dense_keys[p] for p in live]
+            self.dense_values = [self.dense_values[p] for p in live]
+
+        # never below what the live entries need at max_load_factor
+        size = max(size, int(self.count / self.max_load_factor) + 1)
+        self.size = self.__round_up(size)
+        self.indices = indices = self.__make_index(self.size)
+
+        mask = self.size - 1
+        shift = slot_shift(self.size)
+        for position, key_hash in enumerate(self.dense_hashes):
+            slot = home_slot(key_hash, shift)
+            perturb = key_hash
+            while indices[slot] != FREE:
+                perturb = perturb >> PERTURB_SHIFT
+                slot = (slot * 5 + perturb + 1) & mask
+            indices[slot] = position
+
+    def set(self, key: K, value: V) -> None:
+        key_hash = self.__hash_key(key)
+        slot, position = self.__probe(key, key_hash)
+
+        if position >= 0:
+            self.dense_values[position] = value
+            return None
+
+        self.indices[slot] = len(self.dense_keys)
+        self.dense_hashes.append(key_hash)
+        self.dense_keys.append(key)
+        self.dense_values.append(value)
+        self.count = self.count + 1
+
+        # deleted entries keep their dense position (and a DUMMY) until a resize
+        if len(self.dense_keys) > self.size * self.max_load_factor:
+            grow = self.count > self.size * self.max_load_factor / GROWTH_FACTOR
+            self.resize(self.size * GROWTH_FACTOR if grow else self.size)
+
+    def delete(self, key: K) -> None:
+        slot, position = self.__probe(key, self.__hash_key(key))
+        if position < 0:
+            return None
+
+        self.indices[slot] = DUMMY
+        self.dense_keys[position] = TOMBSTONE
+        self.dense_values[position] = None
+        self.count = self.count - 1
+
+        if (
+            self.min_load_factor is not None
+            and self.size > self.initial_size
+            and self.load_factor < self.min_load_factor
+        ):
+            self.resize(max(self.initial_size, self.size // GROWTH_FACTOR))
+
+    def get(self, key: K) -> Optional[V]:
+        _, position = self.__probe(key, self.__hash_key(key))
+        return self.dense_values[position] if position >= 0 else None
+
+    def has(self, key: K) -> bool:
+        _, position = self.__probe(key, self.__hash_key(key))
+        return position >= 0
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        # insertion order - a scan over the dense arrays
+        for key, value in zip(self.dense_keys, self.dense_values):
+            if key is not TOMBSTONE:
+                yield key, value
+
+    def keys(self) -> Iterator[K]:
+        for key in self.dense_keys:
+            if key is not TOMBSTONE:
+                yield key
+
+    def values(self) -> Iterator[V]:
+        for key, value in zip(self.dense_keys, self.dense_values):
+            if key is not TOMBSTONE:
+                yield value
+
+    def get_keys(self) -> List[K]:
+        return list(self.keys())
+
+    def get_values(self) -> List[V]:
+        return list(self.values())
@@ -0,0 +1,303 @@
+from typing import (
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Union,
+    Iterator,
+    Tuple,
+)
+
+from python_course.data_structures.linked_list import Node, OptionalNode
+from python_course.utils.predicate import Predicate
+from python_course.utils.ord import CompareFunction
+
+T = TypeVar("T")
+
+DEFAULT_NODE_CAPACITY = 64
+
+
+class UnrolledNode(Generic[T]):
+    # a block of up to `capacity` values per heap node
+    __slots__ = ("values", "next")
+
+    def __init__(
+        self, values: Optional[List[T]] = None, next: "OptionalUnrolledNode" = None
+    ):
+        self.values: List[T] = values if values is not None else []
+        self.next: OptionalUnrolledNode = next
+
+    def __str__(self):
+        return str({"values": self.values, "next": self.next})
+
+
+OptionalUnrolledNode = Optional[UnrolledNode]
+
+
+class UnrolledLinkedList(Generic[T]):
+    # LinkedList semantics with values packed into blocks - node-returning
+    # methods hand out detached Node copies of the affected value
+
+    def __init__(
+        self,
+        comparator: Optional[CompareFunction[T]] = None,
+        node_capacity: int = DEFAULT_NODE_CAPACITY,
+    ):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+
+        self.length = 0
+        self.comparator = comparator
+        self.node_capacity = node_capacity
+        self.head: OptionalUnrolledNode = None
+        self.tail: OptionalUnrolledNode = self.head
+
+    def __str__(self):
+        return ",".join(f"{value}" for value in self)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        current_node = self.head
+        while current_node is not None:
+            yield from current_node.values
+            current_node = current_node.next
+
+    def is_empty(self) -> bool:
+        return self.head is None and self.length == 0
+
+    def append(self, value: T):
+        tail = self.tail
+        # append-heavy use fills blocks completely instead of splitting them
+        if tail is None or len(tail.values) >= self.node_capacity:
+            new_node = UnrolledNode([value])
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            self.tail = new_node
+        else:
+            tail.values.append(value)
+
+        self.length = self.length + 1
+        return self
+
+    def prepend(self, value: T):
+        head = self.head
+        if head is None or len(head.values) >= self.node_capacity:
+            new_node = UnrolledNode([value], head)
+            self.head = new_node
+            if head is None:
+                self.tail = new_node
+        else:
+            head.values.insert(0, value)
+
+        self.length = self.length + 1
+        return self
+
+    def __locate(self, position: int) -> Tuple[UnrolledNode, int]:
+        # -> (node, offset inside its block) of the value at position
+        current_node = self.head
+        while position >= len(current_node.values):
+            position = position - len(current_node.values)
+            current_node = current_node.next
+        return current_node, position
+
+    def __split(self, node: UnrolledNode) -> None:
+        half = len(node.values) // 2
+        new_node = UnrolledNode(node.values[half:], node.next)
+        del node.values[half:]
+        node.next = new_node
+        if self.tail is node:
+            self.tail = new_node
+
+    def insert(self, value: T, position: int):
+        position = int(position)
+
+        if self.is_empty() or position >= self.length:
+            return self.append(value)
+        elif position <= 0:
+            return self.prepend(value)
+
+        node, offset = self.__locate(position)
+        if len(node.values) >= self.node_capacity:
+            self.__split(node)
+            if offset > len(node.values):
+                offset = offset - len(node.values)
+                node = node.next
+
+        node.values.insert(offset, value)
+        self.length = self.length + 1
+        return self
+
+    def __unlink_empty_nodes(self) -> None:
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+            if current_node.values:
+                previous_node = current_node
+            elif previous_node is None:
+                self.head = next_node
+            else:
+                previous_node.next = next_node
+            current_node = next_node
+
+        self.tail = previous_node
+
+    def __fill(self, node: UnrolledNode) -> None:
+        # deletes leave no block but the head and tail under half full - an
+        # underfull block absorbs its successor or borrows values from it
+        half = self.node_capacity // 2
+
+        while len(node.values) < half and node.next is not None:
+            next_node = node.next
+
+            if len(node.values) + len(next_node.values) <= self.node_capacity:
+                node.values.extend(next_node.values)
+                node.next = next_node.next
+                if self.tail is next_node:
+                    self.tail = node
+            else:
+                take = half - len(node.values)
+                node.values.extend(next_node.values[:take])
+                del next_node.values[:take]
+
+    def __unlink(self, previous_node: OptionalUnrolledNode, node: UnrolledNode) -> None:
+        if previous_node is None:
+            self.head = node.next
+        else:
+            previous_node.next = node.next
+        if self.tail is node:
+            self.tail = previous_node
+
+    def delete(self, value: T, all_occurrences=True) -> OptionalNode:
+        return self.delete_by_value(value, all_occurrences)
+
+    def delete_by_value(self, value: T, all_occurrences=True) -> OptionalNode:
+        deleted_count = 0
+        deleted_value = None
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            values = current_node.values
+
+            if all_occurrences:
+                kept = []
+                for current_value in values:
+                    if current_value == value:
+                        deleted_value = current_value
+                        deleted_count = deleted_count + 1
+                    else:
+                        kept.append(current_value)
+
+                if len(kept) < len(values):
+                    current_node.values = kept
+            else:
+                for index, current_value in enumerate(values):
+                    if current_value == value:
+                        deleted_value = values.pop(index)
+                        deleted_count = 1
+                        break
+
+                if deleted_count > 0:
+                    self.__fill(current_node)
+                    if not current_node.values:
+                        self.__unlink(previous_node, current_node)
+                    break
+
+            previous_node = current_node
+            current_node = current_node.next
+
+        if deleted_count == 0:
+            return None
+
+        self.length = self.length - deleted_count
+        if all_occurrences:
+            self.__compact()
+        return Node(deleted_value)
+
+    def __compact(self) -> None:
+        # one pass over the blocks after a bulk delete, refilling each in turn
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            self.__fill(current_node)
+            if not current_node.values:
+                self.__unlink(previous_node, current_node)
+            else:
+                previous_node = current_node
+            current_node = current_node.next
+
+    def delete_head(self) -> OptionalNode:
+        if self.is_empty():
+            return None
+
+        head = self.head
+        value = head.values.pop(0)
+        self.__fill(head)
+        if not head.values:
+            self.__unlink(None, head)
+
+        self.length = self.length - 1
+        return Node(value)
+
+    def delete_tail(self) -> OptionalNode:
+        if self.is_empty():
+            return None
+
+        tail = self.tail
+        value = tail.values.pop()
+        # only an emptied block needs its predecessor, one block walk
+        if not tail.values:
+            self.__unlink_empty_nodes()
+
+        self.length = self.length - 1
+        return Node(value)
+
+    def find(self, matcher: Union[T, Predicate[T]]) -> OptionalNode:
+        custom_matcher = self.comparator
+
+        for current_value in self:
+            #   prefer callback over custom comparator
+            if callable(matcher) and matcher(current_value):
+                return Node(current_value)
+            elif custom_matcher and custom_matcher(current_value, matcher) == 0:
+                return Node(current_value)
+            elif custom_matcher is None and matcher == current_value:
+                return Node(current_value)
+
+        return None
+
+    def to_array(self) -> List[T]:
+        output: List[T] = []
+        current_node = self.head
+        while current_node is not None:
+            output.extend(current_node.values)
+            current_node = current_node.next
+        return output
+
+    def reverse(self):
+        previous_node = None
+        current_node = self.head
+        self.tail = current_node
+
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.values.reverse()
+            current_node.next = previous_node
+            previous_node = current_node
+            current_node = next_node
+
+        self.head = previous_node
+        return self
+
+    def reset(self):
+        self.head = None
+        self.tail = self.head
+        self.length = 0
+        return self
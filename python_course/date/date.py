@@ -21,6 +21,7 @@ def get_quarter(month: int) -> Quarter:
         return quarter[3]
 
 
-month_string = input("enter a month: ")
-quarter = get_quarter(int(month_string))
-print(quarter)
+if __name__ == "__main__":
+    month_string = input("enter a month: ")
+    quarter = get_quarter(int(month_string))
+    print(quarter)
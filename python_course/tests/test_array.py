@@ -0,0 +1,216 @@
+import random
+from array import array as PackedArray
+
+import pytest
+
+from python_course.data_structures.array import Array, nth_free_slot
+from python_course.data_structures.gap_buffer import GapBuffer
+
+
+@pytest.fixture
+def empty_array():
+    return Array()
+
+
+@pytest.fixture
+def populated_array(request):
+    """Fixture that returns an array built from the given values."""
+    return Array(list(request.param))
+
+
+def test_create(empty_array):
+    assert empty_array.length == 0
+    assert empty_array.to_list() == []
+    assert empty_array.pop() is None
+
+
+@pytest.mark.parametrize(
+    "values, expected_values",
+    [
+        ([1, 2, 3], [1, 2, 3]),
+        (["a", "b"], ["a", "b"]),
+    ],
+)
+def test_push(empty_array, values, expected_values):
+    for value in values:
+        empty_array.push(value)
+
+    assert empty_array.to_list() == expected_values
+    assert empty_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize(
+    "populated_array, values, expected_values",
+    [
+        ([1, 2, 3], [(0, 0), (2, 9), (-1, 7), (100, 4)], [0, 7, 1, 9, 2, 3, 4]),
+    ],
+    indirect=["populated_array"],
+)
+def test_insert(populated_array, values, expected_values):
+    for index, value in values:
+        populated_array.insert(index, value)
+
+    assert populated_array.to_list() == expected_values
+    assert populated_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize(
+    "populated_array, expected_popped, expected_values",
+    [
+        ([1, 2, 3], [3, 2, 1, None], []),
+    ],
+    indirect=["populated_array"],
+)
+def test_pop(populated_array, expected_popped, expected_values):
+    popped = [populated_array.pop() for _ in expected_popped]
+
+    assert popped == expected_popped
+    assert populated_array.to_list() == expected_values
+    assert populated_array.length == 0
+
+
+@pytest.mark.parametrize(
+    "populated_array, indexes_to_delete, expected_values",
+    [
+        ([1, 2, 3, 4, 5], [0], [2, 3, 4, 5]),
+        ([1, 2, 3, 4, 5], [-2, 10], [1, 2, 4, 5]),
+        ([1, 2, 3, 4, 5], [4, 3], [1, 2, 3]),
+    ],
+    indirect=["populated_array"],
+)
+def test_delete(populated_array, indexes_to_delete, expected_values):
+    for index in indexes_to_delete:
+        populated_array.delete(index)
+
+    assert populated_array.to_list() == expected_values
+    assert populated_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize(
+    "populated_array, indexes, expected_values",
+    [
+        ([1, 2, 3], [0, 2, -1, 3], [1, 3, 2, None]),
+    ],
+    indirect=["populated_array"],
+)
+def test_get(populated_array, indexes, expected_values):
+    assert [populated_array.get(index) for index in indexes] == expected_values
+
+
+def test_typecoded_storage():
+    array = Array([1.5, 2.5], typecode="d")
+    array.push(3.5).insert(0, 0.5).delete(1)
+
+    assert isinstance(array.items, PackedArray)
+    assert array.to_list() == [0.5, 2.5, 3.5]
+    assert array.pop() == 3.5
+    assert array.length == 2
+
+    with pytest.raises(TypeError):
+        array.push("not a number")
+
+
+@pytest.mark.parametrize(
+    "populated_array, edits, expected_values",
+    [
+        ([1, 2, 3], [(1, "a"), (1, "b"), (0, "c")], ["c", 1, "b", "a", 2, 3]),
+        ([1, 2, 3], [(10, "a"), (10, "b"), (-2, "c")], [1, 2, "c", 3, "a", "b"]),
+        ([], [(0, "a"), (0, "b")], ["b", "a"]),
+        ([1, 2], [], [1, 2]),
+    ],
+    indirect=["populated_array"],
+)
+def test_insert_many(populated_array, edits, expected_values):
+    populated_array.insert_many(edits)
+
+    assert populated_array.to_list() == expected_values
+    assert populated_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize(
+    "populated_array, indexes, expected_values",
+    [
+        ([1, 2, 3, 4, 5], [0, 0, 10, -2], [3, 4]),
+        ([1, 2, 3, 4, 5], [4, 3, 3], [1, 2, 3]),
+        ([1, 2, 3], [], [1, 2, 3]),
+    ],
+    indirect=["populated_array"],
+)
+def test_delete_many(populated_array, indexes, expected_values):
+    populated_array.delete_many(indexes)
+
+    assert populated_array.to_list() == expected_values
+    assert populated_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize(
+    "taken, position, expected_slot",
+    [
+        ([], 3, 3),
+        ([0, 1, 2], 0, 3),
+        ([1, 3, 4], 1, 2),
+        ([1, 3, 4], 2, 5),
+        ([5, 6], 4, 4),
+    ],
+)
+def test_nth_free_slot(taken, position, expected_slot):
+    assert nth_free_slot(taken, position) == expected_slot
+
+
+def test_delete_many_repeated_head():
+    array = Array(list(range(10))).delete_many([0] * 7)
+    assert array.to_list() == [7, 8, 9]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bulk_edits_match_single_calls(seed):
+    rng = random.Random(seed)
+    values = list(range(50))
+    edits = [(rng.randint(-60, 60), rng.random()) for _ in range(40)]
+    indexes = [rng.randint(-60, 60) for _ in range(40)]
+
+    bulk, single = Array(values, typecode="d"), Array(values, typecode="d")
+    bulk.insert_many(edits).delete_many(indexes)
+    for index, value in edits:
+        single.insert(index, value)
+    for index in indexes:
+        single.delete(index)
+
+    assert bulk.to_list() == single.to_list()
+    assert bulk.length == single.length
+
+
+@pytest.mark.parametrize("typecode", [None, "d"])
+def test_gap_storage_matches_contiguous(typecode):
+    rng = random.Random(7)
+    values = [float(value) for value in range(30)]
+    contiguous = Array(values, typecode=typecode)
+    gap = Array(values, typecode=typecode, storage="gap")
+
+    assert isinstance(gap.items, GapBuffer)
+
+    for array in (contiguous, gap):
+        array.insert_many([(index, -1.0) for index in range(10, 20)])
+        array.delete_many([3, 3, -40])
+    for step in range(200):
+        index = rng.randint(-40, 40)
+        if rng.random() < 0.5:
+            contiguous.insert(index, float(step))
+            gap.insert(index, float(step))
+        else:
+            contiguous.delete(index)
+            gap.delete(index)
+
+    assert gap.to_list() == contiguous.to_list()
+    assert [gap.get(index) for index in range(-5, 5)] == [
+        contiguous.get(index) for index in range(-5, 5)
+    ]
+    assert gap.pop() == contiguous.pop()
+    assert gap.length == contiguous.length
+
+
+def test_str_has_no_side_effects(capsys):
+    array = Array([1, 2, 3])
+
+    assert "[1, 2, 3]" in str(array)
+    assert capsys.readouterr().out == ""
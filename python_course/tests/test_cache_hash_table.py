@@ -0,0 +1,152 @@
+import pytest
+
+from python_course.data_structures.cache_hash_table import CacheHashTable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now = self.now + seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_counters():
+    cache = CacheHashTable()
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    with pytest.raises(KeyError):
+        cache["b"]
+
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 0)
+    assert cache.hit_rate == pytest.approx(1 / 3)
+
+    cache.reset_counters()
+    assert (cache.hits, cache.misses, cache.hit_rate) == (0, 0, 0.0)
+
+
+def test_lazy_expiry(clock):
+    cache = CacheHashTable(clock=clock, default_ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock.advance(10)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get_keys() == ["b"]
+    assert cache.ttl("b") == 20
+    assert (cache.misses, cache.expirations) == (1, 1)
+
+    # overwriting refreshes the ttl
+    cache.set("b", 3, ttl=5)
+    clock.advance(20)
+    assert cache.get_values() == []
+
+
+def test_sweep(clock):
+    cache = CacheHashTable(clock=clock, sweep_limit=2)
+    for key in range(6):
+        cache.set(key, key, ttl=key + 1)
+    cache.set("forever", 0)
+
+    clock.advance(4)
+    assert cache.sweep() == 2
+    assert cache.sweep(limit=10) == 2
+    assert cache.sweep() == 0
+    assert sorted(cache.get_keys(), key=str) == [4, 5, "forever"]
+    assert cache.expirations == 4
+
+    # a write pays for a bounded sweep step
+    clock.advance(10)
+    cache.set("c", 1)
+    assert sorted(cache.get_keys(), key=str) == ["c", "forever"]
+
+
+def test_sweep_skips_stale_timers(clock):
+    cache = CacheHashTable(clock=clock)
+    cache.set("a", 1, ttl=1)
+    cache.set("a", 2, ttl=100)
+    cache.delete("a")
+    cache.set("a", 3)
+
+    clock.advance(50)
+    assert cache.sweep() == 0
+    assert cache.get("a") == 3
+
+
+def test_expiry_heap_is_compacted(clock):
+    cache = CacheHashTable(clock=clock, sweep_limit=1)
+    for ttl in range(1, 1000):
+        cache.set("a", ttl, ttl=ttl)
+
+    assert cache.expiry.length <= 2 * len(cache) + cache.sweep_limit + 1
+
+
+def test_lru_eviction():
+    cache = CacheHashTable(max_entries=3)
+    for key in "abc":
+        cache.set(key, key)
+
+    cache.get("a")
+    cache.set("d", "d")
+    assert sorted(cache.get_keys()) == ["a", "c", "d"]
+
+    cache.set("c", "c2")
+    cache.set("e", "e")
+    assert sorted(cache.get_keys()) == ["c", "d", "e"]
+    assert cache.evictions == 2
+
+
+def test_lfu_eviction():
+    cache = CacheHashTable(max_entries=3, eviction_policy="lfu")
+    for key in "abc":
+        cache.set(key, key)
+
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+    cache.set("d", "d")
+    assert sorted(cache.get_keys()) == ["a", "b", "d"]
+
+    # the newcomer has the lowest frequency
+    cache.set("e", "e")
+    assert sorted(cache.get_keys()) == ["a", "b", "e"]
+
+    cache.delete("e")
+    cache.set("f", "f")
+    cache.set("g", "g")
+    assert sorted(cache.get_keys()) == ["a", "b", "g"]
+    assert cache.evictions == 3
+
+
+def test_random_eviction():
+    cache = CacheHashTable(max_entries=50, eviction_policy="random")
+    for key in range(1000):
+        cache.set(key, key)
+        if key % 3 == 0:
+            cache.delete(key - 1)
+    assert len(cache) <= 50
+
+    for key in range(1000, 1100):
+        cache.set(key, key)
+    assert len(cache) == 50
+    assert cache.evictions > 0
+    assert all(cache.get(key) == key for key in cache.get_keys())
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        CacheHashTable(eviction_policy="fifo")
+    with pytest.raises(ValueError):
+        CacheHashTable(max_entries=0)
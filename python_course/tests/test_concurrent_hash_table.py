@@ -0,0 +1,134 @@
+import sys
+from collections import Counter
+from threading import Thread
+
+import pytest
+
+from python_course.data_structures.concurrent_hash_table import (
+    ConcurrentHashTable,
+    LockedHashTable,
+)
+
+
+@pytest.fixture
+def concurrent_hash_table():
+    return ConcurrentHashTable(16, stripes=4)
+
+
+@pytest.fixture
+def populated_hash_table(concurrent_hash_table, request):
+    for key, value in request.param:
+        concurrent_hash_table.set(key, value)
+    return concurrent_hash_table
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, expected_values",
+    [
+        (
+            [("a", "sky-old"), ("a", "sky"), ("b", None), (1, "one")],
+            [("a", "sky"), ("b", None), (1, "one"), ("z", None)],
+        ),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_set_and_retrieve_values(populated_hash_table, expected_values):
+    assert [(key, populated_hash_table.get(key)) for key, _ in expected_values] == (
+        expected_values
+    )
+    assert [populated_hash_table.has(key) for key in ["a", "b", "z"]] == [True, True, False]
+    assert len(populated_hash_table) == 3
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, keys_to_delete, expected_keys",
+    [
+        ([(key, key) for key in range(50)], [0, 10, 49, 100], set(range(1, 49)) - {10}),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_delete_and_iterate(populated_hash_table, keys_to_delete, expected_keys):
+    for key in keys_to_delete:
+        populated_hash_table.delete(key)
+
+    assert set(populated_hash_table) == expected_keys
+    assert Counter(populated_hash_table.get_values()) == Counter(expected_keys)
+    assert dict(populated_hash_table.items()) == {key: key for key in expected_keys}
+
+
+def test_mapping_protocol(concurrent_hash_table):
+    concurrent_hash_table["a"] = 1
+
+    assert concurrent_hash_table["a"] == 1
+    assert "a" in concurrent_hash_table
+
+    del concurrent_hash_table["a"]
+    with pytest.raises(KeyError):
+        concurrent_hash_table["a"]
+    with pytest.raises(KeyError):
+        del concurrent_hash_table["a"]
+
+
+def test_stripes_spread_buckets():
+    hash_table = ConcurrentHashTable(64, stripes=4, max_load_factor=None)
+    for key in range(64):
+        hash_table.set(key, key)
+
+    # stripes split keys by the low hash bits, their buckets must not reuse them
+    for stripe in hash_table.stripes:
+        assert len(stripe.table) == 16
+        assert max(bucket.length for bucket in stripe.table.buckets) == 1
+
+
+@pytest.mark.parametrize("table_class", [ConcurrentHashTable, LockedHashTable])
+def test_concurrent_writers_and_readers(table_class):
+    # switch threads often to surface races in the lock-free read path
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    hash_table = table_class(4)
+    errors = []
+
+    def writer(offset):
+        for key in range(offset, offset + 2000):
+            hash_table.set(key, key)
+        for key in range(offset, offset + 2000, 2):
+            hash_table.delete(key)
+
+    def reader(offset):
+        for _ in range(3):
+            for key in range(offset, offset + 2000):
+                value = hash_table.get(key)
+                if value is not None and value != key:
+                    errors.append((key, value))
+
+    try:
+        threads = [Thread(target=writer, args=(offset,)) for offset in range(0, 8000, 2000)]
+        threads += [Thread(target=reader, args=(offset,)) for offset in range(0, 8000, 2000)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    if table_class is ConcurrentHashTable:
+        for stripe in hash_table.stripes:
+            stats = stripe.table.stats()
+            assert 0 <= stats.hits <= stats.lookups and stats.misses >= 0
+    assert len(hash_table) == 4000
+    assert all(hash_table.has(key) for key in range(1, 8000, 2))
+    assert not any(hash_table.has(key) for key in range(0, 8000, 2))
+
+
+def test_lock_free_hits_leave_stats_untouched(concurrent_hash_table):
+    concurrent_hash_table.set("a", 1)
+    concurrent_hash_table.get("a")
+    concurrent_hash_table.get("missing")
+    assert "a" in concurrent_hash_table
+
+    stats = [stripe.table.stats() for stripe in concurrent_hash_table.stripes]
+    # only the miss falls back to the locked, counted path
+    assert sum(stat.lookups for stat in stats) == 1
+    assert sum(stat.hits for stat in stats) == 0
@@ -144,3 +144,47 @@ def test_delete_head(
 def test_reverse(populated_doubly_linked_list, expected_structure):
     populated_doubly_linked_list.reverse()
     assert str(populated_doubly_linked_list) == expected_structure
+
+
+@pytest.mark.parametrize(
+    "populated_doubly_linked_list",
+    [[1, 2, 3, 4]],
+    indirect=True,
+)
+def test_delete_node_and_move_to_tail(populated_doubly_linked_list):
+    dll = populated_doubly_linked_list
+    node = dll.append(5)
+    assert node is dll.tail
+
+    dll.move_to_tail(dll.head.next)
+    assert str(dll) == "1,3,4,5,2"
+
+    dll.move_to_tail(dll.head)
+    assert str(dll) == "3,4,5,2,1"
+    assert dll.head.previous is None
+
+    dll.delete_node(node)
+    dll.delete_node(dll.tail)
+    dll.delete_node(dll.head)
+    assert str(dll) == "4,2"
+    assert dll.length == 2
+    assert node.next is None and node.previous is None
+
+
+@pytest.mark.parametrize(
+    "populated_doubly_linked_list",
+    [[1, 2, 3, 4, 5]],
+    indirect=True,
+)
+def test_iteration_and_views(populated_doubly_linked_list):
+    dll = populated_doubly_linked_list
+
+    assert list(dll) == [1, 2, 3, 4, 5]
+    assert list(reversed(dll)) == [5, 4, 3, 2, 1]
+    assert len(dll) == 5
+    assert [dll[index] for index in range(-5, 5)] == [1, 2, 3, 4, 5] * 2
+    assert dll[1:4].to_array() == [2, 3, 4]
+    assert list(dll.view(step=2)) == [1, 3, 5]
+
+    with pytest.raises(IndexError):
+        dll[5]
@@ -0,0 +1,47 @@
+import pytest
+
+from python_course.data_structures.fenwick_tree import FenwickTree
+
+
+@pytest.fixture
+def fenwick_tree(request):
+    return FenwickTree(request.param)
+
+
+@pytest.mark.parametrize(
+    "fenwick_tree, expected_prefix_sums",
+    [
+        ([3, 1, 4, 1, 5], [3, 4, 8, 9, 14]),
+        ([], []),
+    ],
+    indirect=["fenwick_tree"],
+)
+def test_prefix_sum(fenwick_tree, expected_prefix_sums):
+    assert [
+        fenwick_tree.prefix_sum(index) for index in range(fenwick_tree.length)
+    ] == expected_prefix_sums
+
+
+@pytest.mark.parametrize(
+    "fenwick_tree, updates, ranges, expected_sums",
+    [
+        ([3, 1, 4, 1, 5], [(1, 2), (4, -5)], [(0, 4), (1, 2), (3, 4), (2, 1)], [11, 7, 1, 0]),
+    ],
+    indirect=["fenwick_tree"],
+)
+def test_add_and_range_sum(fenwick_tree, updates, ranges, expected_sums):
+    for index, delta in updates:
+        fenwick_tree.add(index, delta)
+
+    assert [fenwick_tree.range_sum(start, end) for start, end in ranges] == expected_sums
+
+
+@pytest.mark.parametrize(
+    "fenwick_tree, ks, expected_indexes",
+    [
+        ([1, 0, 1, 1, 0, 1], [0, 1, 2, 3, 4], [0, 2, 3, 5, 6]),
+    ],
+    indirect=["fenwick_tree"],
+)
+def test_find_kth(fenwick_tree, ks, expected_indexes):
+    assert [fenwick_tree.find_kth(k) for k in ks] == expected_indexes
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from python_course.data_structures.gap_buffer import GapBuffer, MIN_GAP_SIZE
+
+
+@pytest.fixture
+def gap_buffer(request):
+    return GapBuffer(request.param)
+
+
+def test_create():
+    buffer = GapBuffer()
+
+    assert len(buffer) == 0
+    assert buffer.gap_size == MIN_GAP_SIZE
+    assert list(buffer) == []
+
+
+@pytest.mark.parametrize(
+    "gap_buffer, edits, expected_values",
+    [
+        ([1, 2, 3], [(0, "a"), (1, "b"), (2, "c")], ["a", "b", "c", 1, 2, 3]),
+        ([1, 2, 3], [(3, "a"), (-1, "b"), (100, "c")], [1, 2, 3, "b", "a", "c"]),
+    ],
+    indirect=["gap_buffer"],
+)
+def test_insert(gap_buffer, edits, expected_values):
+    for index, value in edits:
+        gap_buffer.insert(index, value)
+
+    assert list(gap_buffer) == expected_values
+
+
+@pytest.mark.parametrize(
+    "gap_buffer, indexes, expected_popped, expected_values",
+    [
+        ([1, 2, 3, 4], [-1, 0, 1], [4, 1, 3], [2]),
+    ],
+    indirect=["gap_buffer"],
+)
+def test_pop(gap_buffer, indexes, expected_popped, expected_values):
+    assert [gap_buffer.pop(index) for index in indexes] == expected_popped
+    assert list(gap_buffer) == expected_values
+
+    with pytest.raises(IndexError):
+        gap_buffer.pop(5)
+
+
+def test_gap_follows_cursor():
+    buffer = GapBuffer(range(10))
+    for value in range(20):
+        buffer.insert(5 + value, value)
+
+    assert buffer.gap_start == 25
+    assert len(buffer) == 30
+    assert list(buffer) == list(range(5)) + list(range(20)) + list(range(5, 10))
+
+
+@pytest.mark.parametrize(
+    "gap_buffer, cursor, slices, expected_values",
+    [
+        (
+            [0, 1, 2, 3, 4, 5],
+            3,
+            [(0, 2), (4, 6), (1, 5), (5, 2), (0, 6, 2)],
+            [[0, 1], [4, 5], [1, 2, 3, 4], [], [0, 2, 4]],
+        ),
+    ],
+    indirect=["gap_buffer"],
+)
+def test_slice_and_index(gap_buffer, cursor, slices, expected_values):
+    gap_buffer.move_gap(cursor)
+
+    assert [gap_buffer[slice(*bounds)] for bounds in slices] == expected_values
+    assert [gap_buffer[index] for index in [0, 3, -1]] == [0, 3, 5]
+
+
+def test_typecoded_buffer():
+    buffer = GapBuffer([1.0, 2.0], typecode="d")
+    buffer.insert(1, 1.5)
+    buffer.extend([3.0, 4.0])
+    del buffer[0]
+
+    assert list(buffer) == [1.5, 2.0, 3.0, 4.0]
+    assert buffer[0:2].tolist() == [1.5, 2.0]
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_matches_list(seed):
+    rng = random.Random(seed)
+    buffer, expected = GapBuffer(), []
+
+    for step in range(500):
+        if expected and rng.random() < 0.4:
+            index = rng.randrange(len(expected))
+            assert buffer.pop(index) == expected.pop(index)
+        else:
+            index = rng.randint(0, len(expected))
+            buffer.insert(index, step)
+            expected.insert(index, step)
+
+    assert list(buffer) == expected
+    assert buffer.buffer[buffer.gap_start : buffer.gap_end] == [None] * buffer.gap_size
@@ -1,9 +1,12 @@
+import math
+import random
 from typing import List, Tuple, TypeVar
 from collections import Counter
+from collections.abc import MutableMapping
 
 import pytest
 
-from python_course.data_structures.hash_table import HashTable
+from python_course.data_structures.hash_table import HashTable, ord_sum_hash
 from python_course.data_structures.linked_list import LinkedList
 
 DEFAULT_HASH_TABLE_SIZE = 32
@@ -28,26 +31,31 @@ def format_bucket(ll: LinkedList[Tuple[K, V]]) -> str:
     return string
 
 
+def fixed_hash_table(size: int) -> HashTable:
+    """Ord-sum hashed table that never resizes, so bucket layouts are predictable."""
+    return HashTable(size, hash_function=ord_sum_hash, max_load_factor=None)
+
+
 @pytest.fixture
 def hash_table(request):
     size = request.param
 
     if isinstance(size, int):
-        return HashTable(size)
+        return fixed_hash_table(size)
     elif isinstance(size, list):
         value = size[0][0] if isinstance(size[0], tuple) else size[0]
 
-        return HashTable(value)
+        return fixed_hash_table(value)
     elif isinstance(size, tuple):
-        return HashTable(size[0])  # Example usage
+        return fixed_hash_table(size[0])  # Example usage
 
     print("size", size)
-    return HashTable(size)
+    return fixed_hash_table(size)
 
 
 @pytest.fixture
 def default_hash_table():
-    return HashTable(DEFAULT_HASH_TABLE_SIZE)
+    return fixed_hash_table(DEFAULT_HASH_TABLE_SIZE)
 
 
 @pytest.fixture
@@ -225,3 +233,387 @@ def test_get_keys(populated_hash_table, expected_keys):
 )
 def test_get_values(populated_hash_table, expected_values):
     assert Counter(populated_hash_table.get_values()) == Counter(expected_values)
+
+
+def test_default_hash_separates_anagrams():
+    hash_table = HashTable(1024)
+    for key in ["abc", "acb", "bac", "bca", "cab", "cba"]:
+        hash_table.set(key, key)
+
+    assert ord_sum_hash("abc") == ord_sum_hash("cba")
+    assert max(bucket.length for bucket in hash_table.buckets) < 6
+    assert [hash_table.get(key) for key in ["abc", "cba"]] == ["abc", "cba"]
+
+
+@pytest.mark.parametrize("stride", [1, 1024, 2**20])
+def test_strided_int_keys_spread_out(stride):
+    # hash(int) is the int itself - these keys share all their low bits
+    hash_table = HashTable()
+    for key in range(5000):
+        hash_table.set(key * stride, key)
+
+    assert hash_table.size % 2 == 1
+    assert hash_table.stats().max_probe_length <= 2
+    assert hash_table.get(4999 * stride) == 4999
+
+
+def test_custom_hash_function():
+    hash_table = HashTable(8, hash_function=len, max_load_factor=None)
+    hash_table.set("a", 1)
+    hash_table.set("bb", 2)
+    hash_table.set("cc", 3)
+
+    assert hash_table.hash("zz") == 2
+    assert format_bucket(hash_table.buckets[2]) == "bb:2,cc:3"
+
+
+@pytest.mark.parametrize(
+    "keys_count, expected_size",
+    [
+        (3, 4),  # load factor 0.75 - no resize
+        (4, 9),  # grown bucket counts are odd
+        (13, 19),
+    ],
+)
+def test_grow_on_load_factor(keys_count, expected_size):
+    hash_table = HashTable(4, max_load_factor=0.75)
+    for key in range(keys_count):
+        hash_table.set(key, str(key))
+
+    assert hash_table.size == expected_size
+    assert len(hash_table.buckets) == expected_size
+    assert hash_table.count == keys_count
+    assert [hash_table.get(key) for key in range(keys_count)] == [
+        str(key) for key in range(keys_count)
+    ]
+
+
+def test_shrink_on_delete():
+    hash_table = HashTable(4, max_load_factor=0.75, min_load_factor=0.25)
+    for key in range(100):
+        hash_table.set(key, key)
+
+    grown_size = hash_table.size
+    for key in range(95):
+        hash_table.delete(key)
+
+    assert grown_size == 159
+    assert hash_table.size < grown_size
+    assert hash_table.size >= hash_table.initial_size
+    assert hash_table.count == 5
+    assert [hash_table.get(key) for key in range(94, 100)] == [None, 95, 96, 97, 98, 99]
+
+
+def test_delete_tail_entry_keeps_bucket_consistent():
+    hash_table = fixed_hash_table(1)
+    for key in ["a", "b", "c"]:
+        hash_table.set(key, key)
+
+    hash_table.delete("c")
+    hash_table.set("d", "d")
+
+    assert format_bucket(hash_table.buckets[0]) == "a:a,b:b,d:d"
+    assert hash_table.buckets[0].length == 3
+
+
+def test_incremental_rehash_migrates_on_access():
+    hash_table = HashTable(4, incremental_rehash=True, rehash_steps=1)
+    for key in range(4):
+        hash_table.set(key, key)
+
+    assert hash_table.is_rehashing
+    assert hash_table.size == 9
+    assert hash_table.old_size == 4
+    assert hash_table.rehash_progress == 0.0
+
+    assert hash_table.get(0) == 0
+    assert hash_table.rehash_progress == 0.25
+    assert sorted(hash_table.get_keys_values()) == [0, 1, 2, 3]
+
+    assert hash_table.rehash_step(10) == 3
+    assert not hash_table.is_rehashing
+    assert hash_table.rehash_progress == 1.0
+    assert hash_table.rehash_step() == 0
+    assert sum(bucket.length for bucket in hash_table.buckets) == 4
+
+
+def test_incremental_rehash_bounds_work_per_operation():
+    hash_table = HashTable(1024, incremental_rehash=True, rehash_steps=2)
+    for key in range(769):
+        hash_table.set(key, key)
+
+    assert hash_table.is_rehashing
+    hash_table.set("new", "value")
+
+    assert hash_table.rehash_index == 2
+    assert hash_table.get("new") == "value"
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_incremental_rehash_matches_dict(seed):
+    rng = random.Random(seed)
+    hash_table = HashTable(
+        2, incremental_rehash=True, rehash_steps=1, min_load_factor=0.25
+    )
+    expected = {}
+
+    for step in range(3000):
+        key = rng.randrange(300)
+        operation = rng.random()
+        if operation < 0.35:
+            hash_table.delete(key)
+            expected.pop(key, None)
+        elif operation < 0.5:
+            assert hash_table.get(key) == expected.get(key)
+        else:
+            hash_table.set(key, step)
+            expected[key] = step
+
+    assert hash_table.count == len(expected)
+    assert sorted(hash_table.get_keys_values()) == sorted(expected)
+    assert {key: hash_table.get(key) for key in expected} == expected
+
+
+@pytest.mark.parametrize(
+    "hash_table, values, expected_items",
+    [
+        (
+            [(3)],  # Initial Buckets size
+            [("abc", 1), ("cba", 2), ("key", None), ("abc", 3)],
+            [("abc", 3), ("cba", 2), ("key", None)],
+        ),
+    ],
+    indirect=["hash_table"],
+)
+def test_streaming_iterators(populated_hash_table, expected_items):
+    assert len(populated_hash_table) == len(expected_items)
+    assert sorted(populated_hash_table.items(), key=str) == sorted(expected_items, key=str)
+    # Counter(mapping) would count values, like it does for a dict
+    assert Counter(iter(populated_hash_table)) == Counter(
+        key for key, _ in expected_items
+    )
+    assert Counter(populated_hash_table.values()) == Counter(
+        value for _, value in expected_items
+    )
+    assert Counter(populated_hash_table.get_keys()) == Counter(["abc", "cba", "key"])
+
+
+def test_mapping_protocol():
+    hash_table = HashTable(2)
+    hash_table["a"] = 1
+    hash_table["b"] = None
+
+    assert "b" in hash_table
+    assert "c" not in hash_table
+    assert hash_table["a"] == 1
+    assert dict(hash_table.items()) == {"a": 1, "b": None}
+
+    del hash_table["a"]
+    assert len(hash_table) == 1
+
+    with pytest.raises(KeyError):
+        hash_table["a"]
+    with pytest.raises(KeyError):
+        del hash_table["a"]
+
+
+def test_drop_in_mapping():
+    hash_table = HashTable.from_items({"a": 1, "b": 2})
+
+    assert isinstance(hash_table, MutableMapping)
+    assert hash_table.get("z", 0) == 0 and hash_table.get("a", 0) == 1
+    assert hash_table == {"a": 1, "b": 2}
+
+    copy = HashTable(2)
+    copy.set_many(hash_table)
+    assert dict(copy) == {"a": 1, "b": 2}
+    assert dict(HashTable.from_items(copy)) == {"a": 1, "b": 2}
+
+    copy.update(c=3)
+    assert copy.pop("a") == 1 and copy.setdefault("d", 4) == 4
+    assert dict(copy) == {"b": 2, "c": 3, "d": 4}
+
+
+def test_lookups_while_iterating_incremental_table():
+    hash_table = HashTable(4, incremental_rehash=True, rehash_steps=1)
+    for key in range(100):
+        hash_table.set(key, key)
+
+    assert hash_table.is_rehashing
+    assert sorted(key for key in hash_table if hash_table[key] == key) == list(range(100))
+
+
+@pytest.mark.parametrize(
+    "hash_table, values, keys_to_delete, expected_values",
+    [
+        (
+            [(3)],  # Initial Buckets size
+            [("a", None), ("abc", 0), ("cba", False)],
+            ["abc"],
+            [("a", True), ("abc", False), ("cba", True), ("bac", False)],
+        ),
+    ],
+    indirect=["hash_table"],
+)
+def test_has_stored_none_values(populated_hash_table, keys_to_delete, expected_values):
+    for key in keys_to_delete:
+        populated_hash_table.delete(key)
+
+    values = [(key, populated_hash_table.has(key)) for key, _ in expected_values]
+
+    assert values == expected_values
+    assert len(populated_hash_table) == 2
+
+
+def test_len_tracks_set_and_delete():
+    hash_table = HashTable(4)
+    for key in range(10):
+        hash_table.set(key, key)
+    for key in [0, 0, 1, 42]:
+        hash_table.delete(key)
+    hash_table.set(2, "updated")
+
+    assert len(hash_table) == 8
+    assert not any(name.endswith("__keys") for name in vars(hash_table))
+
+
+@pytest.mark.parametrize(
+    "items, options, expected_size",
+    [
+        ({"a": 1, "b": 2, "c": 3}, {}, DEFAULT_HASH_TABLE_SIZE),
+        ([(key, key) for key in range(1000)], {}, 1335),
+        ([(key, key) for key in range(1000)], {"max_load_factor": 0.5}, 2001),
+        (((key, key) for key in range(100)), {"size": 4}, 159),
+    ],
+)
+def test_from_items_presizes(items, options, expected_size):
+    hash_table = HashTable.from_items(items, **options)
+    expected = dict(items) if isinstance(items, (dict, list)) else None
+
+    assert hash_table.size == expected_size
+    if expected is not None:
+        assert dict(hash_table.items()) == expected
+
+
+def test_from_items_with_unique_keys():
+    items = [(f"key-{index}", index) for index in range(500)]
+    hash_table = HashTable.from_items(items, expected_size=500, unique_keys=True)
+
+    assert len(hash_table) == 500
+    assert hash_table.size == math.ceil(500 / 0.75)
+    assert hash_table.get_many(["key-0", "key-499", "missing"]) == [0, 499, None]
+
+
+def test_set_many_updates_existing_keys():
+    hash_table = HashTable(4)
+    hash_table.set_many([("a", 1), ("b", 2)])
+    hash_table.set_many({"b": 20, "c": 30})
+
+    assert len(hash_table) == 3
+    assert hash_table.get_many(["a", "b", "c"]) == [1, 20, 30]
+
+
+def test_get_many_while_rehashing():
+    hash_table = HashTable(4, incremental_rehash=True, rehash_steps=1)
+    hash_table.set_many((key, key * 2) for key in range(10))
+
+    assert hash_table.is_rehashing
+    assert hash_table.get_many(range(12)) == [key * 2 for key in range(10)] + [None, None]
+
+
+def test_stats_chain_histogram():
+    hash_table = fixed_hash_table(8)
+    # anagrams share an ord-sum hash, no table size separates them
+    for key in ["abc", "bca", "cab", "d"]:
+        hash_table.set(key, key)
+
+    stats = hash_table.stats()
+    assert stats.size == 8 and stats.count == 4
+    assert stats.load_factor == 0.5
+    assert stats.chain_length_histogram == {0: 6, 1: 1, 3: 1}
+    assert stats.max_probe_length == 3
+    assert stats.average_probe_length == (1 + 2 + 3 + 1) / 4
+    assert stats.hash_collisions == 2
+
+
+def test_stats_operation_counters():
+    hash_table = HashTable(2)
+    for key in range(10):
+        hash_table.set(key, key)
+    hash_table.delete(0)
+    hash_table.get(1)
+    hash_table.get(0)
+    hash_table.has(2)
+    hash_table.get_many([3, 100])
+
+    stats = hash_table.stats()
+    assert (stats.sets, stats.deletes, stats.lookups) == (10, 1, 5)
+    assert (stats.hits, stats.misses) == (3, 2)
+    assert stats.rehash_count == 3
+    assert stats.hash_collisions == 0
+
+    hash_table.reset_stats()
+    assert hash_table.stats().lookups == 0
+
+
+def test_stats_while_rehashing():
+    hash_table = HashTable(4, incremental_rehash=True, rehash_steps=1)
+    hash_table.set_many((key, key) for key in range(10))
+
+    assert hash_table.is_rehashing
+    stats = hash_table.stats()
+    assert sum(
+        length * buckets for length, buckets in stats.chain_length_histogram.items()
+    ) == len(hash_table)
+
+    live_buckets = sum(bucket is not None for bucket in hash_table.buckets) + (
+        hash_table.old_size - hash_table.rehash_index
+    )
+    assert sum(stats.chain_length_histogram.values()) == live_buckets
+    assert live_buckets < hash_table.size + hash_table.old_size
+
+
+def test_latency_sampling():
+    samples = []
+    hash_table = HashTable()
+    hash_table.sample_latency(lambda operation, seconds: samples.append(operation), 2)
+
+    for key in range(4):
+        hash_table.set(key, key)
+    for key in range(6):
+        hash_table.get(key)
+    hash_table.delete(0)
+    hash_table.delete(1)
+
+    assert Counter(samples) == {"set": 2, "lookup": 3, "delete": 1}
+
+    hash_table.sample_latency(None)
+    hash_table.get(0)
+    assert len(samples) == 6
+
+
+def test_peek_entry_is_read_only():
+    hash_table = HashTable(4, incremental_rehash=True, rehash_steps=1)
+    hash_table.set_many((key, str(key)) for key in range(10))
+    hash_table.reset_stats()
+    rehash_index = hash_table.rehash_index
+    samples = []
+    hash_table.sample_latency(lambda operation, seconds: samples.append(operation), 1)
+
+    entries = [hash_table.peek_entry(key) for key in range(12)]
+
+    assert [entry.value if entry else None for entry in entries] == [
+        str(key) if key < 10 else None for key in range(12)
+    ]
+    assert hash_table.rehash_index == rehash_index
+    assert hash_table.stats().lookups == 0 and samples == []
+
+
+@pytest.mark.parametrize("every", [0, -1])
+def test_latency_sampling_rejects_invalid_rate(every):
+    hash_table = HashTable()
+    with pytest.raises(ValueError):
+        hash_table.sample_latency(lambda operation, seconds: None, every)
+
+    hash_table.set("key", "value")
+    assert hash_table.get("key") == "value"
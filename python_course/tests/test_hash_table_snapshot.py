@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import python_course
+from python_course.data_structures.hash_table import HashTable
+from python_course.data_structures.hash_table_snapshot import (
+    HashTableSnapshot,
+    write_snapshot,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(python_course.__file__)))
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, request):
+    """Fixture that writes the given pairs to a snapshot file and returns its path."""
+    hash_table = HashTable.from_items(request.param)
+    path = str(tmp_path / "table.snapshot")
+    write_snapshot(hash_table.items(), path)
+    return path
+
+
+@pytest.mark.parametrize(
+    "snapshot_path, expected_values",
+    [
+        (
+            [("a", "sky"), ("abc", [1, 2]), (3, {"nested": True}), (("x", 1), None)],
+            [("a", "sky"), ("abc", [1, 2]), (3, {"nested": True}), (("x", 1), None), ("z", None)],
+        ),
+    ],
+    indirect=["snapshot_path"],
+)
+def test_get_from_snapshot(snapshot_path, expected_values):
+    with HashTableSnapshot(snapshot_path) as snapshot:
+        values = [(key, snapshot.get(key)) for key, _ in expected_values]
+
+        assert values == expected_values
+        assert len(snapshot) == 4
+
+
+@pytest.mark.parametrize(
+    "snapshot_path, expected_values",
+    [
+        (
+            [("a", None), ("b", 0)],
+            [("a", True), ("b", True), ("c", False)],
+        ),
+    ],
+    indirect=["snapshot_path"],
+)
+def test_has_in_snapshot(snapshot_path, expected_values):
+    with HashTableSnapshot(snapshot_path) as snapshot:
+        assert [(key, snapshot.has(key)) for key, _ in expected_values] == expected_values
+        assert "a" in snapshot
+
+
+@pytest.mark.parametrize(
+    "snapshot_path",
+    [[(f"key-{index}", index) for index in range(1000)], []],
+    indirect=True,
+)
+def test_iterate_snapshot(snapshot_path):
+    with HashTableSnapshot(snapshot_path) as snapshot:
+        items = dict(snapshot.items())
+
+        assert sorted(snapshot) == sorted(items)
+        assert items == {f"key-{index}": index for index in range(len(snapshot))}
+
+
+def test_reject_foreign_file(tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        HashTableSnapshot(str(path))
+
+
+def read_in_subprocess(path, key_expression, hash_seed):
+    # str hashes differ between interpreters, the snapshot must not depend on them
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; "
+            "from python_course.data_structures.hash_table_snapshot import HashTableSnapshot; "
+            f"print(HashTableSnapshot(sys.argv[1]).get({key_expression}))",
+            path,
+        ],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONHASHSEED": hash_seed},
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    return completed.stdout.strip()
+
+
+@pytest.mark.parametrize("snapshot_path", [[("shared", "value")]], indirect=True)
+def test_snapshot_is_portable_across_processes(snapshot_path):
+    assert read_in_subprocess(snapshot_path, "'shared'", "12345") == "value"
+
+
+@pytest.mark.parametrize(
+    "snapshot_path",
+    [[(frozenset(["alpha", "beta", "gamma", "delta", b"raw", 7]), "set value")]],
+    indirect=True,
+)
+@pytest.mark.parametrize("hash_seed", ["1", "2", "3", "4"])
+def test_frozenset_key_is_portable_across_processes(snapshot_path, hash_seed):
+    key_expression = "frozenset(['delta', 'gamma', 7, b'raw', 'beta', 'alpha'])"
+    assert read_in_subprocess(snapshot_path, key_expression, hash_seed) == "set value"
+
+
+def test_equal_keys_match(tmp_path):
+    path = str(tmp_path / "table.snapshot")
+    shared = "".join(["sha", "red"])
+    write_snapshot([((shared, shared), "tuple"), (1, "one"), (2.5, "float")], path)
+
+    with HashTableSnapshot(path) as snapshot:
+        # equal but not identical members, pickle would memoize only the first
+        assert snapshot.get(("".join(["s", "hared"]), "".join(["shar", "ed"]))) == "tuple"
+        assert [snapshot.get(key) for key in (1, 1.0, True)] == ["one"] * 3
+        assert snapshot.get(2.5) == "float" and snapshot.get(2) is None
+
+
+@pytest.mark.parametrize("key", [[1, 2], {"a": 1}, 1j, None, ("nested", [1])])
+def test_reject_unsupported_keys(tmp_path, key):
+    path = str(tmp_path / "table.snapshot")
+    with pytest.raises(TypeError):
+        write_snapshot([(key, "value")], path)
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize("snapshot_path", [[("a", "value")]], indirect=True)
+def test_unsupported_keys_are_misses(snapshot_path):
+    with HashTableSnapshot(snapshot_path) as snapshot:
+        for key in [None, 1j, ("a", None), frozenset([object()])]:
+            assert snapshot.get(key) is None
+            assert not snapshot.has(key) and key not in snapshot
+
+        # unhashable keys cannot be looked up at all, like in a dict
+        with pytest.raises(TypeError):
+            snapshot.get([1, 2])
+
+
+@pytest.mark.parametrize(
+    "snapshot_path",
+    [[(f"key-{index}", index) for index in range(10)]],
+    indirect=True,
+)
+def test_close_with_paused_iterators(snapshot_path):
+    with HashTableSnapshot(snapshot_path) as snapshot:
+        items = snapshot.items()
+        keys = iter(snapshot)
+        next(items), next(keys)
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    def fail_replace(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        write_snapshot([("a", 1)], str(tmp_path / "table.snapshot"))
+
+    assert not os.listdir(tmp_path)
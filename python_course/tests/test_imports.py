@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import python_course
+import python_course.data_structures as data_structures
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(python_course.__file__)))
+
+SIDE_EFFECT_FREE_MODULES = [
+    "python_course.algorithms.linked_list.reverse_traversal",
+    "python_course.algorithms.linked_list.traversal",
+    "python_course.data_structures",
+    "python_course.data_structures.array",
+    "python_course.date.date",
+    "python_course.utils",
+]
+
+
+@pytest.mark.parametrize("module", SIDE_EFFECT_FREE_MODULES)
+def test_import_is_silent_and_non_blocking(module):
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        stdin=subprocess.DEVNULL,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout == ""
+
+
+def test_package_import_is_lazy():
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, python_course.data_structures; "
+            "print(sorted(name for name in sys.modules "
+            "if name.startswith('python_course.data_structures.')))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("name, module_name", data_structures.LAZY_EXPORTS.items())
+def test_lazy_exports(name, module_name):
+    value = getattr(data_structures, name)
+
+    assert value.__name__ == name
+    assert value.__module__ == f"python_course.data_structures.{module_name}"
+    assert name in dir(data_structures)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        data_structures.DoesNotExist
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from python_course.data_structures.indexed_linked_list import IndexedLinkedList
+
+
+@pytest.fixture
+def indexed_linked_list():
+    ll = IndexedLinkedList(seed=11)
+    assert ll.head is None
+    assert ll.tail is None
+    return ll
+
+
+def assert_widths(ll):
+    """Every link must skip exactly the number of bottom-level nodes it spans."""
+    positions = {id(ll.sentinel): 0}
+    node, position = ll.head, 1
+    while node is not None:
+        positions[id(node)] = position
+        node, position = node.next, position + 1
+
+    node = ll.sentinel
+    while node is not None:
+        for level in range(min(len(node.forward), ll.level)):
+            target = node.forward[level]
+            target_position = (
+                positions[id(target)] if target is not None else ll.length + 1
+            )
+            assert node.widths[level] == target_position - positions[id(node)]
+        node = node.next
+
+
+def test_insert_and_get(indexed_linked_list):
+    for value, position in [(4, 3), (3, 2), (2, 1), (1, -7), (10, 9)]:
+        indexed_linked_list.insert(value, position)
+
+    assert str(indexed_linked_list) == "1,4,2,3,10"
+    assert [indexed_linked_list.get(index) for index in range(5)] == [1, 4, 2, 3, 10]
+    assert indexed_linked_list[-1] == 10
+    assert indexed_linked_list.tail.value == 10
+    assert len(indexed_linked_list) == 5
+
+    with pytest.raises(IndexError):
+        indexed_linked_list.get(5)
+    with pytest.raises(IndexError):
+        indexed_linked_list.get(-6)
+
+
+def test_delete_by_position(indexed_linked_list):
+    indexed_linked_list.extend(range(6))
+
+    assert indexed_linked_list.delete_by_position(2).value == 2
+    assert indexed_linked_list.delete_by_position(100).value == 5
+    assert indexed_linked_list.delete_head().value == 0
+    assert indexed_linked_list.delete_tail().value == 4
+    assert indexed_linked_list.to_array() == [1, 3]
+    assert indexed_linked_list.tail.value == 3
+
+    indexed_linked_list.delete_tail()
+    indexed_linked_list.delete_tail()
+    assert indexed_linked_list.is_empty() and indexed_linked_list.tail is None
+    assert indexed_linked_list.delete_head() is None
+
+
+def test_delete_by_value_find_and_reverse(indexed_linked_list):
+    indexed_linked_list.extend([1, 1, 2, 3, 3, 3, 4, 5])
+
+    assert indexed_linked_list.delete(3, all_occurrences=False).value == 3
+    assert indexed_linked_list.delete(1).value == 1
+    assert indexed_linked_list.delete(9) is None
+    assert str(indexed_linked_list) == "2,3,3,4,5"
+
+    assert indexed_linked_list.find(lambda value: value > 3).value == 4
+    assert indexed_linked_list.find(7) is None
+
+    indexed_linked_list.reverse().set(0, 50)
+    assert indexed_linked_list.to_array() == [50, 4, 3, 3, 2]
+    assert_widths(indexed_linked_list)
+
+
+def test_find_by_compare_function():
+    ll = IndexedLinkedList(comparator=lambda a, b: 0 if a["key"] == b["key"] else 1)
+    ll.extend({"key": key} for key in "abc")
+
+    assert ll.find({"key": "b"}).value == {"key": "b"}
+
+
+def test_matches_list_under_random_operations():
+    rng = random.Random(2)
+    ll = IndexedLinkedList(seed=4)
+    expected = []
+
+    for step in range(3000):
+        operation = rng.randrange(4)
+
+        if operation < 2:
+            position = rng.randrange(-2, len(expected) + 3)
+            ll.insert(step, position)
+            expected.insert(min(max(position, 0), len(expected)), step)
+        elif operation == 2 and expected:
+            position = rng.randrange(len(expected) + 2)
+            assert ll.delete_by_position(position).value == expected.pop(
+                min(position, len(expected) - 1)
+            )
+        elif expected:
+            index = rng.randrange(len(expected))
+            assert ll.get(index) == expected[index]
+
+        if step % 300 == 0:
+            assert_widths(ll)
+
+    assert ll.to_array() == expected
+    assert len(ll) == len(expected)
+    assert ll.tail is (None if not expected else ll.get_node(-1))
+    assert_widths(ll)
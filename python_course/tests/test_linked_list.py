@@ -1,3 +1,6 @@
+import io
+import random
+
 import pytest
 
 from python_course.data_structures.linked_list import LinkedList
@@ -287,3 +290,316 @@ def test_traverse(populated_linked_list, expected_structure):
 )
 def test_store_objects_and_to_string(populated_linked_list, expected_structure):
     assert populated_linked_list.to_string() == expected_structure
+
+
+@pytest.mark.parametrize(
+    "populated_linked_list",
+    [[1, 2]],
+    indirect=True,
+)
+def test_nodes_are_slotted(populated_linked_list):
+    node = populated_linked_list.head
+    assert not hasattr(node, "__dict__")
+    assert str(node.next) == "{'value': 2, 'next': None}"
+
+    node_info = next(populated_linked_list.traverse())
+    assert not hasattr(node_info, "__dict__")
+
+
+def assert_back_links(linked_list):
+    prev_node = None
+    node = linked_list.head
+    while node is not None:
+        assert node.prev is prev_node
+        prev_node = node
+        node = node.next
+    assert linked_list.tail is prev_node
+
+
+@pytest.mark.parametrize("back_links", [False, True])
+def test_delete_head_and_tail_keep_length(back_links):
+    linked_list = LinkedList(back_links=back_links)
+    for value in range(5):
+        linked_list.append(value)
+
+    assert linked_list.delete_tail().value == 4
+    assert linked_list.delete_head().value == 0
+    assert linked_list.length == 3
+    assert linked_list.to_array() == [1, 2, 3]
+
+    for _ in range(3):
+        linked_list.delete_tail()
+    assert linked_list.length == 0 and linked_list.is_empty()
+    assert linked_list.to_array() == []
+    assert linked_list.delete_tail() is None
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 5])
+def test_reverse_short_lists(length):
+    linked_list = LinkedList(back_links=True)
+    for value in range(length):
+        linked_list.append(value)
+
+    linked_list.reverse()
+    assert linked_list.to_array() == list(reversed(range(length)))
+    assert_back_links(linked_list)
+
+
+def test_back_links_under_random_operations():
+    rng = random.Random(5)
+    linked_list = LinkedList(back_links=True)
+    expected = []
+
+    for _ in range(500):
+        operation = rng.randrange(8)
+        value = rng.randrange(10)
+
+        if operation == 0:
+            linked_list.append(value)
+            expected.append(value)
+        elif operation == 1:
+            linked_list.prepend(value)
+            expected.insert(0, value)
+        elif operation == 2 and expected:
+            assert linked_list.delete_tail().value == expected.pop()
+        elif operation == 3 and expected:
+            assert linked_list.delete_head().value == expected.pop(0)
+        elif operation == 4:
+            linked_list.delete(value)
+            expected = [current for current in expected if current != value]
+        elif operation == 5 and expected:
+            position = rng.randrange(len(expected))
+            linked_list.delete_by_position(position)
+            del expected[position]
+        elif operation == 6:
+            linked_list.reverse()
+            expected.reverse()
+        elif operation == 7:
+            position = rng.randrange(-1, len(expected) + 2)
+            linked_list.insert(value, position)
+            expected.insert(max(position, 0), value)
+
+        assert_back_links(linked_list)
+        assert linked_list.length == len(expected)
+
+    assert linked_list.to_array() == expected
+
+
+@pytest.mark.parametrize(
+    "values, expected_structure",
+    [
+        ([(1, 0), (2, 1), (3, 2), (4, 1), (5, 2), (6, 1)], "1,6,4,5,2,3"),
+    ],
+)
+def test_insert_in_the_middle(empty_linked_list, values, expected_structure):
+    for value, position in values:
+        empty_linked_list.insert(value, position)
+    assert str(empty_linked_list) == expected_structure
+    assert empty_linked_list.length == len(values)
+
+
+@pytest.mark.parametrize("back_links", [False, True])
+def test_cursor_batched_edits(back_links):
+    linked_list = LinkedList(back_links=back_links)
+    for value in range(10):
+        linked_list.append(value)
+
+    cursor = linked_list.cursor()
+    cursor.insert_before(-1)
+    cursor.advance(2).remove()
+    cursor.insert_after(20)
+    cursor.advance(3).insert_before(50)
+    cursor.advance(100).insert_before(100)
+
+    assert (cursor.index, cursor.is_at_end()) == (13, True)
+    assert linked_list.to_array() == [-1, 0, 1, 3, 20, 4, 50, 5, 6, 7, 8, 9, 100]
+    assert linked_list.length == 13
+    assert linked_list.tail.value == 100
+
+    with pytest.raises(IndexError):
+        cursor.remove()
+    with pytest.raises(IndexError):
+        cursor.insert_after(1)
+    with pytest.raises(IndexError):
+        cursor.value
+
+    if back_links:
+        assert_back_links(linked_list)
+
+
+def test_cursor_removes_head_and_tail():
+    linked_list = LinkedList(back_links=True)
+    for value in range(3):
+        linked_list.append(value)
+
+    cursor = linked_list.cursor()
+    assert cursor.remove().value == 0
+    assert cursor.value == 1
+    assert cursor.advance().remove().value == 2
+    assert cursor.is_at_end()
+
+    assert linked_list.to_array() == [1]
+    assert linked_list.head is linked_list.tail
+    assert_back_links(linked_list)
+
+    linked_list.cursor().remove()
+    assert linked_list.is_empty()
+    linked_list.cursor().insert_before(7)
+    assert linked_list.to_array() == [7] and linked_list.tail.value == 7
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+def test_iter_chunks_and_write_to(chunk_size):
+    linked_list = LinkedList()
+    for value in range(5):
+        linked_list.append({"value": value})
+
+    expected = linked_list.to_string()
+    assert expected == "{value:0},{value:1},{value:2},{value:3},{value:4}"
+
+    chunks = list(linked_list.iter_chunks(chunk_size=chunk_size))
+    assert "".join(chunks) == expected
+    assert len(chunks) == -(-5 // chunk_size)
+
+    sink = io.StringIO()
+    assert linked_list.write_to(sink, chunk_size=chunk_size) == len(expected)
+    assert sink.getvalue() == expected
+
+
+def test_to_string_of_objects_and_stringifier():
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    linked_list = LinkedList()
+    linked_list.append(Point(1, 2)).append(Point(3, 4))
+
+    assert linked_list.to_string() == "{x:1,y:2},{x:3,y:4}"
+    assert linked_list.to_string(lambda point: point.x) == "{1},{3}"
+    assert LinkedList().to_string() == ""
+    assert list(LinkedList().iter_chunks()) == []
+
+
+@pytest.mark.parametrize(
+    "values_count, expected_preview",
+    [
+        (0, ""),
+        (4, "0,1,2,3"),
+        (100, "0,1,...,98,99"),
+    ],
+)
+def test_preview(values_count, expected_preview):
+    linked_list = LinkedList()
+    for value in range(values_count):
+        linked_list.append(value)
+
+    assert linked_list.preview(first=2, last=2) == expected_preview
+
+
+@pytest.mark.parametrize("back_links", [False, True])
+@pytest.mark.parametrize(
+    "values_to_delete, all_occurrences, expected_count, expected_array",
+    [
+        ([3, 1, 9], True, 6, [2, 4, 2]),
+        ([3, 1, 3], False, 3, [2, 4, 1, 3, 2, 1]),
+        ([], True, 0, [1, 3, 2, 3, 4, 1, 3, 2, 1]),
+        (range(1, 3), True, 5, [3, 3, 4, 3]),
+    ],
+)
+def test_delete_values(
+    back_links, values_to_delete, all_occurrences, expected_count, expected_array
+):
+    linked_list = LinkedList(back_links=back_links)
+    for value in [1, 3, 2, 3, 4, 1, 3, 2, 1]:
+        linked_list.append(value)
+
+    deleted_count = linked_list.delete_values(values_to_delete, all_occurrences)
+
+    assert deleted_count == expected_count
+    assert linked_list.to_array() == expected_array
+    assert linked_list.length == len(expected_array)
+    if back_links:
+        assert_back_links(linked_list)
+
+
+def test_delete_values_unhashable_and_comparator():
+    linked_list = LinkedList()
+    for value in [{"id": 1}, {"id": 2}, {"id": 1}, 7]:
+        linked_list.append(value)
+
+    assert linked_list.delete_values([{"id": 1}, 7], all_occurrences=False) == 2
+    assert linked_list.to_array() == [{"id": 2}, {"id": 1}]
+
+    by_id = LinkedList(comparator=lambda a, b: 0 if a["id"] == b["id"] else 1)
+    for index in [1, 2, 1, 3]:
+        by_id.append({"id": index, "name": f"n{index}"})
+
+    assert by_id.delete_values([{"id": 1}]) == 2
+    assert [value["id"] for value in by_id.to_array()] == [2, 3]
+
+
+def test_delete_where():
+    linked_list = LinkedList()
+    for value in range(10):
+        linked_list.append(value)
+
+    assert linked_list.delete_where(lambda value: value % 3 == 0) == 4
+    assert linked_list.to_array() == [1, 2, 4, 5, 7, 8]
+    assert linked_list.tail.value == 8
+
+    assert linked_list.delete_where(lambda value: True) == 6
+    assert linked_list.is_empty() and linked_list.tail is None
+
+
+@pytest.mark.parametrize(
+    "populated_linked_list",
+    [[1, 2, 3, 4, 5, 6, 7]],
+    indirect=True,
+)
+def test_iteration_and_indexing(populated_linked_list):
+    assert list(populated_linked_list) == [1, 2, 3, 4, 5, 6, 7]
+    assert len(populated_linked_list) == 7
+    assert [populated_linked_list[index] for index in (0, 3, -1)] == [1, 4, 7]
+    assert not LinkedList() and populated_linked_list
+
+    with pytest.raises(IndexError):
+        populated_linked_list[7]
+
+
+@pytest.mark.parametrize(
+    "window",
+    [
+        slice(None),
+        slice(2, 5),
+        slice(1, None, 2),
+        slice(-3, None),
+        slice(5, 2),
+        slice(0, 100, 3),
+    ],
+)
+def test_slice_views(window):
+    linked_list = LinkedList()
+    values = list(range(8))
+    for value in values:
+        linked_list.append(value)
+
+    view = linked_list[window]
+    assert list(view) == values[window]
+    assert len(view) == len(values[window])
+    assert view.to_array() == values[window]
+
+
+def test_views_are_live():
+    linked_list = LinkedList()
+    for value in range(5):
+        linked_list.append(value)
+
+    view = linked_list.view(1, 4)
+    linked_list.delete_head()
+    linked_list.append(5)
+
+    assert str(view) == "2,3,4"
+
+    with pytest.raises(ValueError):
+        linked_list[::-1]
@@ -0,0 +1,105 @@
+import pytest
+
+from python_course.data_structures.lru_cache import LRUCache, memoize
+
+
+def test_get_put_evict():
+    cache = LRUCache(max_entries=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+
+    assert cache.get("a") == "A"
+    cache.put("d", "D")
+    assert list(cache.items()) == [("c", "C"), ("a", "A"), ("d", "D")]
+    assert "b" not in cache
+
+    cache["c"] = "C2"
+    assert cache.evict() == ("a", "A")
+    assert list(cache) == ["d", "c"]
+    assert cache.evictions == 2
+
+
+def test_statistics():
+    cache = LRUCache()
+    cache.put("a", None)
+
+    assert cache.get("a") is None
+    assert cache.get("b", "missing") == "missing"
+    assert cache.peek("a", "missing") is None
+    with pytest.raises(KeyError):
+        cache["b"]
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_rate == pytest.approx(1 / 3)
+
+    cache.reset_counters()
+    assert cache.hit_rate == 0.0
+
+
+def test_byte_capacity():
+    cache = LRUCache(max_entries=None, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    assert cache.bytes == 8
+
+    cache.put("c", "xxxx")
+    assert list(cache) == ["b", "c"]
+
+    cache.put("b", "x")
+    cache.put("d", "xxxxx")
+    assert list(cache) == ["c", "b", "d"]
+    assert cache.bytes == 10
+
+    # a value over the budget is not kept
+    cache.put("e", "x" * 11)
+    assert len(cache) == 0 and cache.bytes == 0
+
+
+def test_delete_and_clear():
+    cache = LRUCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    del cache["a"]
+    cache.delete("missing")
+    with pytest.raises(KeyError):
+        del cache["a"]
+    assert list(cache.values()) == [2]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("b") is None
+
+
+def test_memoize():
+    calls = []
+
+    @memoize(max_entries=2)
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+
+    assert [square(2), square(2), square(3), square(2, offset=1)] == [4, 4, 9, 5]
+    assert calls == [2, 3, 2]
+    assert square.__name__ == "square"
+
+    # square(2) was evicted by the keyword call
+    square(2)
+    assert calls == [2, 3, 2, 2]
+    assert (square.cache.hits, square.cache.misses) == (1, 4)
+
+
+def test_memoize_keys_do_not_collide():
+    @memoize()
+    def identity(*args):
+        return args
+
+    assert identity((1, 2)) == ((1, 2),)
+    assert identity(1, 2) == (1, 2)
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(max_entries=0)
+    with pytest.raises(ValueError):
+        LRUCache(max_bytes=0)
@@ -0,0 +1,124 @@
+import random
+
+import numpy as np
+import pytest
+
+from python_course.data_structures.array import Array
+from python_course.data_structures.numeric_array import NumericArray
+
+
+@pytest.fixture
+def empty_numeric_array():
+    return NumericArray(dtype=np.int64, capacity=2)
+
+
+@pytest.fixture
+def populated_numeric_array(request):
+    """Fixture that returns an int64 numeric array built from the given values."""
+    return NumericArray(request.param, dtype=np.int64)
+
+
+def test_create(empty_numeric_array):
+    assert empty_numeric_array.length == 0
+    assert empty_numeric_array.capacity == 2
+    assert empty_numeric_array.pop() is None
+    assert empty_numeric_array.to_numpy().tolist() == []
+
+
+def test_push_doubles_capacity(empty_numeric_array):
+    for value in range(5):
+        empty_numeric_array.push(value)
+
+    assert empty_numeric_array.to_numpy().tolist() == [0, 1, 2, 3, 4]
+    assert empty_numeric_array.capacity == 8
+
+
+@pytest.mark.parametrize(
+    "populated_numeric_array, values, expected_values",
+    [
+        ([1, 2, 3], [(0, 0), (2, 9), (-1, 7), (100, 4)], [0, 7, 1, 9, 2, 3, 4]),
+    ],
+    indirect=["populated_numeric_array"],
+)
+def test_insert(populated_numeric_array, values, expected_values):
+    for index, value in values:
+        populated_numeric_array.insert(index, value)
+
+    assert populated_numeric_array.to_numpy().tolist() == expected_values
+
+
+@pytest.mark.parametrize(
+    "populated_numeric_array, indexes_to_delete, expected_values",
+    [
+        ([1, 2, 3, 4, 5], [0], [2, 3, 4, 5]),
+        ([1, 2, 3, 4, 5], [-2, 10], [1, 2, 4, 5]),
+    ],
+    indirect=["populated_numeric_array"],
+)
+def test_delete(populated_numeric_array, indexes_to_delete, expected_values):
+    for index in indexes_to_delete:
+        populated_numeric_array.delete(index)
+
+    assert populated_numeric_array.to_numpy().tolist() == expected_values
+
+
+@pytest.mark.parametrize(
+    "populated_numeric_array, indexes, expected_values",
+    [
+        ([1, 2, 3, 4, 5], [0, 4, 4, -2, 10], [2, 3, 5]),
+        ([1, 2, 3, 4, 5], [0, 0, 10, -2], [3, 4]),
+        ([1, 2, 3], [], [1, 2, 3]),
+    ],
+    indirect=["populated_numeric_array"],
+)
+def test_delete_many(populated_numeric_array, indexes, expected_values):
+    populated_numeric_array.delete_many(indexes)
+
+    assert populated_numeric_array.to_numpy().tolist() == expected_values
+    assert populated_numeric_array.length == len(expected_values)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_delete_many_matches_array(seed):
+    rng = random.Random(seed)
+    values = list(range(50))
+    indexes = [rng.randint(-60, 60) for _ in range(40)]
+
+    numeric_array = NumericArray(values, dtype=np.int64).delete_many(indexes)
+    array = Array(values).delete_many(indexes)
+
+    assert numeric_array.to_numpy().tolist() == array.to_list()
+
+
+@pytest.mark.parametrize(
+    "populated_numeric_array, indexes, expected_values",
+    [
+        ([10, 20, 30], [2, 0, -1], [30, 10, 20]),
+    ],
+    indirect=["populated_numeric_array"],
+)
+def test_take(populated_numeric_array, indexes, expected_values):
+    assert populated_numeric_array.take(indexes).tolist() == expected_values
+
+    with pytest.raises(IndexError):
+        populated_numeric_array.take([3])
+
+
+def test_extend_and_get():
+    array = NumericArray([0.5])
+    array.extend([1.5, 2.5]).extend(np.arange(3, dtype=np.float64))
+
+    assert array.length == 6
+    assert [array.get(index) for index in [0, 2, -3, 6]] == [0.5, 2.5, 0.0, None]
+    assert array.pop() == 2.0
+
+
+def test_slice_is_view():
+    array = NumericArray([1, 2, 3, 4], dtype=np.int32)
+    view = array[1:3]
+    view[0] = 20
+
+    assert np.shares_memory(view, array.buffer)
+    assert view.dtype == np.int32
+    assert array.get(1) == 20
+    assert array[3] == 4
@@ -0,0 +1,181 @@
+import random
+from collections import Counter
+
+import pytest
+
+from python_course.data_structures.hash_table import ord_sum_hash
+from python_course.data_structures.open_addressing_hash_table import (
+    OpenAddressingHashTable,
+    TOMBSTONE,
+)
+
+
+@pytest.fixture
+def hash_table():
+    return OpenAddressingHashTable(8, hash_function=ord_sum_hash)
+
+
+@pytest.fixture
+def populated_hash_table(hash_table, request):
+    for key, value in request.param:
+        hash_table.set(key, value)
+    return hash_table
+
+
+@pytest.mark.parametrize(
+    "size, expected_size",
+    [
+        (1, 2),
+        (8, 8),
+        (30, 32),
+    ],
+)
+def test_create_by_size(size, expected_size):
+    hash_table = OpenAddressingHashTable(size)
+
+    assert hash_table.size == expected_size
+    assert len(hash_table.keys) == len(hash_table.values) == len(hash_table.hashes)
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, expected_values",
+    [
+        (
+            [("a", "sky-old"), ("a", "sky"), ("b", "sea"), ("abc", "earth"), ("cba", None)],
+            [("a", "sky"), ("b", "sea"), ("abc", "earth"), ("cba", None), ("z", None)],
+        ),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_set_and_retrieve_values(populated_hash_table, expected_values):
+    values = [(key, populated_hash_table.get(key)) for key, _ in expected_values]
+
+    assert values == expected_values
+    assert populated_hash_table.count == 4
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, expected_values",
+    [
+        (
+            [("a", "sky"), ("cba", None)],
+            [("a", True), ("cba", True), ("abc", False)],
+        ),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_has_value(populated_hash_table, expected_values):
+    values = [(key, populated_hash_table.has(key)) for key, _ in expected_values]
+    assert values == expected_values
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, keys_to_delete, expected_values",
+    [
+        (
+            # anagrams share one probe sequence
+            [("abc", 1), ("bca", 2), ("cab", 3)],
+            ["bca", "not-existing"],
+            [("abc", 1), ("bca", None), ("cab", 3)],
+        ),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_delete_values(populated_hash_table, keys_to_delete, expected_values):
+    for key in keys_to_delete:
+        populated_hash_table.delete(key)
+
+    values = [(key, populated_hash_table.get(key)) for key, _ in expected_values]
+
+    assert values == expected_values
+    assert TOMBSTONE in populated_hash_table.keys
+    assert populated_hash_table.count == 2
+
+
+def test_reuse_tombstone():
+    hash_table = OpenAddressingHashTable(8, hash_function=ord_sum_hash)
+    hash_table.set("abc", 1)
+    hash_table.set("bca", 2)
+    hash_table.delete("abc")
+    hash_table.set("cab", 3)
+
+    assert hash_table.tombstones == 0
+    assert hash_table.keys[hash_table.hash("abc")] == "cab"
+
+
+@pytest.mark.parametrize(
+    "populated_hash_table, expected_keys, expected_values",
+    [
+        (
+            [("a", "sky-old"), ("a", "sky"), ("b", "sea"), ("c", "earth"), ("d", "ocean")],
+            ["a", "b", "c", "d"],
+            ["sky", "sea", "earth", "ocean"],
+        ),
+    ],
+    indirect=["populated_hash_table"],
+)
+def test_get_keys_and_values(populated_hash_table, expected_keys, expected_values):
+    assert Counter(populated_hash_table.get_keys()) == Counter(expected_keys)
+    assert Counter(populated_hash_table.get_values()) == Counter(expected_values)
+
+
+def test_grow_and_shrink():
+    hash_table = OpenAddressingHashTable(4)
+    for key in range(1000):
+        hash_table.set(key, key)
+
+    assert hash_table.size == 2048
+    assert hash_table.load_factor <= hash_table.max_load_factor
+
+    for key in range(990):
+        hash_table.delete(key)
+
+    assert hash_table.size < 2048
+    assert sorted(hash_table.get_keys()) == list(range(990, 1000))
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_matches_dict(seed):
+    rng = random.Random(seed)
+    hash_table = OpenAddressingHashTable(4, hash_function=lambda key: key % 7)
+    expected = {}
+
+    for step in range(2000):
+        key = rng.randrange(100)
+        if rng.random() < 0.4:
+            hash_table.delete(key)
+            expected.pop(key, None)
+        else:
+            hash_table.set(key, step)
+            expected[key] = step
+
+    assert hash_table.count == len(expected)
+    assert {key: hash_table.get(key) for key in range(100) if hash_table.has(key)} == expected
+
+
+class CountingList(list):
+    # counts slot reads made by the probe loop
+    reads = 0
+
+    def __getitem__(self, index):
+        self.reads = self.reads + 1
+        return super().__getitem__(index)
+
+
+@pytest.mark.parametrize("stride", [1, 1024, 2**20, 2**40])
+def test_strided_int_keys_spread_out(stride):
+    # hash(int) is the int itself - these keys all share their low bits
+    hash_table = OpenAddressingHashTable()
+    keys = [key * stride for key in range(5000)]
+    for key in keys:
+        hash_table.set(key, key)
+
+    hash_table.keys = CountingList(hash_table.keys)
+    assert all(hash_table.get(key) == key for key in keys)
+    assert hash_table.keys.reads < 3 * len(keys)
+
+
+@pytest.mark.parametrize("max_load_factor", [0, 1.0, 2.0, -0.5])
+def test_invalid_max_load_factor(max_load_factor):
+    with pytest.raises(ValueError):
+        OpenAddressingHashTable(4, max_load_factor=max_load_factor)
@@ -0,0 +1,128 @@
+import random
+from array import array as PackedArray
+
+import pytest
+
+from python_course.data_structures.ordered_hash_table import OrderedHashTable
+
+
+@pytest.fixture
+def ordered_hash_table():
+    return OrderedHashTable(8)
+
+
+def test_insertion_order(ordered_hash_table):
+    for key in ["sky", "apple", 3, "moon", (1, 2)]:
+        ordered_hash_table.set(key, str(key))
+
+    ordered_hash_table.set("apple", "APPLE")
+    ordered_hash_table.delete(3)
+    ordered_hash_table.set(3, "three")
+
+    assert ordered_hash_table.get_keys() == ["sky", "apple", "moon", (1, 2), 3]
+    assert ordered_hash_table.get_values() == [
+        "sky",
+        "APPLE",
+        "moon",
+        "(1, 2)",
+        "three",
+    ]
+    assert list(ordered_hash_table.items())[1] == ("apple", "APPLE")
+
+
+def test_order_is_independent_of_size():
+    keys = [f"key-{index}" for index in range(200)]
+    random.Random(7).shuffle(keys)
+
+    small, large = OrderedHashTable(2), OrderedHashTable(1024)
+    for key in keys:
+        small[key] = key
+        large[key] = key
+
+    assert list(small) == list(large) == keys
+    assert small.size > 2
+
+
+def test_collisions_and_compaction():
+    ordered_hash_table = OrderedHashTable(8, hash_function=lambda key: 7)
+    for round_ in range(20):
+        for key in range(4):
+            ordered_hash_table.set(key, round_)
+        for key in range(3):
+            ordered_hash_table.delete(key)
+
+    assert ordered_hash_table.get_keys() == [3]
+    assert ordered_hash_table.get(3) == 19
+    assert ordered_hash_table.get(0) is None
+    # deleted entries were reclaimed instead of growing the table
+    assert ordered_hash_table.size == 8
+    assert len(ordered_hash_table.dense_keys) <= 8
+
+
+def test_grow_and_shrink():
+    ordered_hash_table = OrderedHashTable(4)
+    for key in range(1000):
+        ordered_hash_table.set(key, key * key)
+
+    assert ordered_hash_table.size == 2048
+    assert ordered_hash_table.indices.typecode == "h"
+    assert all(ordered_hash_table.get(key) == key * key for key in range(1000))
+
+    for key in range(0, 1000, 2):
+        ordered_hash_table.delete(key)
+    for key in range(1, 990, 2):
+        ordered_hash_table.delete(key)
+
+    assert ordered_hash_table.get_keys() == [991, 993, 995, 997, 999]
+    assert ordered_hash_table.size < 2048
+    assert ordered_hash_table.indices.typecode == "b"
+
+    ordered_hash_table.resize(1)
+    assert ordered_hash_table.get_values() == [key * key for key in range(991, 1000, 2)]
+
+
+def test_mapping_protocol(ordered_hash_table):
+    ordered_hash_table["a"] = None
+
+    assert "a" in ordered_hash_table and "b" not in ordered_hash_table
+    assert ordered_hash_table["a"] is None
+    assert len(ordered_hash_table) == 1
+
+    with pytest.raises(KeyError):
+        ordered_hash_table["b"]
+    with pytest.raises(KeyError):
+        del ordered_hash_table["b"]
+
+    del ordered_hash_table["a"]
+    assert len(ordered_hash_table) == 0
+    assert list(ordered_hash_table.values()) == []
+
+
+class CountingArray(PackedArray):
+    # counts index slot reads made by the probe loop
+    reads = 0
+
+    def __getitem__(self, index):
+        self.reads = self.reads + 1
+        return super().__getitem__(index)
+
+
+@pytest.mark.parametrize("stride", [1, 1024, 2**20, 2**40])
+def test_strided_int_keys_spread_out(stride):
+    # hash(int) is the int itself - these keys all share their low bits
+    ordered_hash_table = OrderedHashTable()
+    keys = [key * stride for key in range(5000)]
+    for key in keys:
+        ordered_hash_table.set(key, key)
+
+    indices = ordered_hash_table.indices
+    ordered_hash_table.indices = CountingArray(indices.typecode, indices)
+    assert [ordered_hash_table.get(key) for key in keys] == keys
+    assert ordered_hash_table.indices.reads < 3 * len(keys)
+    assert ordered_hash_table.get_keys() == keys
+
+
+@pytest.mark.parametrize("max_load_factor", [0, 1.0, 2.0, -0.5])
+def test_invalid_max_load_factor(max_load_factor):
+    with pytest.raises(ValueError):
+        OrderedHashTable(128, max_load_factor=max_load_factor)
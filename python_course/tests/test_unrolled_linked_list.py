@@ -0,0 +1,210 @@
+import random
+
+import pytest
+
+from python_course.data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+def block_sizes(ll):
+    sizes = []
+    current_node = ll.head
+    while current_node is not None:
+        sizes.append(len(current_node.values))
+        current_node = current_node.next
+    return sizes
+
+
+def assert_dense_blocks(ll):
+    # deletes keep every block but the head and tail at least half full
+    sizes = block_sizes(ll)
+    assert all(size >= ll.node_capacity // 2 for size in sizes[1:-1])
+    assert all(0 < size <= ll.node_capacity for size in sizes)
+    assert sum(sizes) == len(ll)
+
+
+@pytest.fixture
+def empty_unrolled_linked_list():
+    """Fixture with tiny blocks so every test crosses block boundaries."""
+    ll = UnrolledLinkedList(node_capacity=2)
+    assert ll.head is None
+    assert ll.tail is None
+    return ll
+
+
+@pytest.fixture
+def populated_unrolled_linked_list(empty_unrolled_linked_list, request):
+    for value in request.param:
+        empty_unrolled_linked_list.append(value)
+    return empty_unrolled_linked_list
+
+
+def test_append_and_prepend(empty_unrolled_linked_list):
+    for value in [3, 4, 5]:
+        empty_unrolled_linked_list.append(value)
+    for value in [2, 1]:
+        empty_unrolled_linked_list.prepend(value)
+
+    assert str(empty_unrolled_linked_list) == "1,2,3,4,5"
+    assert empty_unrolled_linked_list.head.values == [1, 2]
+    assert empty_unrolled_linked_list.tail.values == [5]
+    assert len(empty_unrolled_linked_list) == 5
+
+
+@pytest.mark.parametrize(
+    "values, expected_structure",
+    [
+        ([(4, 3), (3, 2), (2, 1), (1, -7), (10, 9)], "1,4,2,3,10"),
+        ([(1, 0), (2, 1), (3, 2), (4, 1), (5, 2), (6, 1)], "1,6,4,5,2,3"),
+    ],
+)
+def test_insert(empty_unrolled_linked_list, values, expected_structure):
+    for value, position in values:
+        empty_unrolled_linked_list.insert(value, position)
+    assert str(empty_unrolled_linked_list) == expected_structure
+
+
+@pytest.mark.parametrize(
+    "populated_unrolled_linked_list, values_to_delete, expected_structure",
+    [
+        (
+            [1, 1, 2, 3, 3, 3, 4, 5],
+            [3, 3, 1, 5, 4, 2],
+            ["1,1,2,4,5", "1,1,2,4,5", "2,4,5", "2,4", "2", ""],
+        ),
+    ],
+    indirect=["populated_unrolled_linked_list"],
+)
+def test_delete(populated_unrolled_linked_list, values_to_delete, expected_structure):
+    for value, expected in zip(values_to_delete, expected_structure):
+        populated_unrolled_linked_list.delete(value)
+        assert str(populated_unrolled_linked_list) == expected
+
+    assert populated_unrolled_linked_list.is_empty()
+
+
+@pytest.mark.parametrize(
+    "populated_unrolled_linked_list",
+    [[1, 2, 1, 3, 1]],
+    indirect=True,
+)
+def test_delete_first_occurrence(populated_unrolled_linked_list):
+    node = populated_unrolled_linked_list.delete_by_value(1, all_occurrences=False)
+
+    assert node.value == 1
+    assert populated_unrolled_linked_list.to_array() == [2, 1, 3, 1]
+    assert populated_unrolled_linked_list.delete_by_value(7) is None
+
+
+@pytest.mark.parametrize(
+    "populated_unrolled_linked_list",
+    [[1, 2, 3, 4, 5]],
+    indirect=True,
+)
+def test_delete_head_and_tail(populated_unrolled_linked_list):
+    ll = populated_unrolled_linked_list
+
+    assert ll.delete_tail().value == 5
+    assert ll.delete_tail().value == 4
+    assert ll.delete_head().value == 1
+    assert (str(ll), len(ll)) == ("2,3", 2)
+    assert ll.tail.next is None
+
+    assert [ll.delete_tail().value, ll.delete_head().value] == [3, 2]
+    assert ll.delete_tail() is None and ll.delete_head() is None
+    assert ll.head is None and ll.tail is None
+
+
+@pytest.mark.parametrize(
+    "populated_unrolled_linked_list",
+    [[{"value": 1, "key": "key1"}, {"value": 2, "key": "key2"}]],
+    indirect=True,
+)
+def test_find(populated_unrolled_linked_list):
+    node = populated_unrolled_linked_list.find(lambda value: value["key"] == "key2")
+    assert node.value["value"] == 2
+    assert populated_unrolled_linked_list.find(lambda value: False) is None
+
+
+def test_find_by_compare_function():
+    ll = UnrolledLinkedList(
+        comparator=lambda a, b: 0 if a["key"] == b["key"] else 1, node_capacity=2
+    )
+    for key in ["a", "b", "c"]:
+        ll.append({"key": key})
+
+    assert ll.find({"key": "c"}).value == {"key": "c"}
+
+
+@pytest.mark.parametrize(
+    "populated_unrolled_linked_list",
+    [[1, 2, 3, 4, 5]],
+    indirect=True,
+)
+def test_reverse(populated_unrolled_linked_list):
+    populated_unrolled_linked_list.reverse()
+
+    assert populated_unrolled_linked_list.to_array() == [5, 4, 3, 2, 1]
+    assert populated_unrolled_linked_list.tail.next is None
+    populated_unrolled_linked_list.append(0)
+    assert str(populated_unrolled_linked_list) == "5,4,3,2,1,0"
+
+
+def test_matches_list_under_random_operations():
+    rng = random.Random(3)
+    ll = UnrolledLinkedList(node_capacity=4)
+    expected = []
+
+    for _ in range(2000):
+        operation = rng.randrange(6)
+        value = rng.randrange(20)
+
+        if operation == 0:
+            ll.append(value)
+            expected.append(value)
+        elif operation == 1:
+            ll.prepend(value)
+            expected.insert(0, value)
+        elif operation == 2:
+            position = rng.randrange(-2, len(expected) + 2)
+            ll.insert(value, position)
+            expected.insert(max(position, 0), value)
+        elif operation == 3 and expected:
+            assert ll.delete_tail().value == expected.pop()
+        elif operation == 4 and expected:
+            assert ll.delete_head().value == expected.pop(0)
+        elif operation == 5:
+            all_occurrences = rng.random() < 0.5
+            ll.delete_by_value(value, all_occurrences=all_occurrences)
+            if all_occurrences:
+                expected = [current for current in expected if current != value]
+            elif value in expected:
+                expected.remove(value)
+
+        assert_dense_blocks(ll)
+
+    assert ll.to_array() == list(ll) == expected
+    assert len(ll) == len(expected)
+
+
+def test_deletes_merge_underfull_blocks():
+    ll = UnrolledLinkedList(node_capacity=64)
+    for value in range(6400):
+        ll.append(value % 64)
+
+    for value in range(1, 64):
+        ll.delete_by_value(value)
+
+    assert ll.to_array() == [0] * 100
+    assert block_sizes(ll) == [32, 32, 32, 4]
+    assert ll.tail.next is None and ll.tail.values == [0] * 4
+
+    for _ in range(40):
+        ll.delete_head()
+    ll.delete_by_value(0, all_occurrences=False)
+    assert_dense_blocks(ll)
+    assert len(block_sizes(ll)) == 2
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(node_capacity=1)
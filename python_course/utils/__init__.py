@@ -1 +0,0 @@
-print(f"Invoking __init__.py for {__name__}")
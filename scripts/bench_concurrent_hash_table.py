@@ -0,0 +1,84 @@
+"""Contention benchmark: striped ConcurrentHashTable vs one global lock.
+
+Every worker thread runs the same mixed workload (reads, writes, deletes)
+over a shared key space. Usage::
+
+    python scripts/bench_concurrent_hash_table.py [--threads 1 2 4 8] [--ops 50000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from threading import Barrier, Thread
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from python_course.data_structures.concurrent_hash_table import (  # noqa: E402
+    ConcurrentHashTable,
+    LockedHashTable,
+)
+
+
+def run(make_table: Callable, threads: int, ops: int, read_ratio: float, keys: int) -> float:
+    table = make_table()
+    for key in range(keys):
+        table.set(key, key)
+
+    barrier = Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        workload: List = [
+            (rng.random(), rng.randrange(keys)) for _ in range(ops)
+        ]
+        barrier.wait()
+        for roll, key in workload:
+            if roll < read_ratio:
+                table.get(key)
+            elif roll < (1 + read_ratio) / 2:
+                table.set(key, roll)
+            else:
+                table.delete(key)
+
+    workers = [Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads * ops / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=50_000, help="operations per thread")
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--stripes", type=int, default=16)
+    args = parser.parse_args()
+
+    tables = {
+        "single lock": lambda: LockedHashTable(),
+        f"striped ({args.stripes})": lambda: ConcurrentHashTable(stripes=args.stripes),
+    }
+
+    print(f"{'threads':>7} " + " ".join(f"{name + ' [ops/s]':>24}" for name in tables))
+    for threads in args.threads:
+        results = [
+            run(make_table, threads, args.ops, args.read_ratio, args.keys)
+            for make_table in tables.values()
+        ]
+        print(f"{threads:>7} " + " ".join(f"{result:>24,.0f}" for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure per-module import cost with ``python -X importtime``.
+
+Every module is imported in a fresh interpreter so the numbers are cold
+import costs, the same thing a forked worker pays. Usage::
+
+    python scripts/bench_import_time.py [--repeat 5] [module ...]
+"""
+
+import argparse
+import os
+import pkgutil
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import python_course  # noqa: E402
+
+
+def discover_modules() -> List[str]:
+    return sorted(
+        module.name
+        for module in pkgutil.walk_packages(
+            python_course.__path__, "python_course.", onerror=lambda name: None
+        )
+        if ".tests" not in module.name
+    )
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    # import time: self [us] | cumulative | imported package
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def measure(module: str) -> Optional[Dict[str, object]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if completed.returncode != 0:
+        return None
+
+    cumulative = parse_importtime(completed.stderr)
+    return {
+        "cumulative_us": cumulative.get(module, 0),
+        "stdout_bytes": len(completed.stdout),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="defaults to every module")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    modules = args.modules or discover_modules()
+    noisy = []
+
+    print(f"{'module':<60} {'best [us]':>10} {'stdout':>7}")
+    for module in modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        if any(run is None for run in runs):
+            print(f"{module:<60} {'error':>10}")
+            continue
+
+        best = min(run["cumulative_us"] for run in runs)
+        stdout_bytes = max(run["stdout_bytes"] for run in runs)
+        if stdout_bytes:
+            noisy.append(module)
+        print(f"{module:<60} {best:>10} {stdout_bytes:>7}")
+
+    if noisy:
+        print(f"\nmodules writing to stdout on import: {', '.join(noisy)}")
+    return 1 if noisy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Per-element memory of LinkedList nodes, measured with ``tracemalloc``.
+
+Values are allocated before measuring, so only the list structure itself
+is counted. ``dict node`` rebuilds the same chain from a class without
+``__slots__`` (the previous Node layout) as the baseline. Iteration time
+is a full ``to_array`` pass. Usage::
+
+    python scripts/bench_linked_list_memory.py [--elements 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from python_course.data_structures.linked_list import LinkedList  # noqa: E402
+from python_course.data_structures.unrolled_linked_list import (  # noqa: E402
+    UnrolledLinkedList,
+)
+
+
+class DictNode:
+    def __init__(self, value: Any, next: Any = None):
+        self.value = value
+        self.next = next
+
+
+def build_dict_nodes(values: List[int]) -> DictNode:
+    head = None
+    for value in reversed(values):
+        head = DictNode(value, head)
+    return head
+
+
+def build_linked_list(values: List[int]) -> LinkedList:
+    linked_list = LinkedList()
+    for value in values:
+        linked_list.append(value)
+    return linked_list
+
+
+def build_unrolled_linked_list(values: List[int]) -> UnrolledLinkedList:
+    linked_list = UnrolledLinkedList()
+    for value in values:
+        linked_list.append(value)
+    return linked_list
+
+
+def measure(build: Callable[[List[int]], Any], values: List[int]) -> float:
+    tracemalloc.start()
+    structure = build(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size / len(values)
+
+
+def iteration_seconds(build: Callable[[List[int]], Any], values: List[int]) -> float:
+    structure = build(values)
+    if not hasattr(structure, "to_array"):
+        return float("nan")
+
+    start = time.perf_counter()
+    structure.to_array()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = list(range(args.elements))
+
+    print(f"{'layout':<24}{'bytes/element':>14}{'to_array s':>12}")
+    for name, build in [
+        ("dict node (baseline)", build_dict_nodes),
+        ("LinkedList", build_linked_list),
+        ("UnrolledLinkedList", build_unrolled_linked_list),
+        ("list (reference)", list),
+    ]:
+        bytes_per_element = measure(build, values)
+        seconds = iteration_seconds(build, values)
+        print(f"{name:<24}{bytes_per_element:>14.1f}{seconds:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
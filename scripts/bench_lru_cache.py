@@ -0,0 +1,81 @@
+"""LRUCache vs functools.lru_cache on a skewed (Zipf-like) key stream.
+
+Measures raw get/put throughput and the memoize decorator against
+``functools.lru_cache`` with the same capacity. Usage::
+
+    python scripts/bench_lru_cache.py [--ops 200000] [--keys 5000] [--capacity 512]
+"""
+
+import argparse
+import functools
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from python_course.data_structures.lru_cache import LRUCache, memoize  # noqa: E402
+
+
+def workload(ops: int, keys: int, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(keys)]
+    return rng.choices(range(keys), weights=weights, k=ops)
+
+
+def timed(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def compute(key: int) -> int:
+    return key * key
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=5_000)
+    parser.add_argument("--capacity", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stream = workload(args.ops, args.keys, args.seed)
+
+    cache: LRUCache[int, int] = LRUCache(max_entries=args.capacity)
+
+    def run_cache() -> None:
+        for key in stream:
+            if cache.get(key) is None:
+                cache.put(key, compute(key))
+
+    memoized = memoize(max_entries=args.capacity)(compute)
+    reference = functools.lru_cache(maxsize=args.capacity)(compute)
+
+    def run_memoize() -> None:
+        for key in stream:
+            memoized(key)
+
+    def run_reference() -> None:
+        for key in stream:
+            reference(key)
+
+    print(f"{'variant':<24}{'seconds':>10}{'hit rate':>10}")
+    seconds = timed(run_cache)
+    print(f"{'LRUCache get/put':<24}{seconds:>10.3f}{cache.hit_rate:>10.3f}")
+
+    seconds = timed(run_memoize)
+    print(f"{'memoize':<24}{seconds:>10.3f}{memoized.cache.hit_rate:>10.3f}")
+
+    seconds = timed(run_reference)
+    info = reference.cache_info()
+    hit_rate = info.hits / (info.hits + info.misses)
+    print(f"{'functools.lru_cache':<24}{seconds:>10.3f}{hit_rate:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()